@@ -1,16 +1,18 @@
+import asyncio
 from agents import Agent, Runner, function_tool, AgentOutputSchema
 from pydantic import BaseModel
 from typing import Set, List, Dict, Tuple
-from ..stock.stock_data import StockAnalyzer, quick_symbol_lookup, get_news
+from ..stock.stock_data import StockAnalyzer, quick_symbol_lookup
+from ..stock.timeframes import DAILY_TIMEFRAMES
 
 @function_tool
-def stock_analysis_tool(company_name: str, symbol: str = None) -> Dict[str, str]:
+async def stock_analysis_tool(company_name: str, symbol: str = None) -> Dict[str, str]:
     """
     Function to analyze stock data for a given company name.
     Returns a dictionary with stock symbol and company name.
     """
     # Get stock symbol from user input
-    symbol = quick_symbol_lookup(company_name)
+    symbol = await asyncio.to_thread(quick_symbol_lookup, company_name)
     print(symbol)
 
     #main()
@@ -26,14 +28,20 @@ def stock_analysis_tool(company_name: str, symbol: str = None) -> Dict[str, str]
         }
     else:
         analyzer = StockAnalyzer(symbol)    
-        # Generate comprehensive report
-        analysis_results = analyzer.generate_report()
-        # Get news articles
-        news = get_news(symbol, analysis_results['basic_info']['Company Name'])
+        # Generate comprehensive report; info, history, statements and news are
+        # fetched concurrently. historical_data is not passed on, so skip the
+        # full indicator columns. Daily/weekly context is built from the daily
+        # history already fetched, so no intraday download is made
+        analysis_results = await analyzer.generate_report_async(latest_only=True,
+                                                                timeframes=DAILY_TIMEFRAMES)
+        news = analysis_results['news']
+        technical_data = dict(analysis_results['technical_data'])
+        if analysis_results['timeframes']:
+            technical_data['Timeframes'] = analysis_results['timeframes']
 
         return {
           "basic_info": analysis_results['basic_info'],
-          "technical_data": analysis_results['technical_data'],
+          "technical_data": technical_data,
           "fundamental_data": analysis_results['fundamental_data'],
           "signals": analysis_results['signals'],
           "news": news['title'] + news ['summary']
@@ -9,6 +9,7 @@ Analyze the technical data provided and generate insights based on the following
 - **Support and Resistance Levels**: Determine key price levels where the stock tends to reverse.
 - **Volume Analysis**: Assess trading volume trends to confirm price movements.
 - **Technical Indicators**: Evaluate indicators like moving averages, RSI, MACD, etc.
+- **Multi-Timeframe Context**: When "Timeframes" holds daily (1d) and weekly (1w) indicators, check whether the trends agree across timeframes.
 - **Chart Patterns**: Recognize patterns such as head and shoulders, flags, triangles, etc.
 ## Output Format
 Provide a structured output with the following fields:
@@ -0,0 +1,4 @@
+from ..stock.screener import main
+
+if __name__ == "__main__":
+    main()
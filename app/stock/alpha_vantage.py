@@ -0,0 +1,168 @@
+import requests
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional
+
+from .rate_limit import TokenBucket
+
+BASE_URL = 'https://www.alphavantage.co/query'
+
+# Seconds a cached response stays fresh, per API function
+CACHE_TTL = {
+    'OVERVIEW': 24 * 3600,
+    'SYMBOL_SEARCH': 7 * 24 * 3600,
+    'NEWS_SENTIMENT': 15 * 60,
+}
+DEFAULT_TTL = 3600
+
+# Parameters that name the subject of a request; used for readable cache paths
+_SUBJECT_PARAMS = ('symbol', 'tickers', 'keywords')
+
+
+class QuotaExceeded(RuntimeError):
+    """Raised when the key's daily request quota is used up"""
+
+
+class AlphaVantageClient:
+    def __init__(self, api_key: str, requests_per_minute: float = 5, requests_per_day: int = None,
+                 cache_dir=None, session: requests.Session = None):
+        """
+        Alpha Vantage client with rate limiting, a disk cache and request coalescing
+
+        Every successful response is written to ``cache_dir/<FUNCTION>/`` and
+        served from there until its CACHE_TTL expires. Concurrent identical
+        requests share one upstream call. Error and rate-limit notices are never
+        cached.
+
+        Args:
+            api_key (str): Alpha Vantage API key
+            requests_per_minute (float): Per-minute quota of the key
+            requests_per_day (int): Daily quota, None when unlimited
+            cache_dir (str or Path): Response cache, defaults to $STOCK_AGENT_DATA_DIR/alpha_vantage
+            session (requests.Session): Session to send requests through
+        """
+        if cache_dir is None:
+            base = os.getenv('STOCK_AGENT_DATA_DIR', Path.home() / '.cache' / 'stock_agent')
+            cache_dir = Path(base) / 'alpha_vantage'
+        self.api_key = api_key
+        self.cache_dir = Path(cache_dir)
+        self.minute_bucket = TokenBucket(requests_per_minute / 60, requests_per_minute)
+        self.day_bucket = TokenBucket(requests_per_day / 86400, requests_per_day) if requests_per_day else None
+        if session is None:
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=8))
+        self.session = session
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def _cache_path(self, function: str, params: Dict) -> Path:
+        subject = next((str(params[p]) for p in _SUBJECT_PARAMS if p in params), '')
+        digest = hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()[:12]
+        name = re.sub(r'[^\w.^=-]', '_', subject.upper())[:64]
+        return self.cache_dir / function / f'{name}-{digest}.json'
+
+    def _read_cache(self, path: Path, ttl: float, allow_stale: bool = False) -> Optional[Dict]:
+        try:
+            entry = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        if allow_stale or time.time() - entry['fetched_at'] < ttl:
+            return entry['data']
+        return None
+
+    def _write_cache(self, path: Path, data: Dict):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix('.tmp')
+            tmp.write_text(json.dumps({'fetched_at': time.time(), 'data': data}))
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"Could not cache Alpha Vantage response: {e}")
+
+    @staticmethod
+    def _is_error(data: Dict) -> bool:
+        # Quota notices come back with HTTP 200 under 'Note' or 'Information'
+        return not data or any(key in data for key in ('Error Message', 'Note', 'Information'))
+
+    def query(self, function: str, **params) -> Dict:
+        """
+        Call an API function, serving it from the cache when fresh
+
+        Args:
+            function (str): API function, e.g. 'OVERVIEW' or 'SYMBOL_SEARCH'
+            **params: Further query parameters, without the API key
+
+        Returns:
+            Dict: Decoded JSON response
+        """
+        path = self._cache_path(function, params)
+        cached = self._read_cache(path, CACHE_TTL.get(function, DEFAULT_TTL))
+        if cached is not None:
+            return cached
+
+        key = str(path)
+        with self._lock:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            # Another caller may have finished the same request since the cache check
+            data = self._read_cache(path, CACHE_TTL.get(function, DEFAULT_TTL))
+            if data is None:
+                data = self._fetch(function, params, path)
+            future.set_result(data)
+            return data
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def _fetch(self, function: str, params: Dict, path: Path) -> Dict:
+        if self.day_bucket is not None and not self.day_bucket.try_acquire():
+            stale = self._read_cache(path, 0, allow_stale=True)
+            if stale is not None:
+                return stale
+            raise QuotaExceeded(f"Alpha Vantage daily quota exhausted, {function} not sent")
+        self.minute_bucket.acquire()
+
+        response = self.session.get(BASE_URL, params={'function': function, **params, 'apikey': self.api_key},
+                                    timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        if not self._is_error(data):
+            self._write_cache(path, data)
+        return data
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_alpha_vantage_client(api_key: str) -> AlphaVantageClient:
+    """
+    Return the process-wide client for an API key, created on first use
+
+    The quota defaults to the free tier (5 per minute, 25 per day) and can be
+    raised for premium keys with ALPHA_VANTAGE_REQUESTS_PER_MINUTE and
+    ALPHA_VANTAGE_REQUESTS_PER_DAY (0 for unlimited).
+    """
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            per_minute = float(os.getenv('ALPHA_VANTAGE_REQUESTS_PER_MINUTE', 5))
+            per_day = int(os.getenv('ALPHA_VANTAGE_REQUESTS_PER_DAY', 25)) or None
+            client = _clients[api_key] = AlphaVantageClient(api_key, per_minute, per_day)
+        return client
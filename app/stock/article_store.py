@@ -0,0 +1,304 @@
+import pandas as pd
+import numpy as np
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import warnings
+from datetime import datetime
+from dateutil import parser as date_parser
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from .name_matching import normalize_name
+from .near_duplicates import DEFAULT_THRESHOLD, MinHasher, article_text, same_story
+
+# Stories are only matched against originals published this recently; older
+# coverage of a recurring event (earnings, guidance) is a new story
+SIMILAR_WINDOW_HOURS = 72
+
+
+def article_key(article: Dict) -> str:
+    """
+    Stable id of an article: its URL without fragment or trailing slash, else its title
+
+    Args:
+        article (Dict): Article as returned by the news sources
+
+    Returns:
+        str: Hex digest identifying the article
+    """
+    url = (article.get('url') or '').strip()
+    if url:
+        parts = urlsplit(url)
+        text = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), parts.query, ''))
+    else:
+        text = 'title:' + normalize_name(article.get('title') or '')
+    return hashlib.sha1(text.encode()).hexdigest()[:20]
+
+
+# Parsing a date with both defaults shows which parts the text left out
+_PROBE_DEFAULTS = (datetime(2000, 1, 1), datetime(2004, 2, 2))
+
+
+def _published_epoch(published, now: float = None) -> Optional[float]:
+    """
+    Epoch seconds of a source's 'published' text, None when it cannot be read
+
+    A bare time of day (Finviz rows after the first of a day) has no date and
+    is unreadable. A month and day without a year (Seeking Alpha's 'Oct 16')
+    is taken as the latest such date not after ``now``.
+    """
+    if not published:
+        return None
+    text = str(published).strip()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        parsed = pd.to_datetime(text, errors='coerce')
+        try:
+            first, second = (date_parser.parse(text, default=default) for default in _PROBE_DEFAULTS)
+        except (ValueError, OverflowError):
+            first = second = None
+    if first is not None and (first.month, first.day) != (second.month, second.day):
+        return None
+    if first is not None and first.year != second.year:
+        now = time.time() if now is None else now
+        year = datetime.fromtimestamp(now).year
+        try:
+            dated = first.replace(year=year)
+            if dated.timestamp() > now:
+                dated = first.replace(year=year - 1)
+        except ValueError:
+            # 'Feb 29' outside a leap year
+            return None
+        return dated.timestamp()
+    if pd.isna(parsed):
+        return None
+    # Naive times come from datetime.fromtimestamp or feed text, read them as local time
+    return parsed.to_pydatetime().timestamp()
+
+
+class ArticleStore:
+    def __init__(self, path=None, hasher: MinHasher = None):
+        """
+        SQLite store of every article seen per symbol
+
+        Each article is stored once per symbol under article_key, with the time
+        it was first seen and its publication time (the first-seen time when
+        the source's date cannot be read or lies in the future). A high-water
+        mark per symbol and news source records the newest real publication
+        date that source returned, so sources that accept a start time can ask
+        only for newer articles. Undated articles never move it.
+
+        Articles may carry a MinHash signature. Those that are not copies are
+        indexed by LSH band key in SQLite, so similar finds an earlier version
+        of a story, published within SIMILAR_WINDOW_HOURS, with indexed
+        lookups however many articles are stored.
+        Copies are stored with ``duplicate_of`` set and left out of recent.
+
+        Args:
+            path (str or Path): SQLite file, defaults to $STOCK_AGENT_DATA_DIR/articles.sqlite;
+                ':memory:' keeps the store in process
+            hasher (MinHasher): Signature scheme the stored signatures use
+        """
+        if path is None:
+            base = os.getenv('STOCK_AGENT_DATA_DIR', Path.home() / '.cache' / 'stock_agent')
+            path = Path(base) / 'articles.sqlite'
+        if str(path) != ':memory:':
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.hasher = hasher or MinHasher()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=10)
+        with self._lock, self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS articles ('
+                'symbol TEXT NOT NULL, id TEXT NOT NULL, first_seen REAL NOT NULL, '
+                'published_at REAL NOT NULL, data TEXT NOT NULL, signature BLOB, duplicate_of TEXT, '
+                'PRIMARY KEY (symbol, id))'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS articles_by_time ON articles (symbol, published_at)')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS lsh_buckets ('
+                'symbol TEXT NOT NULL, band_key INTEGER NOT NULL, id TEXT NOT NULL, '
+                'PRIMARY KEY (symbol, band_key, id)) WITHOUT ROWID'
+            )
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS source_high_water ('
+                'symbol TEXT NOT NULL, source TEXT NOT NULL, published_at REAL NOT NULL, '
+                'fetched_at REAL NOT NULL, PRIMARY KEY (symbol, source))'
+            )
+
+    @staticmethod
+    def _symbol(symbol: str) -> str:
+        return symbol.strip().upper()
+
+    def get_many(self, symbol: str, keys: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Stored articles among the given ids
+
+        Args:
+            symbol (str): Stock symbol
+            keys (Iterable[str]): Article ids from article_key
+
+        Returns:
+            Dict[str, Dict]: Stored article by id, for the ids already seen
+        """
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f'SELECT id, data FROM articles WHERE symbol = ? AND id IN ({",".join("?" * len(chunk))})',
+                    [self._symbol(symbol), *chunk]).fetchall()
+                found.update((key, json.loads(data)) for key, data in rows)
+        return found
+
+    def add(self, symbol: str, articles: List[Dict], now: float = None,
+            signatures: List[Optional[np.ndarray]] = None) -> int:
+        """
+        Store articles not seen before for a symbol
+
+        Args:
+            symbol (str): Stock symbol
+            articles (List[Dict]): Processed articles; copies carry 'duplicate_of'
+            now (float): First-seen epoch time, defaults to now
+            signatures (List[Optional[np.ndarray]]): MinHash signature per article (optional)
+
+        Returns:
+            int: Number of articles newly stored
+        """
+        now = time.time() if now is None else now
+        signatures = signatures or [None] * len(articles)
+        rows, buckets = [], []
+        for article, signature in zip(articles, signatures):
+            key = article_key(article)
+            published = _published_epoch(article.get('published'), now)
+            published = now if published is None else min(published, now)
+            duplicate_of = article.get('duplicate_of')
+            rows.append((self._symbol(symbol), key, now, published, json.dumps(article, default=str),
+                         None if signature is None else signature.astype(np.uint32).tobytes(), duplicate_of))
+            if signature is not None and not duplicate_of:
+                buckets.extend((self._symbol(symbol), band_key, key) for band_key in self.hasher.band_keys(signature))
+
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO articles (symbol, id, first_seen, published_at, data, signature, duplicate_of) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+            added = self._conn.total_changes - before
+            self._conn.executemany('INSERT OR IGNORE INTO lsh_buckets (symbol, band_key, id) VALUES (?, ?, ?)',
+                                   buckets)
+        return added
+
+    def advance_high_water(self, symbol: str, source: str, articles: List[Dict], now: float = None):
+        """
+        Move a source's high-water mark to the newest dated article it returned
+
+        Args:
+            symbol (str): Stock symbol
+            source (str): News source the articles came from, e.g. 'newsapi'
+            articles (List[Dict]): Articles from one fetch of that source
+            now (float): Fetch epoch time, defaults to now; later dates are capped to it
+        """
+        now = time.time() if now is None else now
+        dated = [published for published in (_published_epoch(a.get('published'), now) for a in articles)
+                 if published is not None]
+        newest = min(max(dated), now) if dated else 0.0
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT INTO source_high_water (symbol, source, published_at, fetched_at) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT(symbol, source) DO UPDATE SET published_at = MAX(published_at, excluded.published_at), '
+                'fetched_at = excluded.fetched_at',
+                (self._symbol(symbol), source, newest, now))
+
+    def similar(self, symbol: str, signature: np.ndarray, threshold: float = DEFAULT_THRESHOLD,
+                text: str = None, window_hours: float = SIMILAR_WINDOW_HOURS, now: float = None) -> Optional[str]:
+        """
+        Stored article most similar to a signature among those published recently, via the LSH buckets
+
+        Args:
+            symbol (str): Stock symbol
+            signature (np.ndarray): MinHash signature from this store's hasher
+            threshold (float): Estimated Jaccard similarity a match must reach
+            text (str): Normalized text the signature was made from; short texts
+                must also pass same_story with the match
+            window_hours (float): Only originals published this many hours before ``now`` match
+            now (float): Reference epoch time, defaults to now
+
+        Returns:
+            Optional[str]: Id of the best stored original, None when none is similar enough
+        """
+        now = time.time() if now is None else now
+        band_keys = self.hasher.band_keys(signature)
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT a.id, a.signature, a.data FROM articles a WHERE a.symbol = ? AND a.published_at >= ? '
+                'AND a.id IN (SELECT id FROM lsh_buckets WHERE symbol = ? '
+                f'AND band_key IN ({",".join("?" * len(band_keys))}))',
+                [self._symbol(symbol), now - window_hours * 3600, self._symbol(symbol), *band_keys]).fetchall()
+        best, best_score = None, threshold
+        for key, blob, data in rows:
+            score = self.hasher.similarity(signature, np.frombuffer(blob, dtype=np.uint32))
+            if score < best_score:
+                continue
+            if text is not None and not same_story(text, article_text(json.loads(data))):
+                continue
+            best, best_score = key, score
+        return best
+
+    def high_water(self, symbol: str, source: str) -> Optional[float]:
+        """Newest real publication date a source returned for a symbol, None before it returned one"""
+        with self._lock:
+            row = self._conn.execute('SELECT published_at FROM source_high_water WHERE symbol = ? AND source = ?',
+                                     (self._symbol(symbol), source)).fetchone()
+        return row[0] if row and row[0] else None
+
+    def recent(self, symbol: str, hours: float = 24, now: float = None, limit: int = None,
+               extraction_method: str = None) -> pd.DataFrame:
+        """
+        Stored articles for a symbol published in the last ``hours``, without any network call
+
+        Args:
+            symbol (str): Stock symbol
+            hours (float): Look-back window, None for no window
+            now (float): Reference epoch time, defaults to now
+            limit (int): Maximum articles, None for all
+            extraction_method (str): Only articles from this source, e.g. 'NewsAPI' (optional)
+
+        Returns:
+            pd.DataFrame: Articles newest first, one per story, with the columns get_comprehensive_news returns
+        """
+        now = time.time() if now is None else now
+        query = 'SELECT data FROM articles WHERE symbol = ? AND published_at >= ? AND duplicate_of IS NULL'
+        params = [self._symbol(symbol), float('-inf') if hours is None else now - hours * 3600]
+        if extraction_method is not None:
+            query += " AND json_extract(data, '$.extraction_method') = ?"
+            params.append(extraction_method)
+        query += ' ORDER BY published_at DESC'
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(int(limit))
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return pd.DataFrame([json.loads(data) for (data,) in rows])
+
+
+_article_store = None
+
+
+def get_article_store() -> ArticleStore:
+    """Return the process-wide article store, created on first use"""
+    global _article_store
+    if _article_store is None:
+        try:
+            _article_store = ArticleStore()
+        except (OSError, sqlite3.Error) as e:
+            print(f"Article store unavailable, keeping it in memory: {e}")
+            _article_store = ArticleStore(':memory:')
+    return _article_store
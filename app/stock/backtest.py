@@ -0,0 +1,166 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Tuple
+
+from .indicators import compute_indicators, _align_to_latest
+
+# Rules mirrored from StockAnalyzer.analyze_stock_signals, plus their net vote
+SIGNAL_RULES = ['rsi', 'sma_trend', 'macd', 'combined']
+
+
+def rule_signals(indicators: Dict[str, np.ndarray]) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Evaluate the analyze_stock_signals rules on every bar
+
+    Args:
+        indicators (Dict[str, np.ndarray]): Close, RSI, SMA_20, SMA_50, MACD and
+            MACD_Signal arrays of shape (T,) or (T, N)
+
+    Returns:
+        Dict[str, Tuple[np.ndarray, np.ndarray]]: (buy, sell) boolean arrays per rule
+    """
+    close = indicators['Close']
+    rsi = indicators['RSI']
+    sma_20, sma_50 = indicators['SMA_20'], indicators['SMA_50']
+    macd, macd_signal = indicators['MACD'], indicators['MACD_Signal']
+
+    # NaN comparisons are False, so warm-up bars emit no signal
+    with np.errstate(invalid='ignore'):
+        signals = {
+            'rsi': (rsi < 30, rsi > 70),
+            'sma_trend': ((close > sma_20) & (sma_20 > sma_50),
+                          (close < sma_20) & (sma_20 < sma_50)),
+            'macd': (macd > macd_signal, macd <= macd_signal),
+        }
+    votes = sum(buy.astype(np.int8) - sell.astype(np.int8) for buy, sell in signals.values())
+    signals['combined'] = (votes > 0, votes < 0)
+    return signals
+
+
+def positions_from_signals(buy: np.ndarray, sell: np.ndarray) -> np.ndarray:
+    """
+    Long/flat position held after each bar: enter on buy, exit on sell, else hold
+
+    Args:
+        buy (np.ndarray): (T,) or (T, N) buy signals
+        sell (np.ndarray): Sell signals of the same shape
+
+    Returns:
+        np.ndarray: 1.0 while long, 0.0 while flat
+    """
+    state = np.where(buy, 1.0, np.where(sell, 0.0, np.nan))
+    # Forward-fill the last decided state along time without a per-bar loop
+    rows = np.arange(state.shape[0]).reshape((-1,) + (1,) * (state.ndim - 1))
+    last = np.maximum.accumulate(np.where(np.isnan(state), -1, rows), axis=0)
+    filled = np.take_along_axis(state, np.maximum(last, 0), axis=0)
+    return np.where(last < 0, 0.0, filled)
+
+
+def backtest_positions(close: np.ndarray, position: np.ndarray, cost_bps: float = 10,
+                       periods_per_year: int = 252) -> Dict[str, np.ndarray]:
+    """
+    Simulate a long/flat position series with proportional trading costs
+
+    The position decided at a bar's close earns the next bar's return. Each
+    change of position pays ``cost_bps`` basis points of traded value.
+
+    Args:
+        close (np.ndarray): (T,) or (T, N) closing prices
+        position (np.ndarray): Position held after each bar, same shape
+        cost_bps (float): One-way cost in basis points
+        periods_per_year (int): Bars per year used to annualise
+
+    Returns:
+        Dict[str, np.ndarray]: Metrics per column (scalars for 1-D input)
+    """
+    close = np.asarray(close, dtype=np.float64)
+    position = np.where(np.isnan(close), 0.0, position)
+
+    returns = np.zeros(close.shape)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        returns[1:] = np.nan_to_num(close[1:] / close[:-1] - 1)
+    held = np.zeros(close.shape)
+    held[1:] = position[:-1]
+    turnover = np.abs(np.diff(position, axis=0, prepend=0.0))
+    net = held * returns - turnover * cost_bps / 10000
+
+    equity = np.cumprod(1 + net, axis=0)
+    drawdown = equity / np.maximum.accumulate(equity, axis=0) - 1
+    bars = np.maximum((~np.isnan(close)).sum(axis=0), 1)
+
+    # Trade-level returns: each bar is tagged with the trade it belongs to
+    entries = (position == 1) & (np.diff(position, axis=0, prepend=0.0) > 0)
+    trade_id = np.cumsum(entries, axis=0)
+    in_trade = (held == 1) | entries
+    trades = entries.sum(axis=0)
+    offsets = np.concatenate([[0], np.cumsum(np.ravel(trades))[:-1]]).reshape(trades.shape)
+    global_id = (offsets + trade_id - 1)[in_trade]
+    trade_log = np.bincount(global_id, weights=np.log1p(net[in_trade]), minlength=int(np.sum(trades)))
+    trade_column = np.repeat(np.arange(trades.size), np.ravel(trades))
+    wins = np.bincount(trade_column, weights=(trade_log > 0).astype(float),
+                       minlength=trades.size).reshape(trades.shape)
+
+    total_return = equity[-1] - 1
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return {
+            'total_return': total_return,
+            'annual_return': (1 + total_return) ** (periods_per_year / bars) - 1,
+            'max_drawdown': drawdown.min(axis=0),
+            'hit_rate': np.where(trades > 0, wins / np.maximum(trades, 1), np.nan),
+            'trades': trades,
+            'exposure': held.sum(axis=0) / bars,
+        }
+
+
+def backtest_panel(symbols: List[str], close, high, low, rules: List[str] = None,
+                   cost_bps: float = 10) -> pd.DataFrame:
+    """
+    Backtest the signal rules for many symbols at once
+
+    Args:
+        symbols (List[str]): Column labels of the panel
+        close, high, low (np.ndarray): (T, N) price panels
+        rules (List[str]): Rules from SIGNAL_RULES, defaults to all
+        cost_bps (float): One-way cost in basis points
+
+    Returns:
+        pd.DataFrame: Metrics indexed by (symbol, rule)
+    """
+    rules = SIGNAL_RULES if rules is None else rules
+    # Close interior gaps from a bulk download so every return spans consecutive bars
+    close = np.asarray(close, dtype=np.float64)
+    close, high, low = _align_to_latest(~np.isnan(close), close, high, low)
+    indicators = compute_indicators({'Close': close, 'High': high, 'Low': low},
+                                    ['RSI', 'SMA_20', 'SMA_50', 'MACD', 'MACD_Signal'])
+    indicators['Close'] = close
+    signals = rule_signals(indicators)
+
+    frames = []
+    for rule in rules:
+        buy, sell = signals[rule]
+        metrics = backtest_positions(close, positions_from_signals(buy, sell), cost_bps)
+        frame = pd.DataFrame({name: np.atleast_1d(values) for name, values in metrics.items()},
+                             index=symbols)
+        frame['rule'] = rule
+        frames.append(frame)
+
+    result = pd.concat(frames)
+    result.index.name = 'symbol'
+    return result.set_index('rule', append=True).sort_index()
+
+
+def backtest_history(hist: pd.DataFrame, rules: List[str] = None, cost_bps: float = 10) -> pd.DataFrame:
+    """
+    Backtest the signal rules on one symbol's history
+
+    Args:
+        hist (pd.DataFrame): Bars with Close, High and Low columns
+        rules (List[str]): Rules from SIGNAL_RULES, defaults to all
+        cost_bps (float): One-way cost in basis points
+
+    Returns:
+        pd.DataFrame: Metrics indexed by rule
+    """
+    columns = [hist[field].to_numpy(dtype=np.float64)[:, None] for field in ['Close', 'High', 'Low']]
+    result = backtest_panel(['_'], *columns, rules=rules, cost_bps=cost_bps)
+    return result.droplevel('symbol').reindex(SIGNAL_RULES if rules is None else rules)
@@ -0,0 +1,153 @@
+import pandas as pd
+import numpy as np
+import yfinance as yf
+from typing import Dict, List
+
+from .indicators import compute_indicators, panel_technical_data, _panel_fields
+
+# Price columns held as float32; Volume is optional and kept as float64
+PRICE_FIELDS = ['Open', 'High', 'Low', 'Close']
+
+
+class CompactHistory:
+    def __init__(self, index, open, high, low, close, volume=None, symbols: List[str] = None, tz: str = None):
+        """
+        Columnar float32 OHLC(V) history for one or many symbols
+
+        Every field is a (T, N) array in column-major order, so each symbol's
+        bars are contiguous and can be handed to pandas without a copy. Prices
+        are float32. Volume is float64: float32 rounds share counts above 2^24
+        (50,123,457 would read back as 50,123,456), and an integer type could
+        not hold the NaN of a symbol's missing bars. The index is int64 UTC
+        nanoseconds shared by all symbols. Dividends and Stock Splits are not
+        kept. A 5,000-symbol, 10-year panel of OHLC takes about 200 MB, plus
+        100 MB for volume.
+
+        Args:
+            index (np.ndarray): (T,) int64 UTC epoch nanoseconds
+            open, high, low, close (np.ndarray): (T,) or (T, N) prices
+            volume (np.ndarray): Same shape as the prices, None to leave it out
+            symbols (List[str]): Column labels, one per symbol
+            tz (str): Time zone to present dates in, None for naive dates
+        """
+        self.index = np.ascontiguousarray(index, dtype=np.int64)
+        self.open = self._column_major(open)
+        self.high = self._column_major(high)
+        self.low = self._column_major(low)
+        self.close = self._column_major(close)
+        self.volume = None if volume is None else self._column_major(volume, np.float64)
+        self.symbols = list(symbols) if symbols is not None else ['_'] * self.close.shape[1]
+        self.tz = tz
+        if len(self.symbols) != self.close.shape[1] or len(self.index) != self.close.shape[0]:
+            raise ValueError("Index and symbols must match the shape of the price arrays")
+
+    @staticmethod
+    def _column_major(values, dtype=np.float32) -> np.ndarray:
+        values = np.asarray(values)
+        if values.ndim == 1:
+            values = values[:, None]
+        # No copy when the input already has the dtype and is column-major
+        return np.asarray(values, dtype=dtype, order='F')
+
+    @classmethod
+    def from_frame(cls, hist: pd.DataFrame, symbol: str = '_', include_volume: bool = True) -> 'CompactHistory':
+        """
+        Build a single-symbol history from a ``Ticker.history`` DataFrame
+
+        Float32 price and float64 volume columns are taken without copying;
+        other dtypes are converted once.
+
+        Args:
+            hist (pd.DataFrame): Bars indexed by date with OHLC(V) columns
+            symbol (str): Label for the column
+            include_volume (bool): Keep the Volume column
+
+        Returns:
+            CompactHistory: History with a single symbol
+        """
+        dates = pd.DatetimeIndex(hist.index)
+        tz = str(dates.tz) if dates.tz is not None else None
+        utc = dates.tz_convert('UTC') if tz else dates
+        columns = {field: hist[field].to_numpy(dtype=np.float32) for field in PRICE_FIELDS}
+        volume = hist['Volume'].to_numpy(dtype=np.float64) if include_volume and 'Volume' in hist else None
+        return cls(utc.as_unit('ns').asi8, columns['Open'], columns['High'], columns['Low'],
+                   columns['Close'], volume, symbols=[symbol], tz=tz)
+
+    @classmethod
+    def download(cls, symbols: List[str], period: str = '1y', include_volume: bool = True) -> 'CompactHistory':
+        """
+        Bulk-download a panel straight into float32 price and float64 volume arrays
+
+        Args:
+            symbols (List[str]): Stock symbols
+            period (str): yfinance period string
+            include_volume (bool): Keep the Volume field
+
+        Returns:
+            CompactHistory: Panel aligned on the union of trading dates
+        """
+        symbols = [s.upper() for s in symbols]
+        data = yf.download(symbols, period=period, group_by='column', auto_adjust=True,
+                           progress=False, threads=True)
+        arrays = _panel_fields(data, symbols, PRICE_FIELDS, dtype=np.float32, order='F')
+        if include_volume:
+            arrays.update(_panel_fields(data, symbols, ['Volume'], dtype=np.float64, order='F'))
+        dates = pd.DatetimeIndex(data.index)
+        tz = str(dates.tz) if dates.tz is not None else None
+        utc = dates.tz_convert('UTC') if tz else dates
+        return cls(utc.as_unit('ns').asi8, arrays['Open'], arrays['High'], arrays['Low'], arrays['Close'],
+                   arrays.get('Volume'), symbols=symbols, tz=tz)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the index and price arrays"""
+        arrays = [self.index, self.open, self.high, self.low, self.close]
+        if self.volume is not None:
+            arrays.append(self.volume)
+        return sum(array.nbytes for array in arrays)
+
+    @property
+    def dates(self) -> pd.DatetimeIndex:
+        """The index as dates in the history's time zone"""
+        dates = pd.DatetimeIndex(self.index.view('datetime64[ns]'), name='Date')
+        return dates.tz_localize('UTC').tz_convert(self.tz) if self.tz else dates
+
+    def fields(self) -> Dict[str, np.ndarray]:
+        """(T, N) arrays keyed by price field, ready for compute_indicators"""
+        fields = {'Open': self.open, 'High': self.high, 'Low': self.low, 'Close': self.close}
+        if self.volume is not None:
+            fields['Volume'] = self.volume
+        return fields
+
+    def to_frame(self, symbol: str = None) -> pd.DataFrame:
+        """
+        View one symbol's bars as a DataFrame without copying
+
+        Args:
+            symbol (str): Symbol to select, may be omitted for a single-symbol history
+
+        Returns:
+            pd.DataFrame: float32 OHLC and float64 Volume columns sharing memory with this history
+        """
+        if symbol is None:
+            if len(self.symbols) != 1:
+                raise ValueError("symbol is required for a multi-symbol history")
+            column = 0
+        else:
+            column = self.symbols.index(symbol)
+        data = {field: values[:, column] for field, values in self.fields().items()}
+        return pd.DataFrame(data, index=self.dates, copy=False)
+
+    def indicators(self, names: List[str] = None) -> Dict[str, np.ndarray]:
+        """Evaluate registry indicators on the float32 panel"""
+        return compute_indicators(self.fields(), names)
+
+    def technical_data(self) -> Dict[str, Dict]:
+        """``technical_data`` dicts per symbol, as panel_technical_data returns them"""
+        volume = self.volume
+        if volume is None:
+            volume = np.broadcast_to(np.nan, self.close.shape)
+        return panel_technical_data(self.symbols, self.close, self.high, self.low, volume)
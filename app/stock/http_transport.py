@@ -0,0 +1,95 @@
+import requests
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict
+
+from .rate_limit import HostRateLimiter, RateLimitedAdapter, get_host_limiter
+
+# (connect, read) seconds; every request gets an explicit timeout
+DEFAULT_TIMEOUT = (5, 15)
+
+
+class HttpTransport:
+    def __init__(self, timeout=DEFAULT_TIMEOUT, pool_maxsize: int = 8, maxsize: int = 256,
+                 limiter: HostRateLimiter = None):
+        """
+        Pooled HTTP session with per-host pacing and conditional GETs
+
+        ``fetch`` remembers each URL's ETag and Last-Modified validators along
+        with the parsed result. The next fetch of that URL sends them as
+        If-None-Match / If-Modified-Since; a 304 answer returns the remembered
+        result without reading or parsing a body.
+
+        Args:
+            timeout (float or tuple): Default (connect, read) timeout in seconds
+            pool_maxsize (int): Keep-alive connections kept per host
+            maxsize (int): URLs whose validators and parsed results are kept
+            limiter (HostRateLimiter): Per-host limiter, defaults to the shared one
+        """
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self.session = requests.Session()
+        adapter = RateLimitedAdapter(limiter or get_host_limiter(), pool_connections=8, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str, params: Dict = None, headers: Dict = None, **kwargs) -> requests.Response:
+        """Plain GET through the pooled session with the default timeout"""
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.get(url, params=params, headers=headers, **kwargs)
+
+    def fetch(self, url: str, parse: Callable[[requests.Response], Any], params: Dict = None,
+              headers: Dict = None) -> Any:
+        """
+        GET a URL and parse it, reusing the last result when the server answers 304
+
+        Args:
+            url (str): URL to fetch
+            parse (Callable): Turns a 200 response into a result, e.g. a feed or article list
+            params (Dict): Query parameters
+            headers (Dict): Extra request headers
+
+        Returns:
+            Any: Parsed result, shared between callers; treat it as read-only
+        """
+        key = requests.Request('GET', url, params=params).prepare().url
+        with self._lock:
+            entry = self._entries.get(key)
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry['etag']:
+                request_headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                request_headers['If-Modified-Since'] = entry['last_modified']
+
+        response = self.get(url, params=params, headers=request_headers)
+        if response.status_code == 304 and entry is not None:
+            with self._lock:
+                self._entries.move_to_end(key)
+            return entry['result']
+        response.raise_for_status()
+
+        result = parse(response)
+        etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+        if etag or last_modified:
+            with self._lock:
+                self._entries[key] = {'etag': etag, 'last_modified': last_modified, 'result': result}
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return result
+
+
+_http_transport = None
+_http_transport_lock = threading.Lock()
+
+
+def get_http_transport() -> HttpTransport:
+    """Return the process-wide transport shared by the news sources"""
+    global _http_transport
+    with _http_transport_lock:
+        if _http_transport is None:
+            _http_transport = HttpTransport()
+    return _http_transport
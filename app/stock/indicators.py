@@ -0,0 +1,721 @@
+import yfinance as yf
+import pandas as pd
+import numpy as np
+import math
+from collections import deque
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Callable, Dict, List, Tuple
+
+# (label in technical_data, indicator column, rounding digits); labels whose
+# column was not computed are left out
+TECHNICAL_FIELDS = [
+    ('SMA 20', 'SMA_20', 2),
+    ('SMA 50', 'SMA_50', 2),
+    ('SMA 200', 'SMA_200', 2),
+    ('EMA 12', 'EMA_12', 2),
+    ('EMA 26', 'EMA_26', 2),
+    ('RSI', 'RSI', 2),
+    ('MACD', 'MACD', 4),
+    ('MACD Signal', 'MACD_Signal', 4),
+    ('Bollinger Upper', 'BB_Upper', 2),
+    ('Bollinger Lower', 'BB_Lower', 2),
+    ('Stochastic %K', '%K', 2),
+    ('Stochastic %D', '%D', 2),
+    ('ATR 14', 'ATR_14', 2),
+    ('OBV', 'OBV', 0),
+]
+
+
+def _round_or_na(value, digits):
+    """Round a finite number, or return 'N/A' for missing values"""
+    if value is None or pd.isna(value) or np.isinf(value):
+        return 'N/A'
+    return round(float(value), digits)
+
+
+def format_technical_data(latest, high_52w, low_52w) -> Dict:
+    """
+    Build the ``technical_data`` dict returned by ``StockAnalyzer``
+
+    Args:
+        latest (Mapping): Latest row holding Close, Volume and indicator columns
+        high_52w (float): Highest high over the period
+        low_52w (float): Lowest low over the period
+
+    Returns:
+        Dict: Rounded indicator values keyed by display label
+    """
+    technical_data = {'Current Price': round(float(latest['Close']), 2)}
+    for label, column, digits in TECHNICAL_FIELDS:
+        if column in latest:
+            technical_data[label] = _round_or_na(latest[column], digits)
+    technical_data['Volume'] = latest['Volume']
+    technical_data['52 Week High'] = round(float(high_52w), 2)
+    technical_data['52 Week Low'] = round(float(low_52w), 2)
+    return technical_data
+
+
+def latest_technical_indicators(hist: pd.DataFrame) -> Dict:
+    """
+    Compute only the final indicator values from the trailing windows
+
+    Unlike the full-series path, no indicator columns are attached to ``hist``:
+    the rolling indicators read just their last window and the EWM chains are
+    folded into scalars.
+
+    Args:
+        hist (pd.DataFrame): Bars with Close, High, Low and Volume columns
+
+    Returns:
+        Dict: Same ``technical_data`` as ``calculate_technical_indicators``
+    """
+    close = hist['Close'].to_numpy(dtype=np.float64)
+    high = hist['High'].to_numpy(dtype=np.float64)
+    low = hist['Low'].to_numpy(dtype=np.float64)
+
+    def trailing_mean(values, window):
+        return values[-window:].mean() if len(values) >= window else np.nan
+
+    latest = {
+        'Close': close[-1],
+        'Volume': hist['Volume'].iloc[-1],
+        'SMA_20': trailing_mean(close, 20),
+        'SMA_50': trailing_mean(close, 50),
+        'SMA_200': trailing_mean(close, 200),
+    }
+
+    ema_12, ema_26, macd_signal = _EWM(12), _EWM(26), _EWM(9)
+    for price in close.tolist():
+        macd = ema_12.push(price) - ema_26.push(price)
+        macd_signal.push(macd)
+    latest['EMA_12'] = ema_12.weighted
+    latest['EMA_26'] = ema_26.weighted
+    latest['MACD'] = ema_12.weighted - ema_26.weighted
+    latest['MACD_Signal'] = macd_signal.weighted
+
+    # RSI over the last 14 deltas; the very first bar counts as no change
+    delta = np.diff(close[-15:])
+    if len(close) < 15:
+        delta = np.concatenate([[0.0], delta])
+    gain = trailing_mean(np.where(delta > 0, delta, 0.0), 14)
+    loss = trailing_mean(np.where(delta < 0, -delta, 0.0), 14)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        latest['RSI'] = 100 - (100 / (1 + np.float64(gain) / loss))
+
+    bb_std = close[-20:].std(ddof=1) if len(close) >= 20 else np.nan
+    latest['BB_Upper'] = latest['SMA_20'] + (bb_std * 2)
+    latest['BB_Lower'] = latest['SMA_20'] - (bb_std * 2)
+
+    # %D needs the last three %K values, i.e. the last 16 bars
+    if len(close) >= 14:
+        tail = min(len(close), 16)
+        low_14 = sliding_window_view(low[-tail:], 14).min(axis=-1)
+        high_14 = sliding_window_view(high[-tail:], 14).max(axis=-1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct_k = 100 * ((close[-len(low_14):] - low_14) / (high_14 - low_14))
+        latest['%K'] = pct_k[-1]
+        latest['%D'] = pct_k.mean() if len(pct_k) == 3 else np.nan
+    else:
+        latest['%K'] = latest['%D'] = np.nan
+
+    return format_technical_data(latest, high.max(), low.min())
+
+
+def _float_array(values) -> np.ndarray:
+    """View values as a float array, keeping float32 input as float32"""
+    values = np.asarray(values)
+    return values if values.dtype in (np.float32, np.float64) else values.astype(np.float64)
+
+
+def _rolling_mean64(values: np.ndarray, window: int) -> np.ndarray:
+    out = np.full(values.shape, np.nan)
+    if values.shape[0] < window:
+        return out
+    missing = np.isnan(values)
+    # Accumulate in float64 even for float32 panels; a float32 running sum drifts
+    csum = np.cumsum(np.where(missing, 0.0, values), axis=0, dtype=np.float64)
+    cmiss = np.cumsum(missing, axis=0)
+    total = csum[window - 1:].copy()
+    total[1:] -= csum[:-window]
+    gaps = cmiss[window - 1:].copy()
+    gaps[1:] -= cmiss[:-window]
+    out[window - 1:] = np.where(gaps == 0, total / window, np.nan)
+    return out
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing rolling mean along the time axis of a (T, N) panel
+
+    Windows that contain a NaN, or are shorter than ``window``, yield NaN,
+    matching ``pd.Series.rolling(window).mean()``. The result keeps the input's
+    float precision.
+    """
+    values = _float_array(values)
+    return _rolling_mean64(values, window).astype(values.dtype, copy=False)
+
+
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing rolling sample standard deviation (ddof=1) along the time axis"""
+    values = _float_array(values)
+    # Centre each column on its first valid value so the sum-of-squares difference keeps its precision
+    first = np.argmax(~np.isnan(values), axis=0)
+    offset = np.take_along_axis(values, np.expand_dims(first, 0), axis=0) if values.size else 0.0
+    centred = values.astype(np.float64) - np.nan_to_num(offset)
+    mean = _rolling_mean64(centred, window)
+    mean_sq = _rolling_mean64(centred * centred, window)
+    var = (mean_sq - mean * mean) * window / (window - 1)
+    return np.sqrt(np.maximum(var, 0.0)).astype(values.dtype, copy=False)
+
+
+def rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing rolling minimum along the time axis"""
+    values = _float_array(values)
+    out = np.full(values.shape, np.nan, dtype=values.dtype)
+    if values.shape[0] >= window:
+        out[window - 1:] = sliding_window_view(values, window, axis=0).min(axis=-1)
+    return out
+
+
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing rolling maximum along the time axis"""
+    values = _float_array(values)
+    out = np.full(values.shape, np.nan, dtype=values.dtype)
+    if values.shape[0] >= window:
+        out[window - 1:] = sliding_window_view(values, window, axis=0).max(axis=-1)
+    return out
+
+
+def ewm_mean(values: np.ndarray, span: int) -> np.ndarray:
+    """
+    Exponentially weighted mean along the time axis of a (T, N) panel
+
+    Reproduces ``pd.Series.ewm(span=span).mean()`` (``adjust=True``) by running
+    pandas' compiled EWM over every column at once. The result keeps the
+    input's float precision.
+    """
+    values = _float_array(values)
+    if values.size == 0:
+        return values.copy()
+    frame = pd.DataFrame(values.reshape(values.shape[0], -1), copy=False)
+    out = frame.ewm(span=span).mean().to_numpy()
+    return out.reshape(values.shape).astype(values.dtype, copy=False)
+
+
+def _align_to_latest(valid: np.ndarray, *panels: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Move each symbol's valid bars to the bottom of the panel, keeping their order
+
+    A bulk download aligns every symbol on the union of trading dates, so a
+    symbol can have interior gaps its own ``history()`` would not contain.
+    After this shuffle every column only has leading NaNs and the last row is
+    that symbol's latest bar.
+    """
+    order = np.argsort(valid, axis=0, kind='stable')
+    aligned = []
+    for panel in panels:
+        panel = np.take_along_axis(_float_array(panel), order, axis=0)
+        aligned.append(np.where(np.sort(valid, axis=0), panel, np.nan))
+    return tuple(aligned)
+
+
+class IndicatorSpec:
+    def __init__(self, name: str, func: Callable, inputs: List[str], params: Dict = None):
+        """
+        One node of the indicator dependency graph
+
+        Args:
+            name (str): Output name, also used as the DataFrame column
+            func (Callable): Called as ``func(*input_arrays, **params)``
+            inputs (List[str]): Price fields ('Close', 'High', ...) or other indicator names
+            params (Dict): Keyword parameters passed to ``func``
+        """
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.params = params or {}
+
+
+INDICATOR_REGISTRY: Dict[str, IndicatorSpec] = {}
+
+# Columns calculate_technical_indicators has always attached to the history
+DEFAULT_INDICATORS = [
+    'SMA_20', 'SMA_50', 'SMA_200', 'EMA_12', 'EMA_26', 'RSI',
+    'MACD', 'MACD_Signal', 'MACD_Histogram', 'BB_Middle', 'BB_Upper', 'BB_Lower',
+    '%K', '%D',
+]
+
+
+def register_indicator(name: str, func: Callable, inputs: List[str], **params):
+    """
+    Add an indicator to the registry
+
+    Intermediates such as a rolling standard deviation are registered the same
+    way, so every indicator that depends on them shares one computation.
+    """
+    INDICATOR_REGISTRY[name] = IndicatorSpec(name, func, inputs, params)
+
+
+def compute_indicators(data: Dict[str, np.ndarray], names: List[str] = None) -> Dict[str, np.ndarray]:
+    """
+    Evaluate requested indicators, computing each shared intermediate once
+
+    Args:
+        data (Dict[str, np.ndarray]): Price fields, (T,) or (T, N) arrays;
+            float32 fields (e.g. from a CompactHistory) are computed in float32
+        names (List[str]): Indicators to return, defaults to DEFAULT_INDICATORS
+
+    Returns:
+        Dict[str, np.ndarray]: Arrays keyed by indicator name, in request order
+    """
+    names = DEFAULT_INDICATORS if names is None else names
+    values = {field: _float_array(array) for field, array in data.items()}
+
+    def resolve(name, path=()):
+        if name in values:
+            return values[name]
+        if name not in INDICATOR_REGISTRY:
+            raise KeyError(f"Unknown indicator or missing price field: {name}")
+        if name in path:
+            raise ValueError(f"Indicator dependency cycle: {' -> '.join(path + (name,))}")
+        spec = INDICATOR_REGISTRY[name]
+        args = [resolve(dependency, path + (name,)) for dependency in spec.inputs]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values[name] = spec.func(*args, **spec.params)
+        return values[name]
+
+    return {name: resolve(name) for name in names}
+
+
+def _difference(values):
+    delta = np.full(values.shape, np.nan, dtype=values.dtype)
+    delta[1:] = values[1:] - values[:-1]
+    return delta
+
+
+def _gains(close, delta):
+    # The first delta of each series counts as no change, as in pandas
+    return np.where(np.isnan(close), np.nan, np.where(delta > 0, delta, 0.0))
+
+
+def _losses(close, delta):
+    return np.where(np.isnan(close), np.nan, np.where(delta < 0, -delta, 0.0))
+
+
+def _rsi(avg_gain, avg_loss):
+    return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+def _band(middle, std, width):
+    return middle + (std * width)
+
+
+def _stochastic_k(close, low_n, high_n):
+    return 100 * ((close - low_n) / (high_n - low_n))
+
+
+def _true_range(high, low, close):
+    prev_close = np.full(close.shape, np.nan, dtype=close.dtype)
+    prev_close[1:] = close[:-1]
+    true_range = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+    return np.where(np.isnan(close), np.nan, true_range)
+
+
+def _on_balance_volume(volume, delta, close):
+    signed = np.where(np.isnan(delta), 0.0, np.sign(delta) * volume)
+    obv = np.cumsum(signed, axis=0)
+    return np.where(np.isnan(close), np.nan, obv)
+
+
+register_indicator('SMA_20', rolling_mean, ['Close'], window=20)
+register_indicator('SMA_50', rolling_mean, ['Close'], window=50)
+register_indicator('SMA_200', rolling_mean, ['Close'], window=200)
+register_indicator('STD_20', rolling_std, ['Close'], window=20)
+register_indicator('EMA_12', ewm_mean, ['Close'], span=12)
+register_indicator('EMA_26', ewm_mean, ['Close'], span=26)
+
+register_indicator('DELTA', _difference, ['Close'])
+register_indicator('GAIN', _gains, ['Close', 'DELTA'])
+register_indicator('LOSS', _losses, ['Close', 'DELTA'])
+register_indicator('AVG_GAIN_14', rolling_mean, ['GAIN'], window=14)
+register_indicator('AVG_LOSS_14', rolling_mean, ['LOSS'], window=14)
+register_indicator('RSI', _rsi, ['AVG_GAIN_14', 'AVG_LOSS_14'])
+
+register_indicator('MACD', np.subtract, ['EMA_12', 'EMA_26'])
+register_indicator('MACD_Signal', ewm_mean, ['MACD'], span=9)
+register_indicator('MACD_Histogram', np.subtract, ['MACD', 'MACD_Signal'])
+
+register_indicator('BB_Middle', np.copy, ['SMA_20'])
+register_indicator('BB_Upper', _band, ['SMA_20', 'STD_20'], width=2)
+register_indicator('BB_Lower', _band, ['SMA_20', 'STD_20'], width=-2)
+
+register_indicator('LOW_14', rolling_min, ['Low'], window=14)
+register_indicator('HIGH_14', rolling_max, ['High'], window=14)
+register_indicator('%K', _stochastic_k, ['Close', 'LOW_14', 'HIGH_14'])
+register_indicator('%D', rolling_mean, ['%K'], window=3)
+
+# Not part of the default report; available on request
+register_indicator('TR', _true_range, ['High', 'Low', 'Close'])
+register_indicator('ATR_14', rolling_mean, ['TR'], window=14)
+register_indicator('OBV', _on_balance_volume, ['Volume', 'DELTA', 'Close'])
+
+
+def compute_indicator_panel(close, high, low) -> Dict[str, np.ndarray]:
+    """
+    Compute every default indicator for N symbols at once
+
+    Args:
+        close (np.ndarray): (T, N) closing prices, NaN where a symbol has no bar
+        high (np.ndarray): (T, N) highs
+        low (np.ndarray): (T, N) lows
+
+    Returns:
+        Dict[str, np.ndarray]: (T, N) arrays keyed by indicator column name
+    """
+    return compute_indicators({'Close': close, 'High': high, 'Low': low})
+
+
+def panel_technical_data(symbols: List[str], close, high, low, volume) -> Dict[str, Dict]:
+    """
+    Compute ``technical_data`` dicts for many symbols from one price panel
+
+    Args:
+        symbols (List[str]): Column labels of the panel
+        close, high, low, volume (np.ndarray): (T, N) price panels
+
+    Returns:
+        Dict[str, Dict]: Same dict ``calculate_technical_indicators`` returns, per symbol
+    """
+    valid = ~np.isnan(np.asarray(close, dtype=np.float64))
+    close, high, low, volume = _align_to_latest(valid, close, high, low, volume)
+    panel = compute_indicator_panel(close, high, low)
+
+    high_52w = np.nanmax(high, axis=0, initial=-np.inf)
+    low_52w = np.nanmin(low, axis=0, initial=np.inf)
+
+    results = {}
+    for j, symbol in enumerate(symbols):
+        if not valid[:, j].any():
+            results[symbol] = {}
+            continue
+        latest = {column: values[-1, j] for column, values in panel.items()}
+        latest['Close'] = close[-1, j]
+        latest['Volume'] = volume[-1, j] if np.isnan(volume[-1, j]) else int(volume[-1, j])
+        results[symbol] = format_technical_data(latest, high_52w[j], low_52w[j])
+    return results
+
+
+def download_price_panel(symbols: List[str], period: str = '1y') -> Tuple[List[str], Dict[str, np.ndarray]]:
+    """
+    Download OHLCV for many symbols in a single bulk request
+
+    Args:
+        symbols (List[str]): Stock symbols
+        period (str): yfinance period string
+
+    Returns:
+        Tuple[List[str], Dict[str, np.ndarray]]: Symbols and (T, N) arrays keyed by field
+    """
+    symbols = [s.upper() for s in symbols]
+    data = yf.download(symbols, period=period, group_by='column', auto_adjust=True,
+                       progress=False, threads=True)
+    return symbols, _panel_fields(data, symbols)
+
+
+def _panel_fields(data: pd.DataFrame, symbols: List[str], fields: List[str] = None,
+                  dtype=np.float64, order: str = 'C') -> Dict[str, np.ndarray]:
+    """Split a column-grouped bulk download into (T, N) arrays per field"""
+    arrays = {}
+    for field in fields or ['Open', 'High', 'Low', 'Close', 'Volume']:
+        if data.empty:
+            arrays[field] = np.full((0, len(symbols)), np.nan, dtype=dtype)
+            continue
+        frame = data[field]
+        if isinstance(frame, pd.Series):
+            frame = frame.to_frame(symbols[0])
+        values = frame.reindex(columns=symbols).to_numpy(dtype=dtype)
+        arrays[field] = np.asarray(values, order=order)
+    return arrays
+
+
+def batch_technical_indicators(symbols: List[str], period: str = '1y') -> Dict[str, Dict]:
+    """
+    Technical indicators for many symbols from one bulk download
+
+    Args:
+        symbols (List[str]): Stock symbols
+        period (str): yfinance period string
+
+    Returns:
+        Dict[str, Dict]: ``technical_data`` per symbol, empty dict when no data
+    """
+    try:
+        symbols, fields = download_price_panel(symbols, period)
+        if fields['Close'].shape[0] == 0:
+            return {symbol: {} for symbol in symbols}
+        return panel_technical_data(symbols, fields['Close'], fields['High'],
+                                    fields['Low'], fields['Volume'])
+    except Exception as e:
+        print(f"Error calculating batch technical indicators: {e}")
+        return {symbol.upper(): {} for symbol in symbols}
+
+
+class _RollingWindow:
+    """Fixed-size window with running sums for O(1) mean and sample std"""
+
+    _EMPTY = object()
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values = deque()
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.missing = 0
+        self.offset = None
+        self._pushes = 0
+        self._undo = self._EMPTY
+
+    def _add(self, x):
+        if math.isnan(x):
+            self.missing += 1
+        else:
+            x -= self.offset
+            self.total += x
+            self.total_sq += x * x
+
+    def _remove(self, x):
+        if math.isnan(x):
+            self.missing -= 1
+        else:
+            x -= self.offset
+            self.total -= x
+            self.total_sq -= x * x
+
+    def push(self, x: float):
+        if self.offset is None and not math.isnan(x):
+            self.offset = x
+        evicted = self._EMPTY
+        if len(self.values) == self.window:
+            evicted = self.values.popleft()
+            self._remove(evicted)
+        self.values.append(x)
+        self._add(x)
+        self._undo = evicted
+
+        # Resync the running sums once per window so float drift cannot build up
+        self._pushes += 1
+        if self._pushes % self.window == 0:
+            self.total = self.total_sq = 0.0
+            self.missing = 0
+            for value in self.values:
+                self._add(value)
+
+    def undo(self):
+        self._remove(self.values.pop())
+        if self._undo is not self._EMPTY:
+            self.values.appendleft(self._undo)
+            self._add(self._undo)
+        self._undo = self._EMPTY
+
+    def mean(self) -> float:
+        if len(self.values) < self.window or self.missing:
+            return np.nan
+        return self.total / self.window + self.offset
+
+    def std(self) -> float:
+        if len(self.values) < self.window or self.missing:
+            return np.nan
+        var = (self.total_sq - self.total * self.total / self.window) / (self.window - 1)
+        return math.sqrt(max(var, 0.0))
+
+
+class _EWM:
+    """Running ``ewm(span).mean()`` state with ``adjust=True`` weighting"""
+
+    def __init__(self, span: int):
+        self.decay = 1.0 - 2.0 / (span + 1.0)
+        self.weighted = np.nan
+        self.old_wt = 1.0
+        self._undo = None
+
+    def push(self, x: float) -> float:
+        self._undo = (self.weighted, self.old_wt)
+        if not math.isnan(self.weighted):
+            self.old_wt *= self.decay
+            if not math.isnan(x):
+                self.weighted = (self.old_wt * self.weighted + x) / (self.old_wt + 1.0)
+                self.old_wt += 1.0
+        elif not math.isnan(x):
+            self.weighted = x
+        return self.weighted
+
+    def undo(self):
+        self.weighted, self.old_wt = self._undo
+
+
+class _RollingExtreme:
+    """Rolling min or max over a fixed window using a monotonic deque"""
+
+    def __init__(self, window: int, largest: bool):
+        self.window = window
+        self.largest = largest
+        self.items = deque()
+        self.count = 0
+        self._undo = None
+
+    def push(self, x: float):
+        popped = []
+        while self.items and (self.items[-1][1] <= x if self.largest else self.items[-1][1] >= x):
+            popped.append(self.items.pop())
+        self.items.append((self.count, x))
+        expired = None
+        if self.items[0][0] <= self.count - self.window:
+            expired = self.items.popleft()
+        self.count += 1
+        self._undo = (popped, expired)
+
+    def undo(self):
+        popped, expired = self._undo
+        self.count -= 1
+        if expired is not None:
+            self.items.appendleft(expired)
+        self.items.pop()
+        self.items.extend(reversed(popped))
+
+    def value(self) -> float:
+        if self.count < self.window:
+            return np.nan
+        return self.items[0][1]
+
+
+class IncrementalIndicators:
+    def __init__(self):
+        """
+        Streaming indicator state that folds in one bar at a time
+
+        Every update touches only ring buffers, running sums, EWM state and
+        monotonic deques, so its cost does not depend on how much history the
+        state was seeded with.
+        """
+        self.sma_20 = _RollingWindow(20)
+        self.sma_50 = _RollingWindow(50)
+        self.sma_200 = _RollingWindow(200)
+        self.ema_12 = _EWM(12)
+        self.ema_26 = _EWM(26)
+        self.macd_signal = _EWM(9)
+        self.gain = _RollingWindow(14)
+        self.loss = _RollingWindow(14)
+        self.low_14 = _RollingExtreme(14, largest=False)
+        self.high_14 = _RollingExtreme(14, largest=True)
+        self.pct_d = _RollingWindow(3)
+        self.prev_close = np.nan
+        self.high_52w = -np.inf
+        self.low_52w = np.inf
+        self.latest = None
+        self._undo = None
+
+    @classmethod
+    def from_history(cls, hist: pd.DataFrame) -> 'IncrementalIndicators':
+        """
+        Seed the state from a ``history()`` DataFrame
+
+        Args:
+            hist (pd.DataFrame): Bars with Close, High, Low and Volume columns
+
+        Returns:
+            IncrementalIndicators: State positioned after the last bar
+        """
+        state = cls()
+        for close, high, low, volume in zip(hist['Close'].to_numpy(dtype=np.float64),
+                                            hist['High'].to_numpy(dtype=np.float64),
+                                            hist['Low'].to_numpy(dtype=np.float64),
+                                            hist['Volume'].to_numpy()):
+            state._push(close, high, low, volume)
+        return state
+
+    def _components(self):
+        return [self.sma_20, self.sma_50, self.sma_200, self.ema_12, self.ema_26,
+                self.macd_signal, self.gain, self.loss, self.low_14, self.high_14, self.pct_d]
+
+    def _push(self, close, high, low, volume):
+        self._undo = (self.prev_close, self.high_52w, self.low_52w, self.latest)
+
+        for window in (self.sma_20, self.sma_50, self.sma_200):
+            window.push(close)
+        ema_12 = self.ema_12.push(close)
+        ema_26 = self.ema_26.push(close)
+        macd = ema_12 - ema_26
+        macd_signal = self.macd_signal.push(macd)
+
+        # The first bar has no delta and counts as no change, as in pandas
+        delta = close - self.prev_close
+        self.gain.push(delta if delta > 0 else 0.0)
+        self.loss.push(-delta if delta < 0 else 0.0)
+        gain, loss = self.gain.mean(), self.loss.mean()
+        if math.isnan(gain) or math.isnan(loss):
+            rsi = np.nan
+        elif loss == 0:
+            rsi = 100.0 if gain > 0 else np.nan
+        else:
+            rsi = 100 - (100 / (1 + gain / loss))
+
+        self.low_14.push(low)
+        self.high_14.push(high)
+        low_14, high_14 = self.low_14.value(), self.high_14.value()
+        pct_k = np.nan
+        if not (math.isnan(low_14) or math.isnan(high_14)) and high_14 != low_14:
+            pct_k = 100 * ((close - low_14) / (high_14 - low_14))
+        self.pct_d.push(pct_k)
+
+        bb_middle = self.sma_20.mean()
+        bb_std = self.sma_20.std()
+        self.prev_close = close
+        self.high_52w = max(self.high_52w, high)
+        self.low_52w = min(self.low_52w, low)
+        self.latest = {
+            'Close': close,
+            'Volume': volume,
+            'SMA_20': bb_middle,
+            'SMA_50': self.sma_50.mean(),
+            'SMA_200': self.sma_200.mean(),
+            'EMA_12': ema_12,
+            'EMA_26': ema_26,
+            'RSI': rsi,
+            'MACD': macd,
+            'MACD_Signal': macd_signal,
+            'MACD_Histogram': macd - macd_signal,
+            'BB_Middle': bb_middle,
+            'BB_Upper': bb_middle + (bb_std * 2),
+            'BB_Lower': bb_middle - (bb_std * 2),
+            '%K': pct_k,
+            '%D': self.pct_d.mean(),
+        }
+
+    def _rollback(self):
+        for component in self._components():
+            component.undo()
+        self.prev_close, self.high_52w, self.low_52w, self.latest = self._undo
+        self._undo = None
+
+    def update(self, bar, replace_last: bool = False) -> Dict:
+        """
+        Fold a new bar into the state
+
+        Args:
+            bar (Mapping): Bar with Close, High, Low and Volume keys
+            replace_last (bool): Revise the latest bar instead of appending,
+                e.g. when today's intraday bar is refreshed
+
+        Returns:
+            Dict: Updated ``technical_data``
+        """
+        if replace_last and self._undo is not None:
+            self._rollback()
+        self._push(float(bar['Close']), float(bar['High']), float(bar['Low']), bar['Volume'])
+        return self.technical_data()
+
+    def technical_data(self) -> Dict:
+        """Current ``technical_data`` dict, or an empty dict before the first bar"""
+        if self.latest is None:
+            return {}
+        return format_technical_data(self.latest, self.high_52w, self.low_52w)
@@ -0,0 +1,65 @@
+import numpy as np
+import re
+from rapidfuzz import fuzz, process
+from typing import List, Sequence, Tuple
+
+# Scores combined by taking the best, as _is_name_match always has
+SCORERS = (fuzz.ratio, fuzz.partial_ratio, fuzz.token_sort_ratio)
+
+_NON_WORD = re.compile(r'[^\w\s]')
+
+
+def normalize_name(name: str) -> str:
+    """Lower-case, strip punctuation and collapse whitespace, as _is_name_match does"""
+    return ' '.join(_NON_WORD.sub('', str(name).lower()).split()) if name else ''
+
+
+def name_score_matrix(queries: Sequence[str], candidates: Sequence[str], workers: int = 1) -> np.ndarray:
+    """
+    Score every query against every candidate in one call
+
+    Both sides are normalized once. Each scorer fills a (Q, C) matrix in C code
+    via ``rapidfuzz.process.cdist``, and the best of the three is kept.
+
+    Args:
+        queries (Sequence[str]): Names being searched for
+        candidates (Sequence[str]): Company names to score
+        workers (int): Threads used by cdist, -1 for every core
+
+    Returns:
+        np.ndarray: (Q, C) uint8 scores (0-100); empty names score 0
+    """
+    queries = [normalize_name(q) for q in queries]
+    candidates = [normalize_name(c) for c in candidates]
+    if not queries or not candidates:
+        return np.zeros((len(queries), len(candidates)), dtype=np.uint8)
+    scores = process.cdist(queries, candidates, scorer=SCORERS[0], dtype=np.uint8, workers=workers)
+    for scorer in SCORERS[1:]:
+        np.maximum(scores, process.cdist(queries, candidates, scorer=scorer, dtype=np.uint8, workers=workers),
+                   out=scores)
+    return scores
+
+
+def score_names(query: str, candidates: Sequence[str]) -> np.ndarray:
+    """Best of ratio, partial ratio and token sort ratio for each candidate (0-100)"""
+    return name_score_matrix([query], candidates)[0]
+
+
+def top_matches(query: str, candidates: Sequence[str], limit: int = 5,
+                score_cutoff: int = 0) -> List[Tuple[int, int]]:
+    """
+    Best-scoring candidates for a name
+
+    Args:
+        query (str): Name being searched for
+        candidates (Sequence[str]): Company names to score
+        limit (int): Maximum matches returned, None for all
+        score_cutoff (int): Minimum score kept
+
+    Returns:
+        List[Tuple[int, int]]: (candidate index, score), best first; ties keep candidate order
+    """
+    scores = score_names(query, candidates)
+    keep = np.flatnonzero(scores >= score_cutoff)
+    order = keep[np.argsort(-scores[keep].astype(np.int16), kind='stable')][:limit]
+    return [(int(i), int(scores[i])) for i in order]
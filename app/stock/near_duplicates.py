@@ -0,0 +1,167 @@
+import numpy as np
+import hashlib
+import html
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional
+
+from .name_matching import normalize_name
+
+# Mersenne prime 2^31 - 1; hashes are reduced below it so a * x + b fits in uint64
+_PRIME = np.uint64((1 << 31) - 1)
+_TAGS = re.compile(r'<[^>]+>')
+
+# Copies of a story with a source suffix or small edits score about 0.7 and up. Short titles that
+# differ in one word ('Apple stock rises/falls in premarket trading', 'Apple Q3/Q4 earnings beat
+# estimates') score 0.6-0.7 as well, so texts shorter than SHORT_TEXT_WORDS must also pass same_story
+DEFAULT_THRESHOLD = 0.6
+SHORT_TEXT_WORDS = 16
+
+
+def article_text(article: Dict) -> str:
+    """Normalized title plus summary; feed summaries often carry HTML, which is dropped"""
+    text = f"{article.get('title') or ''} {article.get('summary') or ''}"
+    return normalize_name(html.unescape(_TAGS.sub(' ', text)))
+
+
+def same_story(text: str, other: str) -> bool:
+    """
+    Word check for two normalized texts whose signatures already match
+
+    A copy of a short text only adds words, e.g. a ' - Reuters' suffix. When
+    each of two short texts has a word the other lacks ('rises' / 'falls'),
+    they report different news. Longer texts are left to the MinHash score.
+    """
+    words, other_words = set(text.split()), set(other.split())
+    if min(len(words), len(other_words)) >= SHORT_TEXT_WORDS:
+        return True
+    return words <= other_words or other_words <= words
+
+
+def shingles(text: str, k: int = 5) -> List[str]:
+    """Distinct character k-grams of a normalized text; texts shorter than k give themselves"""
+    if len(text) <= k:
+        return [text] if text else []
+    return list(dict.fromkeys(text[i:i + k] for i in range(len(text) - k + 1)))
+
+
+class MinHasher:
+    def __init__(self, num_perm: int = 128, bands: int = 32, seed: int = 1):
+        """
+        MinHash signatures and LSH band keys for article texts
+
+        With ``bands`` bands of ``num_perm // bands`` rows, two texts share at
+        least one band key with high probability once their shingle Jaccard
+        similarity passes about (1 / bands) ** (bands / num_perm), 0.42 for
+        the defaults. The same seed must be used wherever signatures are
+        compared, e.g. by the article store.
+
+        Args:
+            num_perm (int): Hash permutations per signature
+            bands (int): LSH bands; must divide num_perm
+            seed (int): Seed of the permutation coefficients
+        """
+        if num_perm % bands:
+            raise ValueError(f"bands ({bands}) must divide num_perm ({num_perm})")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(_PRIME), size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, int(_PRIME), size=(num_perm, 1), dtype=np.uint64)
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """
+        MinHash signature of a normalized text
+
+        Returns:
+            Optional[np.ndarray]: (num_perm,) uint32 signature, None for empty text
+        """
+        grams = shingles(text)
+        if not grams:
+            return None
+        hashes = np.fromiter((zlib.crc32(gram.encode()) for gram in grams), dtype=np.uint64, count=len(grams))
+        hashes %= _PRIME
+        return ((self._a * hashes + self._b) % _PRIME).min(axis=1).astype(np.uint32)
+
+    def band_keys(self, signature: np.ndarray) -> List[int]:
+        """One signed 64-bit key per band, suitable as a dict or SQLite INTEGER key"""
+        rows = signature.reshape(self.bands, self.rows)
+        return [int.from_bytes(hashlib.blake2b(band.tobytes(), digest_size=8, salt=bytes([i])).digest(),
+                               'little', signed=True) for i, band in enumerate(rows)]
+
+    @staticmethod
+    def similarity(first: np.ndarray, second: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return float(np.mean(first == second))
+
+
+class MinHashLSH:
+    def __init__(self, hasher: MinHasher = None, threshold: float = DEFAULT_THRESHOLD):
+        """
+        In-memory LSH index over MinHash signatures
+
+        A query only compares the signatures sharing a band key with it, so
+        its cost follows the size of the matching buckets, not of the index.
+
+        Args:
+            hasher (MinHasher): Signature scheme, defaults to MinHasher()
+            threshold (float): Estimated Jaccard similarity a match must reach
+        """
+        self.hasher = hasher or MinHasher()
+        self.threshold = threshold
+        self._buckets: Dict[int, List] = defaultdict(list)
+        self._signatures: Dict = {}
+        self._texts: Dict = {}
+
+    def insert(self, key: Hashable, signature: np.ndarray, text: str = None):
+        """Index a signature under a key, with its normalized text for same_story checks"""
+        self._signatures[key] = signature
+        self._texts[key] = text
+        for band_key in self.hasher.band_keys(signature):
+            self._buckets[band_key].append(key)
+
+    def query(self, signature: np.ndarray, text: str = None) -> Optional[Hashable]:
+        """Indexed key most similar to the signature, None when none reaches the threshold"""
+        best, best_score = None, self.threshold
+        for key in dict.fromkeys(key for band_key in self.hasher.band_keys(signature)
+                                 for key in self._buckets.get(band_key, ())):
+            score = self.hasher.similarity(signature, self._signatures[key])
+            if score < best_score:
+                continue
+            if text is not None and self._texts[key] is not None and not same_story(text, self._texts[key]):
+                continue
+            best, best_score = key, score
+        return best
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+
+def cluster_articles(articles: Iterable[Dict], threshold: float = DEFAULT_THRESHOLD) -> List[List[int]]:
+    """
+    Group near-duplicate articles, e.g. one wire story syndicated by several sources
+
+    Args:
+        articles (Iterable[Dict]): Articles with 'title' and 'summary'
+        threshold (float): Estimated Jaccard similarity of title plus summary shingles;
+            short texts must also pass same_story
+
+    Returns:
+        List[List[int]]: Article positions per cluster, in order of first appearance;
+            the first position of each cluster is its representative
+    """
+    index = MinHashLSH(threshold=threshold)
+    clusters: List[List[int]] = []
+    for position, article in enumerate(articles):
+        text = article_text(article)
+        signature = index.hasher.signature(text)
+        match = None if signature is None else index.query(signature, text)
+        if match is None:
+            clusters.append([position])
+            if signature is not None:
+                index.insert(len(clusters) - 1, signature, text)
+        else:
+            clusters[match].append(position)
+    return clusters
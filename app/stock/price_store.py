@@ -0,0 +1,223 @@
+import pandas as pd
+import numpy as np
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+# Columns kept on disk; Dividends and Stock Splits are only checked to detect re-adjustments
+FIELDS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
+def period_start(period: str, now: pd.Timestamp = None) -> Optional[pd.Timestamp]:
+    """
+    Translate a yfinance period string into the first date it covers
+
+    Args:
+        period (str): Period such as '5d', '6mo', '1y', 'ytd' or 'max'
+        now (pd.Timestamp): Reference time, defaults to now
+
+    Returns:
+        Optional[pd.Timestamp]: Start date, or None for 'max'
+    """
+    now = pd.Timestamp.now().normalize() if now is None else now.normalize()
+    if period == 'max':
+        return None
+    if period == 'ytd':
+        return now.replace(month=1, day=1)
+    match = re.fullmatch(r'(\d+)(d|wk|mo|y)', period)
+    if not match:
+        raise ValueError(f"Unsupported period: {period}")
+    amount, unit = int(match.group(1)), match.group(2)
+    offsets = {
+        'd': pd.DateOffset(days=amount),
+        'wk': pd.DateOffset(weeks=amount),
+        'mo': pd.DateOffset(months=amount),
+        'y': pd.DateOffset(years=amount),
+    }
+    return now - offsets[unit]
+
+
+def _has_corporate_action(bars: pd.DataFrame) -> bool:
+    """True when any bar carries a dividend or stock split"""
+    return any(column in bars and bars[column].fillna(0).to_numpy().any()
+               for column in ('Dividends', 'Stock Splits'))
+
+
+class PriceStore:
+    def __init__(self, root=None, refresh_interval: float = 300):
+        """
+        On-disk daily OHLCV store with one memory-mapped NumPy layout per symbol
+
+        Each symbol directory holds ``index.npy`` (int64 UTC nanoseconds),
+        ``values.npy`` (column-major float64 OHLCV) and ``meta.json``. Reads map
+        the files straight into a DataFrame without copying.
+
+        Args:
+            root (str or Path): Store directory, defaults to $STOCK_AGENT_DATA_DIR/prices
+            refresh_interval (float): Seconds before a stored symbol is refreshed
+                from upstream again
+        """
+        if root is None:
+            base = os.getenv('STOCK_AGENT_DATA_DIR', Path.home() / '.cache' / 'stock_agent')
+            root = Path(base) / 'prices'
+        self.root = Path(root)
+        self.refresh_interval = refresh_interval
+
+    def _symbol_dir(self, symbol: str) -> Path:
+        return self.root / re.sub(r'[^\w.^=-]', '_', symbol.upper())
+
+    def _read_meta(self, symbol: str) -> Optional[dict]:
+        path = self._symbol_dir(symbol) / 'meta.json'
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())
+
+    def _write_meta(self, symbol: str, meta: dict):
+        path = self._symbol_dir(symbol) / 'meta.json'
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(meta))
+        os.replace(tmp, path)
+
+    def load(self, symbol: str) -> Optional[pd.DataFrame]:
+        """
+        Map a symbol's stored bars into a read-only DataFrame
+
+        Args:
+            symbol (str): Stock symbol
+
+        Returns:
+            Optional[pd.DataFrame]: Stored bars, or None when nothing is stored
+        """
+        meta = self._read_meta(symbol)
+        if meta is None:
+            return None
+        folder = self._symbol_dir(symbol)
+        index = np.load(folder / 'index.npy', mmap_mode='r')
+        values = np.load(folder / 'values.npy', mmap_mode='r')
+        if len(index) != values.shape[0] or len(index) != meta['rows']:
+            return None
+
+        dates = pd.DatetimeIndex(np.asarray(index).view('datetime64[ns]'), name='Date').tz_localize('UTC')
+        if meta.get('tz'):
+            dates = dates.tz_convert(meta['tz'])
+        else:
+            dates = dates.tz_localize(None)
+        return pd.DataFrame(values, index=dates, columns=FIELDS, copy=False)
+
+    def save(self, symbol: str, hist: pd.DataFrame, covered_from: Optional[pd.Timestamp]):
+        """
+        Replace a symbol's stored bars
+
+        Args:
+            symbol (str): Stock symbol
+            hist (pd.DataFrame): Bars indexed by date with OHLCV columns
+            covered_from (pd.Timestamp): Earliest date the upstream was asked for,
+                None when the full history ('max') was fetched
+        """
+        folder = self._symbol_dir(symbol)
+        folder.mkdir(parents=True, exist_ok=True)
+
+        dates = pd.DatetimeIndex(hist.index)
+        tz = str(dates.tz) if dates.tz is not None else None
+        utc = dates.tz_convert('UTC') if tz else dates
+        index = utc.as_unit('ns').asi8.astype(np.int64)
+        values = np.asfortranarray(hist[FIELDS].to_numpy(dtype=np.float64))
+
+        # Write beside the live files and swap in, so readers never see half a file
+        for name, array in (('index.npy', index), ('values.npy', values)):
+            tmp = folder / f'{name}.tmp'
+            with open(tmp, 'wb') as f:
+                np.save(f, array)
+            os.replace(tmp, folder / name)
+
+        self._write_meta(symbol, {
+            'rows': len(index),
+            'tz': tz,
+            'covered_from': None if covered_from is None else str(covered_from.date()),
+            'fetched_at': time.time(),
+        })
+
+    def get_history(self, symbol: str, fetch: Callable[..., pd.DataFrame], period: str = '1y') -> pd.DataFrame:
+        """
+        Get daily bars for a period, downloading only what the store lacks
+
+        Args:
+            symbol (str): Stock symbol
+            fetch (Callable): ``Ticker.history``-compatible function accepting
+                ``period=`` or ``start=``
+            period (str): yfinance period string
+
+        Returns:
+            pd.DataFrame: OHLCV bars for the period
+        """
+        try:
+            start = period_start(period)
+        except ValueError:
+            # Periods the store cannot map to a date range go straight upstream
+            return fetch(period=period)
+
+        try:
+            meta = self._read_meta(symbol)
+            stored = self.load(symbol) if meta else None
+
+            covered = stored is not None and not stored.empty and (
+                meta['covered_from'] is None
+                or (start is not None and start >= pd.Timestamp(meta['covered_from']))
+            )
+            if not covered:
+                hist = fetch(period=period)
+                if hist.empty:
+                    return hist
+                self.save(symbol, hist, start)
+                stored = self.load(symbol)
+            elif time.time() - meta['fetched_at'] >= self.refresh_interval:
+                stored = self._append_delta(symbol, stored, meta, fetch)
+
+            if start is None:
+                return stored
+            if stored.index.tz is not None:
+                start = start.tz_localize(stored.index.tz)
+            return stored[stored.index >= start]
+        except OSError as e:
+            print(f"Price store unavailable for {symbol}: {e}")
+            return fetch(period=period)
+
+    def _append_delta(self, symbol: str, stored: pd.DataFrame, meta: dict, fetch) -> pd.DataFrame:
+        """Fetch bars from the last stored date onward and append them"""
+        # The last stored bar may have been an intraday snapshot, so refetch it too
+        last = stored.index[-1]
+        delta = fetch(start=last.strftime('%Y-%m-%d'))
+        if delta.empty:
+            meta['fetched_at'] = time.time()
+            self._write_meta(symbol, meta)
+            return stored
+
+        covered_from = None if meta['covered_from'] is None else pd.Timestamp(meta['covered_from'])
+        # Only bars after the stored ones: the refetched last bar was already in the adjusted series
+        if _has_corporate_action(delta[delta.index > last]):
+            # history() back-adjusts every earlier bar for a dividend or split, so the
+            # stored bars are on the old basis; replace them instead of appending
+            full = fetch(period='max') if covered_from is None else fetch(start=covered_from.strftime('%Y-%m-%d'))
+            if full.empty:
+                return stored
+            self.save(symbol, full, covered_from)
+            return self.load(symbol)
+
+        kept = stored[stored.index < delta.index[0]]
+        merged = pd.concat([kept, delta[FIELDS]])
+        self.save(symbol, merged, covered_from)
+        return self.load(symbol)
+
+
+_price_store = None
+
+
+def get_price_store() -> PriceStore:
+    """Return the process-wide price store, created on first use"""
+    global _price_store
+    if _price_store is None:
+        _price_store = PriceStore()
+    return _price_store
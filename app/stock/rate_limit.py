@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+from requests.adapters import HTTPAdapter
+from typing import Dict
+from urllib.parse import urlparse
+
+# Requests per second allowed per host; hosts not listed get the limiter's default
+HOST_RATES = {
+    'query1.finance.yahoo.com': 2,
+    'query2.finance.yahoo.com': 2,
+    'finnhub.io': 1,
+    'finviz.com': 1,
+    'www.marketwatch.com': 1,
+    'feeds.marketwatch.com': 1,
+    'news.google.com': 1,
+    'seekingalpha.com': 0.5,
+    'newsapi.org': 1,
+}
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        """
+        Token-bucket rate limiter shared by every thread drawing from it
+
+        Args:
+            rate (float): Tokens added per second
+            capacity (float): Largest burst allowed
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available, without waiting"""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def wait_time(self) -> float:
+        """Seconds until the next token is available"""
+        with self._lock:
+            self._refill()
+            return max(0.0, (1 - self._tokens) / self.rate)
+
+    def acquire(self):
+        """Take a token, sleeping until one is available"""
+        while not self.try_acquire():
+            time.sleep(self.wait_time())
+
+    async def acquire_async(self):
+        """Take a token, yielding to the event loop while waiting"""
+        while not self.try_acquire():
+            await asyncio.sleep(self.wait_time())
+
+
+def host_of(url: str) -> str:
+    """Host name of a URL, or the string itself when it is already a host"""
+    return urlparse(url).hostname or url if '//' in url else url
+
+
+class HostRateLimiter:
+    def __init__(self, rates: Dict[str, float] = None, default_rate: float = 2.0, burst: float = 1):
+        """
+        One token bucket per host, created on first use
+
+        Args:
+            rates (Dict[str, float]): Requests per second by host, defaults to HOST_RATES
+            default_rate (float): Requests per second for hosts not in ``rates``
+            burst (float): Requests a host may receive back to back
+        """
+        self.rates = HOST_RATES if rates is None else rates
+        self.default_rate = default_rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str) -> TokenBucket:
+        """Bucket for the host of a URL"""
+        host = host_of(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rates.get(host, self.default_rate), self.burst)
+            return bucket
+
+    def acquire(self, url: str):
+        """Wait for a request slot on the URL's host"""
+        self.bucket(url).acquire()
+
+    async def acquire_async(self, url: str):
+        """Wait for a request slot on the URL's host without blocking the event loop"""
+        await self.bucket(url).acquire_async()
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    def __init__(self, limiter: HostRateLimiter, **kwargs):
+        """
+        HTTPAdapter that waits for a per-host slot before each request
+
+        Args:
+            limiter (HostRateLimiter): Limiter shared by every session using it
+            **kwargs: Passed to HTTPAdapter, e.g. pool_connections and pool_maxsize
+        """
+        self.limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, *args, **kwargs):
+        self.limiter.acquire(request.url)
+        return super().send(request, *args, **kwargs)
+
+
+_host_limiter = None
+
+
+def get_host_limiter() -> HostRateLimiter:
+    """Return the process-wide per-host limiter, created on first use"""
+    global _host_limiter
+    if _host_limiter is None:
+        _host_limiter = HostRateLimiter()
+    return _host_limiter
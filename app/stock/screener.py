@@ -0,0 +1,179 @@
+import pandas as pd
+import argparse
+import contextlib
+import importlib.util
+import multiprocessing
+import os
+from pathlib import Path
+from typing import Callable, Iterator, List
+
+from .stock_data import StockAnalyzer
+
+# Columns copied from technical_data into each screener row
+SCREEN_FIELDS = ['Current Price', 'RSI', 'SMA 20', 'SMA 50', 'SMA 200', 'MACD', 'MACD Signal',
+                 'Stochastic %K', 'Volume']
+
+# Set in each worker process; limits concurrent upstream fetches across the pool
+_fetch_slots = contextlib.nullcontext()
+
+
+def load_universe(path) -> List[str]:
+    """
+    Read a universe file of symbols
+
+    Args:
+        path (str or Path): Text file with one symbol per line, or a CSV with a
+            'symbol'/'Symbol'/'ticker' column
+
+    Returns:
+        List[str]: Upper-cased symbols, duplicates removed, file order kept
+    """
+    path = Path(path)
+    if path.suffix.lower() == '.csv':
+        frame = pd.read_csv(path)
+        column = next((c for c in frame.columns if c.lower() in ('symbol', 'ticker')), frame.columns[0])
+        symbols = frame[column].dropna().astype(str).tolist()
+    else:
+        symbols = [line.split('#')[0] for line in path.read_text().splitlines()]
+    symbols = [s.strip().upper() for s in symbols if s.strip()]
+    return list(dict.fromkeys(symbols))
+
+
+def _init_worker(fetch_slots):
+    global _fetch_slots
+    _fetch_slots = fetch_slots
+
+
+def screen_symbol(symbol: str, period: str = '1y') -> dict:
+    """
+    Compute technical indicators and signals for one symbol
+
+    Args:
+        symbol (str): Stock symbol
+        period (str): History period
+
+    Returns:
+        dict: Screener row; 'error' is set when no data could be computed
+    """
+    row = {'symbol': symbol}
+    try:
+        analyzer = StockAnalyzer(symbol)
+        with _fetch_slots:
+            result = analyzer.calculate_technical_indicators(period, latest_only=True)
+        technical_data = result[0] if result else {}
+        if not technical_data:
+            row['error'] = 'no data'
+            return row
+
+        signals = analyzer.analyze_stock_signals(technical_data)
+        for field in SCREEN_FIELDS:
+            row[field] = technical_data.get(field, 'N/A')
+        row['buy_signals'] = sum(s.startswith('BUY') for s in signals)
+        row['sell_signals'] = sum(s.startswith('SELL') for s in signals)
+        row['signals'] = '; '.join(signals)
+        row['error'] = ''
+    except Exception as e:
+        row['error'] = str(e)
+    return row
+
+
+def _screen_shard(args) -> List[dict]:
+    symbols, period = args
+    return [screen_symbol(symbol, period) for symbol in symbols]
+
+
+def _print_progress(done: int, total: int):
+    print(f"Screened {done}/{total} symbols")
+
+
+def iter_screen(symbols: List[str], period: str = '1y', processes: int = None,
+                max_concurrent_fetches: int = 8, shard_size: int = 25,
+                progress: Callable[[int, int], None] = _print_progress) -> Iterator[pd.DataFrame]:
+    """
+    Screen a universe across a process pool, yielding results as shards finish
+
+    Args:
+        symbols (List[str]): Symbols to screen
+        period (str): History period
+        processes (int): Worker processes, defaults to every core; 1 runs in-process
+        max_concurrent_fetches (int): Upstream fetches allowed at once across all workers
+        shard_size (int): Symbols handed to a worker per task
+        progress (Callable): Called with (done, total) after each shard, None to disable
+
+    Yields:
+        pd.DataFrame: Rows for one finished shard
+    """
+    processes = processes or os.cpu_count() or 1
+    shards = [(symbols[i:i + shard_size], period) for i in range(0, len(symbols), shard_size)]
+    done = 0
+
+    if processes == 1:
+        results = map(_screen_shard, shards)
+        pool = contextlib.nullcontext()
+    else:
+        fetch_slots = multiprocessing.BoundedSemaphore(max_concurrent_fetches)
+        pool = multiprocessing.Pool(processes, initializer=_init_worker, initargs=(fetch_slots,))
+        results = pool.imap_unordered(_screen_shard, shards)
+
+    with pool:
+        for rows in results:
+            done += len(rows)
+            if progress:
+                progress(done, len(symbols))
+            yield pd.DataFrame(rows)
+
+
+def parquet_available() -> bool:
+    """Whether pandas has a Parquet engine (pyarrow or fastparquet) to write with"""
+    return any(importlib.util.find_spec(engine) is not None for engine in ('pyarrow', 'fastparquet'))
+
+
+def screen_universe(symbols: List[str], output=None, **kwargs) -> pd.DataFrame:
+    """
+    Screen a universe and collect the results
+
+    Args:
+        symbols (List[str]): Symbols to screen
+        output (str or Path): Optional .parquet or .csv file to write; .parquet
+            falls back to .csv when no Parquet engine is installed
+        **kwargs: Passed to iter_screen
+
+    Returns:
+        pd.DataFrame: One row per symbol, sorted by symbol
+    """
+    if output:
+        output = Path(output)
+        # Checked before the scan so a long run never ends in an ImportError
+        if output.suffix.lower() == '.parquet' and not parquet_available():
+            output = output.with_suffix('.csv')
+            print(f"No Parquet engine installed (pyarrow or fastparquet), writing {output} instead")
+
+    frames = list(iter_screen(symbols, **kwargs))
+    results = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=['symbol'])
+    results = results.sort_values('symbol', ignore_index=True)
+
+    if output:
+        if output.suffix.lower() == '.parquet':
+            results.to_parquet(output, index=False)
+        else:
+            results.to_csv(output, index=False)
+        print(f"Screener results saved to {output}")
+    return results
+
+
+def main():
+    """Command-line entry point for nightly universe scans"""
+    parser = argparse.ArgumentParser(description='Screen a universe of stock symbols')
+    parser.add_argument('universe', help='Text or CSV file of symbols')
+    parser.add_argument('--output', help='Write results to a .parquet or .csv file')
+    parser.add_argument('--period', default='1y', help='History period (default: 1y)')
+    parser.add_argument('--processes', type=int, default=None, help='Worker processes (default: all cores)')
+    parser.add_argument('--max-fetches', type=int, default=8, help='Concurrent upstream fetches')
+    args = parser.parse_args()
+
+    symbols = load_universe(args.universe)
+    print(f"Screening {len(symbols)} symbols...")
+    results = screen_universe(symbols, output=args.output, period=args.period,
+                              processes=args.processes, max_concurrent_fetches=args.max_fetches)
+    if not args.output:
+        print(results.to_string(index=False))
@@ -0,0 +1,152 @@
+import pandas as pd
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
+
+# Report name -> yf.Ticker attribute, in the order get_financial_statements returns them
+STATEMENTS = {
+    'Income Statement': 'financials',
+    'Balance Sheet': 'balance_sheet',
+    'Cash Flow': 'cashflow',
+}
+
+
+def fetch_financial_statements(ticker) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch the income statement, balance sheet and cash flow concurrently
+
+    Args:
+        ticker (yf.Ticker): Ticker to read the statements from
+
+    Returns:
+        Dict[str, pd.DataFrame]: Full statements keyed by report name
+    """
+    with ThreadPoolExecutor(max_workers=len(STATEMENTS)) as executor:
+        futures = {name: executor.submit(getattr, ticker, attr) for name, attr in STATEMENTS.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _period_ends(frame: pd.DataFrame) -> pd.DatetimeIndex:
+    if frame is None or frame.empty:
+        return pd.DatetimeIndex([])
+    dates = pd.to_datetime(pd.Index(frame.columns), errors='coerce')
+    dates = dates[~dates.isna()].sort_values()
+    return dates.tz_localize(None) if dates.tz is not None else dates
+
+
+def latest_fiscal_period(statements: Dict[str, pd.DataFrame]) -> Optional[pd.Timestamp]:
+    """Most recent period-end date across the statement columns"""
+    ends = [_period_ends(frame) for frame in statements.values()]
+    ends = [dates[-1] for dates in ends if len(dates)]
+    return max(ends) if ends else None
+
+
+def reporting_interval(statements: Dict[str, pd.DataFrame]) -> pd.Timedelta:
+    """Typical spacing between reported periods: about 91 days quarterly, 365 annual"""
+    for frame in statements.values():
+        dates = _period_ends(frame)
+        if len(dates) >= 2:
+            return pd.Timedelta(dates.to_series().diff().median())
+    return pd.Timedelta(days=365)
+
+
+class FinancialStatementsCache:
+    def __init__(self, root=None, filing_lag_days: int = 90, retry_days: int = 1):
+        """
+        Financial statements cached per symbol and fiscal period
+
+        An entry stays valid until the next filing is due, i.e. one reporting
+        interval after the latest period end plus the filing lag. Once that date
+        passes the statements are refetched; if the new filing is not out yet,
+        the check is retried every ``retry_days``.
+
+        Args:
+            root (str or Path): Directory to persist entries in, None for memory only
+            filing_lag_days (int): Days a company takes to file after a period ends
+            retry_days (int): Days between checks once a filing is overdue
+        """
+        self.root = Path(root) if root is not None else None
+        self.filing_lag = pd.Timedelta(days=filing_lag_days)
+        self.retry = pd.Timedelta(days=retry_days)
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _path(self, symbol: str) -> Path:
+        return self.root / f"{re.sub(r'[^\w.^=-]', '_', symbol)}.pkl"
+
+    def _next_refresh(self, statements: Dict[str, pd.DataFrame], now: pd.Timestamp) -> pd.Timestamp:
+        period_end = latest_fiscal_period(statements)
+        if period_end is None:
+            return now + self.retry
+        due = period_end + reporting_interval(statements) + self.filing_lag
+        return due if due > now else now + self.retry
+
+    def get(self, symbol: str, now: pd.Timestamp = None) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Cached statements for a symbol, or None when a new filing may be out
+
+        Args:
+            symbol (str): Stock symbol
+            now (pd.Timestamp): Reference time, defaults to now
+
+        Returns:
+            Optional[Dict[str, pd.DataFrame]]: Statements keyed by report name
+        """
+        symbol = symbol.upper()
+        now = pd.Timestamp.now() if now is None else now
+        with self._lock:
+            entry = self._entries.get(symbol)
+        if entry is None and self.root is not None and self._path(symbol).exists():
+            try:
+                entry = pd.read_pickle(self._path(symbol))
+                with self._lock:
+                    self._entries[symbol] = entry
+            except Exception:
+                entry = None
+        if entry is None or now >= entry['next_refresh']:
+            return None
+        return entry['statements']
+
+    def put(self, symbol: str, statements: Dict[str, pd.DataFrame], now: pd.Timestamp = None):
+        """Store freshly fetched statements and schedule their next refresh"""
+        symbol = symbol.upper()
+        now = pd.Timestamp.now() if now is None else now
+        entry = {
+            'fiscal_period': latest_fiscal_period(statements),
+            'next_refresh': self._next_refresh(statements, now),
+            'statements': statements,
+        }
+        with self._lock:
+            self._entries[symbol] = entry
+        if self.root is not None:
+            try:
+                self.root.mkdir(parents=True, exist_ok=True)
+                pd.to_pickle(entry, self._path(symbol))
+            except OSError as e:
+                print(f"Could not persist statements for {symbol}: {e}")
+
+    def invalidate(self, symbol: str = None):
+        """Drop one symbol, or every symbol when none is given"""
+        with self._lock:
+            symbols = list(self._entries) if symbol is None else [symbol.upper()]
+            for key in symbols:
+                self._entries.pop(key, None)
+        if self.root is not None:
+            paths = self.root.glob('*.pkl') if symbol is None else [self._path(symbol.upper())]
+            for path in paths:
+                path.unlink(missing_ok=True)
+
+
+_statements_cache = None
+
+
+def get_statements_cache() -> FinancialStatementsCache:
+    """Return the process-wide statements cache, created on first use"""
+    global _statements_cache
+    if _statements_cache is None:
+        base = os.getenv('STOCK_AGENT_DATA_DIR', Path.home() / '.cache' / 'stock_agent')
+        _statements_cache = FinancialStatementsCache(Path(base) / 'statements')
+    return _statements_cache
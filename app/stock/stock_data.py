@@ -4,26 +4,47 @@ import numpy as np
 import requests
 from datetime import datetime, timedelta
 import warnings
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 
 from .stock_symbol import quick_symbol_lookup
 from .stock_news import get_news
+from .ticker_cache import get_ticker_info
+from .alpha_vantage import get_alpha_vantage_client
+from .price_store import get_price_store
+from .backtest import backtest_history
+from .statements import get_statements_cache, fetch_financial_statements
+from .timeframes import DEFAULT_TIMEFRAMES, is_intraday, source_interval, multi_timeframe_indicators
+from .indicators import (
+    compute_indicators,
+    format_technical_data,
+    latest_technical_indicators,
+    batch_technical_indicators,
+    IncrementalIndicators,
+)
 warnings.filterwarnings('ignore')
 
 class StockAnalyzer:
-    def __init__(self, symbol):
+    def __init__(self, symbol, price_store=None):
         """
         Initialize the Stock Analyzer with a stock symbol
         
         Args:
             symbol (str): Stock symbol (e.g., 'AAPL', 'MSFT')
+            price_store (PriceStore, optional): Local OHLCV store, defaults to the shared one
         """
         self.symbol = symbol.upper()
         self.stock = yf.Ticker(self.symbol)
+        self.price_store = price_store if price_store is not None else get_price_store()
+    
+    def get_history(self, period='1y'):
+        """Get daily OHLCV bars, reading the local store before going upstream"""
+        return self.price_store.get_history(self.symbol, self.stock.history, period)
         
     def get_basic_info(self):
         """Get basic stock information"""
         try:
-            info = self.stock.info
+            info = get_ticker_info(self.symbol, self.stock)
             basic_data = {
                 'Symbol': self.symbol,
                 'Company Name': info.get('longName', 'N/A'),
@@ -41,7 +62,7 @@ class StockAnalyzer:
     def get_fundamental_data(self):
         """Get fundamental analysis data"""
         try:
-            info = self.stock.info
+            info = get_ticker_info(self.symbol, self.stock)
             
             # Financial ratios and metrics
             fundamental_data = {
@@ -88,92 +109,125 @@ class StockAnalyzer:
             print(f"Error getting fundamental data: {e}")
             return {}
     
-    def calculate_technical_indicators(self, period='1y'):
-        """Calculate technical indicators"""
+    def calculate_technical_indicators(self, period='1y', latest_only=False, indicators=None):
+        """
+        Calculate technical indicators
+        
+        Args:
+            period (str): History period to fetch
+            latest_only (bool): Compute only the latest values from the trailing
+                windows and return the raw history without indicator columns
+            indicators (list, optional): Registered indicator names to attach,
+                e.g. ['RSI', 'MACD'] or ['ATR_14', 'OBV']; defaults to the full set
+        """
         try:
             # Get historical data
-            hist = self.stock.history(period=period)
+            hist = self.get_history(period)
             
             if hist.empty:
                 return {}
             
-            # Calculate moving averages
-            hist['SMA_20'] = hist['Close'].rolling(window=20).mean()
-            hist['SMA_50'] = hist['Close'].rolling(window=50).mean()
-            hist['SMA_200'] = hist['Close'].rolling(window=200).mean()
-            hist['EMA_12'] = hist['Close'].ewm(span=12).mean()
-            hist['EMA_26'] = hist['Close'].ewm(span=26).mean()
-            
-            # Calculate RSI
-            delta = hist['Close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            hist['RSI'] = 100 - (100 / (1 + rs))
-            
-            # Calculate MACD
-            hist['MACD'] = hist['EMA_12'] - hist['EMA_26']
-            hist['MACD_Signal'] = hist['MACD'].ewm(span=9).mean()
-            hist['MACD_Histogram'] = hist['MACD'] - hist['MACD_Signal']
-            
-            # Calculate Bollinger Bands
-            hist['BB_Middle'] = hist['Close'].rolling(window=20).mean()
-            bb_std = hist['Close'].rolling(window=20).std()
-            hist['BB_Upper'] = hist['BB_Middle'] + (bb_std * 2)
-            hist['BB_Lower'] = hist['BB_Middle'] - (bb_std * 2)
-            
-            # Calculate Stochastic Oscillator
-            low_14 = hist['Low'].rolling(window=14).min()
-            high_14 = hist['High'].rolling(window=14).max()
-            hist['%K'] = 100 * ((hist['Close'] - low_14) / (high_14 - low_14))
-            hist['%D'] = hist['%K'].rolling(window=3).mean()
+            return self._technical_from_history(hist, latest_only, indicators)
+        except Exception as e:
+            print(f"Error calculating technical indicators: {e}")
+            return {}, pd.DataFrame()
+    
+    def _technical_from_history(self, hist, latest_only=False, indicators=None):
+        """Compute technical_data from already fetched history"""
+        if latest_only:
+            return latest_technical_indicators(hist), hist
+        
+        # Each shared intermediate (rolling 20 mean/std, EMAs, deltas) is computed once
+        prices = {field: hist[field].to_numpy() for field in ['Close', 'High', 'Low', 'Volume']}
+        for name, values in compute_indicators(prices, indicators).items():
+            hist[name] = values
+        
+        # Get latest values
+        latest = hist.iloc[-1]
+        
+        technical_data = format_technical_data(latest, hist['High'].max(), hist['Low'].min())
+        
+        return technical_data, hist
+    
+    def calculate_multi_timeframe_indicators(self, timeframes=DEFAULT_TIMEFRAMES, period=None):
+        """
+        Calculate technical indicators on several timeframes from one download
+        
+        The finest requested interval is fetched once and resampled into the
+        coarser timeframes, e.g. 60m bars into 1h, 1d and 1w.
+        
+        Args:
+            timeframes (list): Timeframes such as ['1h', '1d', '1w']
+            period (str, optional): History period; defaults to the longest
+                Yahoo serves at the source interval
             
-            # Get latest values
-            latest = hist.iloc[-1]
+        Returns:
+            dict: technical_data per timeframe
+        """
+        try:
+            interval, max_period = source_interval(timeframes)
+            hist = self.stock.history(period=period or max_period, interval=interval)
+            if hist.empty:
+                return {}
+            return multi_timeframe_indicators(hist, timeframes)
+        except Exception as e:
+            print(f"Error calculating multi-timeframe indicators: {e}")
+            return {}
+    
+    def create_indicator_stream(self, period='1y'):
+        """
+        Seed a streaming indicator state from historical data
+        
+        Args:
+            period (str): History period used to warm up the indicators
             
-            technical_data = {
-                'Current Price': round(latest['Close'], 2),
-                'SMA 20': round(latest['SMA_20'], 2) if not pd.isna(latest['SMA_20']) else 'N/A',
-                'SMA 50': round(latest['SMA_50'], 2) if not pd.isna(latest['SMA_50']) else 'N/A',
-                'SMA 200': round(latest['SMA_200'], 2) if not pd.isna(latest['SMA_200']) else 'N/A',
-                'EMA 12': round(latest['EMA_12'], 2) if not pd.isna(latest['EMA_12']) else 'N/A',
-                'EMA 26': round(latest['EMA_26'], 2) if not pd.isna(latest['EMA_26']) else 'N/A',
-                'RSI': round(latest['RSI'], 2) if not pd.isna(latest['RSI']) else 'N/A',
-                'MACD': round(latest['MACD'], 4) if not pd.isna(latest['MACD']) else 'N/A',
-                'MACD Signal': round(latest['MACD_Signal'], 4) if not pd.isna(latest['MACD_Signal']) else 'N/A',
-                'Bollinger Upper': round(latest['BB_Upper'], 2) if not pd.isna(latest['BB_Upper']) else 'N/A',
-                'Bollinger Lower': round(latest['BB_Lower'], 2) if not pd.isna(latest['BB_Lower']) else 'N/A',
-                'Stochastic %K': round(latest['%K'], 2) if not pd.isna(latest['%K']) else 'N/A',
-                'Stochastic %D': round(latest['%D'], 2) if not pd.isna(latest['%D']) else 'N/A',
-                'Volume': latest['Volume'],
-                '52 Week High': round(hist['High'].max(), 2),
-                '52 Week Low': round(hist['Low'].min(), 2)
-            }
+        Returns:
+            IncrementalIndicators: State whose update(bar) returns technical_data in O(1)
+        """
+        try:
+            hist = self.get_history(period)
+            return IncrementalIndicators.from_history(hist)
+        except Exception as e:
+            print(f"Error seeding indicator stream: {e}")
+            return IncrementalIndicators()
+    
+    def backtest_signals(self, period='10y', cost_bps=10):
+        """
+        Backtest the analyze_stock_signals rules on every bar of the history
+        
+        Args:
+            period (str): History period to test over
+            cost_bps (float): One-way trading cost in basis points
             
-            return technical_data, hist
+        Returns:
+            pd.DataFrame: Return, drawdown, hit rate, trades and exposure per rule
+        """
+        try:
+            hist = self.get_history(period)
+            if hist.empty:
+                return pd.DataFrame()
+            return backtest_history(hist, cost_bps=cost_bps)
         except Exception as e:
-            print(f"Error calculating technical indicators: {e}")
-            return {}, pd.DataFrame()
+            print(f"Error backtesting signals: {e}")
+            return pd.DataFrame()
     
     def get_financial_statements(self):
         """Get financial statements"""
         try:
-            financials = {}
+            # Statements only change when a new filing is out, so serve them from
+            # the cache and fetch all three concurrently on a miss
+            cache = get_statements_cache()
+            statements = cache.get(self.symbol)
+            if statements is None:
+                statements = fetch_financial_statements(self.stock)
+                # An all-empty answer is usually a failed fetch, not worth remembering
+                if any(statement is not None and not statement.empty for statement in statements.values()):
+                    cache.put(self.symbol, statements)
             
-            # Income Statement
-            income_stmt = self.stock.financials
-            if not income_stmt.empty:
-                financials['Income Statement'] = income_stmt.head()
-            
-            # Balance Sheet
-            balance_sheet = self.stock.balance_sheet
-            if not balance_sheet.empty:
-                financials['Balance Sheet'] = balance_sheet.head()
-            
-            # Cash Flow Statement
-            cash_flow = self.stock.cashflow
-            if not cash_flow.empty:
-                financials['Cash Flow'] = cash_flow.head()
+            financials = {}
+            for name, statement in statements.items():
+                if statement is not None and not statement.empty:
+                    financials[name] = statement.head()
             
             return financials
         except Exception as e:
@@ -229,21 +283,19 @@ class StockAnalyzer:
             print(f"Error analyzing signals: {e}")
             return []
     
-    def generate_report(self):
-        """Generate comprehensive stock analysis report"""
+    def _print_report(self, basic_info, fundamental_data, technical_data, signals):
+        """Print the report sections gathered by generate_report"""
         print(f"\n{'='*60}")
         print(f"COMPREHENSIVE STOCK ANALYSIS REPORT")
         print(f"{'='*60}")
         
         # Basic Info
         print(f"\n{'BASIC INFORMATION':-^60}")
-        basic_info = self.get_basic_info()
         for key, value in basic_info.items():
             print(f"{key:<20}: {value}")
         
         # Fundamental Analysis
         print(f"\n{'FUNDAMENTAL ANALYSIS':-^60}")
-        fundamental_data = self.get_fundamental_data()
         for key, value in fundamental_data.items():
             if isinstance(value, float):
                 if abs(value) >= 1:
@@ -255,7 +307,6 @@ class StockAnalyzer:
         
         # Technical Analysis
         print(f"\n{'TECHNICAL ANALYSIS':-^60}")
-        technical_data, hist_data = self.calculate_technical_indicators()
         for key, value in technical_data.items():
             if isinstance(value, (int, float)):
                 print(f"{key:<20}: {value:,.2f}")
@@ -264,7 +315,6 @@ class StockAnalyzer:
         
         # Trading Signals
         print(f"\n{'TRADING SIGNALS':-^60}")
-        signals = self.analyze_stock_signals(technical_data)
         if signals:
             for i, signal in enumerate(signals, 1):
                 print(f"{i}. {signal}")
@@ -278,6 +328,19 @@ class StockAnalyzer:
         #     print(recommendations[['To Grade', 'From Grade', 'Action']].to_string())
         # else:
         #     print("No recent analyst recommendations available")
+    
+    def generate_report(self, latest_only=False):
+        """
+        Generate comprehensive stock analysis report
+        
+        Args:
+            latest_only (bool): Skip the full indicator columns in historical_data
+        """
+        basic_info = self.get_basic_info()
+        fundamental_data = self.get_fundamental_data()
+        technical_data, hist_data = self.calculate_technical_indicators(latest_only=latest_only)
+        signals = self.analyze_stock_signals(technical_data)
+        self._print_report(basic_info, fundamental_data, technical_data, signals)
         
         return {
             'basic_info': basic_info,
@@ -286,18 +349,113 @@ class StockAnalyzer:
             'signals': signals,
             'historical_data': hist_data
         }
+    
+    async def generate_report_async(self, latest_only=False, include_news=True, period='1y', timeframes=None):
+        """
+        Generate the report with all upstream fetches running concurrently
+        
+        Info, history, financial statements and news are fetched in a worker
+        pool. News starts as soon as info has supplied the company name, so the
+        total latency approaches that of the slowest source.
+        
+        Args:
+            latest_only (bool): Skip the full indicator columns in historical_data
+            include_news (bool): Also fetch news through get_news
+            period (str): History period for the technical indicators
+            timeframes (list, optional): Also compute indicators on these
+                timeframes, e.g. ['1d', '1w']; daily and weekly are built from
+                the daily history, only intraday ones (e.g. '1h') add a fetch
+            
+        Returns:
+            dict: generate_report's result plus 'financial_statements' and 'news',
+                and 'timeframes' when requested
+        """
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=5, thread_name_prefix=f'report-{self.symbol}') as executor:
+            def run(func, *args):
+                return loop.run_in_executor(executor, func, *args)
+            
+            info_future = run(get_ticker_info, self.symbol, self.stock)
+            history_future = run(self.get_history, period)
+            statements_future = run(self.get_financial_statements)
+            
+            async def fetch_news():
+                # Google News searches by company name, which comes from info
+                try:
+                    company_name = (await info_future).get('longName', 'N/A')
+                except Exception:
+                    company_name = None
+                return await run(get_news, self.symbol, company_name)
+            
+            jobs = {'info': info_future, 'history': history_future, 'statements': statements_future}
+            intraday = [timeframe for timeframe in timeframes or [] if is_intraday(timeframe)]
+            if intraday:
+                jobs['intraday'] = run(self.calculate_multi_timeframe_indicators, intraday)
+            if include_news:
+                jobs['news'] = fetch_news()
+            results = dict(zip(jobs, await asyncio.gather(*jobs.values(), return_exceptions=True)))
+        
+        # Info is cached now, so these only reshape it
+        basic_info = self.get_basic_info()
+        fundamental_data = self.get_fundamental_data()
+        
+        technical_data, hist_data = {}, pd.DataFrame()
+        try:
+            hist = results['history']
+            if isinstance(hist, Exception):
+                raise hist
+            if not hist.empty:
+                technical_data, hist_data = self._technical_from_history(hist, latest_only)
+        except Exception as e:
+            print(f"Error calculating technical indicators: {e}")
+        signals = self.analyze_stock_signals(technical_data)
+        self._print_report(basic_info, fundamental_data, technical_data, signals)
+        
+        report = {
+            'basic_info': basic_info,
+            'fundamental_data': fundamental_data,
+            'technical_data': technical_data,
+            'signals': signals,
+            'historical_data': hist_data,
+            'financial_statements': results['statements'] if not isinstance(results['statements'], Exception) else {},
+        }
+        if timeframes:
+            report['timeframes'] = self._report_timeframes(timeframes, results)
+        if include_news:
+            news = results['news']
+            if isinstance(news, Exception):
+                print(f"Error getting news: {news}")
+                news = pd.DataFrame()
+            report['news'] = news
+        return report
+    
+    @staticmethod
+    def _report_timeframes(timeframes, results):
+        """technical_data per requested timeframe from generate_report_async's fetches"""
+        by_timeframe = {}
+        daily = [timeframe for timeframe in timeframes if not is_intraday(timeframe)]
+        hist = results['history']
+        if daily and not isinstance(hist, Exception) and not hist.empty:
+            try:
+                by_timeframe.update(multi_timeframe_indicators(hist, daily))
+            except Exception as e:
+                print(f"Error calculating multi-timeframe indicators: {e}")
+        intraday = results.get('intraday')
+        if isinstance(intraday, dict):
+            by_timeframe.update(intraday)
+        return {timeframe: by_timeframe[timeframe] for timeframe in timeframes if timeframe in by_timeframe}
 
 # Alternative API-based approach for additional data
 def get_alpha_vantage_data(symbol, api_key):
     """
     Get stock data using Alpha Vantage API (requires free API key)
     Register at: https://www.alphavantage.co/support/#api-key
+    
+    Responses are cached on disk for a day, so repeat lookups do not use quota.
     """
     try:
         # Company Overview
-        url = f'https://www.alphavantage.co/query?function=OVERVIEW&symbol={symbol}&apikey={api_key}'
-        response = requests.get(url)
-        data = response.json()
+        data = get_alpha_vantage_client(api_key).query('OVERVIEW', symbol=symbol)
         
         if 'Error Message' not in data and data:
             overview_data = {
@@ -341,12 +499,15 @@ def main():
     print(f"\n{'BATCH ANALYSIS EXAMPLE':-^60}")
     symbols = ['AAPL', 'MSFT', 'GOOGL', 'TSLA', 'AMZN']
     
+    # One bulk download and one vectorized pass for every symbol's indicators
+    batch_technical = batch_technical_indicators(symbols)
+    
     batch_results = {}
     for sym in symbols:
         try:
             analyzer = StockAnalyzer(sym)
             basic_info = analyzer.get_basic_info()
-            technical_data, _ = analyzer.calculate_technical_indicators()
+            technical_data = batch_technical.get(sym, {})
             
             batch_results[sym] = {
                 'Price': basic_info.get('Current Price', 'N/A'),
@@ -2,21 +2,49 @@ import yfinance as yf
 import requests
 import pandas as pd
 import json
-from datetime import datetime, timedelta
-import time
-from bs4 import BeautifulSoup
+from datetime import datetime, timedelta, timezone
+from bs4 import BeautifulSoup, SoupStrainer
 import feedparser
 import re
 from urllib.parse import urljoin, urlparse
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+from .alpha_vantage import get_alpha_vantage_client
+from .article_store import article_key, get_article_store
+from .near_duplicates import MinHashLSH, article_text
+from .http_transport import get_http_transport
+from .rate_limit import get_host_limiter
 warnings.filterwarnings('ignore')
 
+# lxml builds the scraped pages' trees several times faster than html.parser; use it when installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Only these elements are turned into soup; the rest of each page is skipped
+# The strainer sees the raw class attribute ('fullview-news-outer news-table'), so match on containment
+FINVIZ_NEWS = SoupStrainer('table', class_=lambda value: bool(value) and 'fullview-news-outer' in value)
+SEEKING_ALPHA_ARTICLES = SoupStrainer('article')
+
+# Hosts of sources that bypass the shared transport, which paces the others itself;
+# Alpha Vantage is paced by its own client
+SOURCE_HOSTS = {
+    'yahoo': 'query2.finance.yahoo.com',
+}
+
 class StockNewsExtractor:
     def __init__(self):
         """Initialize the Stock News Extractor"""
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        # Pooled, rate-limited session; unchanged pages and feeds come back as 304 and are not re-parsed
+        self.transport = get_http_transport()
+        # Articles already seen per symbol, so each fetch only processes new ones
+        self.store = get_article_store()
         
     def get_yahoo_finance_news(self, symbol, limit=10):
         """
@@ -64,51 +92,70 @@ class StockNewsExtractor:
         """
         try:
             url = f"https://finviz.com/quote.ashx?t={symbol}"
-            response = requests.get(url, headers=self.headers)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            news_list = []
-            news_table = soup.find('table', class_='fullview-news-outer')
-            
-            if news_table:
-                rows = news_table.find_all('tr')
-                for i, row in enumerate(rows[:limit]):
-                    try:
-                        # Extract date/time
-                        date_cell = row.find('td', align='right')
-                        if date_cell:
-                            date_text = date_cell.get_text(strip=True)
-                        else:
-                            date_text = ''
-                        
-                        # Extract title and link
-                        link_cell = row.find('a')
-                        if link_cell:
-                            title = link_cell.get_text(strip=True)
-                            link = link_cell.get('href', '')
-                            
-                            # Extract source
-                            source_span = row.find('span', style=lambda x: x and 'color:#666666' in x)
-                            source = source_span.get_text(strip=True) if source_span else 'Finviz'
-                            
-                            news_item = {
-                                'title': title,
-                                'summary': '',
-                                'url': link,
-                                'published': date_text,
-                                'source': source,
-                                'symbol': symbol,
-                                'extraction_method': 'Finviz Scraping'
-                            }
-                            news_list.append(news_item)
-                    except Exception as e:
-                        continue
-            
-            return news_list
+            news_list = self.transport.fetch(url, lambda response: self._parse_finviz(response.content, symbol),
+                                             headers=self.headers)
+            return [dict(news_item) for news_item in news_list[:limit]]
         except Exception as e:
             print(f"Error scraping Finviz news for {symbol}: {e}")
             return []
     
+    def _parse_finviz(self, content, symbol):
+        """Every article in a Finviz quote page's news table"""
+        # The news table sits far down the page; start parsing at its opening tag
+        marker = content.find(b'fullview-news-outer')
+        if marker != -1:
+            content = content[max(content.rfind(b'<table', 0, marker), 0):]
+        soup = BeautifulSoup(content, HTML_PARSER, parse_only=FINVIZ_NEWS)
+        
+        news_list = []
+        news_table = soup.find('table', class_='fullview-news-outer')
+        
+        if news_table:
+            rows = news_table.find_all('tr')
+            # Only the first row of each day carries its date ('Jan-02-24 09:30AM' or
+            # 'Today 09:30AM'); later rows give just the time, so carry the date forward
+            day = ''
+            for row in rows:
+                try:
+                    # Extract date/time
+                    date_cell = row.find('td', align='right')
+                    if date_cell:
+                        date_text = date_cell.get_text(' ', strip=True)
+                    else:
+                        date_text = ''
+                    if ' ' in date_text:
+                        day, clock = date_text.split(' ', 1)
+                        if day.lower() == 'today':
+                            day = datetime.now().strftime('%b-%d-%y')
+                        date_text = f"{day} {clock}"
+                    elif date_text and day:
+                        date_text = f"{day} {date_text}"
+                    
+                    # Extract title and link
+                    link_cell = row.find('a')
+                    if link_cell:
+                        title = link_cell.get_text(strip=True)
+                        link = link_cell.get('href', '')
+                        
+                        # Extract source
+                        source_span = row.find('span', style=lambda x: x and 'color:#666666' in x)
+                        source = source_span.get_text(strip=True) if source_span else 'Finviz'
+                        
+                        news_item = {
+                            'title': title,
+                            'summary': '',
+                            'url': link,
+                            'published': date_text,
+                            'source': source,
+                            'symbol': symbol,
+                            'extraction_method': 'Finviz Scraping'
+                        }
+                        news_list.append(news_item)
+                except Exception as e:
+                    continue
+        
+        return news_list
+    
     def get_marketwatch_news(self, symbol, limit=10):
         """
         Get news from MarketWatch RSS feed
@@ -123,7 +170,7 @@ class StockNewsExtractor:
         try:
             # MarketWatch RSS feed for specific stock
             url = f"https://feeds.marketwatch.com/marketwatch/companyNews/{symbol}/"
-            feed = feedparser.parse(url)
+            feed = self.transport.fetch(url, lambda response: feedparser.parse(response.content))
             
             news_list = []
             for i, entry in enumerate(feed.entries[:limit]):
@@ -143,7 +190,7 @@ class StockNewsExtractor:
             print(f"Error getting MarketWatch news for {symbol}: {e}")
             return []
     
-    def get_newsapi_stock_news(self, symbol, company_name, api_key, limit=10):
+    def get_newsapi_stock_news(self, symbol, company_name, api_key, limit=10, since=None):
         """
         Get news using NewsAPI (requires API key from newsapi.org)
         
@@ -152,6 +199,7 @@ class StockNewsExtractor:
             company_name (str): Company name for search
             api_key (str): NewsAPI key
             limit (int): Number of articles
+            since (float): Only articles published after this epoch time (optional)
             
         Returns:
             list: List of news articles
@@ -167,8 +215,10 @@ class StockNewsExtractor:
                 'pageSize': limit,
                 'apiKey': api_key
             }
+            if since:
+                params['from'] = datetime.fromtimestamp(since, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
             
-            response = requests.get(url, params=params)
+            response = self.transport.get(url, params=params)
             data = response.json()
             
             news_list = []
@@ -203,54 +253,59 @@ class StockNewsExtractor:
         """
         try:
             url = f"https://seekingalpha.com/symbol/{symbol}/news"
-            response = requests.get(url, headers=self.headers)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            news_list = []
-            # Look for article containers
-            articles = soup.find_all('article', limit=limit)
-            
-            for article in articles:
-                try:
-                    # Extract title
-                    title_elem = article.find('a', {'data-test': 'article-title'})
-                    if not title_elem:
-                        title_elem = article.find('h3') or article.find('h2')
-                    
-                    title = title_elem.get_text(strip=True) if title_elem else ''
-                    
-                    # Extract link
-                    link = title_elem.get('href', '') if title_elem else ''
-                    if link and not link.startswith('http'):
-                        link = f"https://seekingalpha.com{link}"
-                    
-                    # Extract summary
-                    summary_elem = article.find('p') or article.find('div', class_='summary')
-                    summary = summary_elem.get_text(strip=True) if summary_elem else ''
-                    
-                    # Extract date
-                    date_elem = article.find('time') or article.find('span', class_='date')
-                    date = date_elem.get_text(strip=True) if date_elem else ''
-                    
-                    if title:
-                        news_item = {
-                            'title': title,
-                            'summary': summary,
-                            'url': link,
-                            'published': date,
-                            'source': 'Seeking Alpha',
-                            'symbol': symbol,
-                            'extraction_method': 'Seeking Alpha Scraping'
-                        }
-                        news_list.append(news_item)
-                except Exception as e:
-                    continue
-            
-            return news_list
+            news_list = self.transport.fetch(url, lambda response: self._parse_seeking_alpha(response.content, symbol),
+                                             headers=self.headers)
+            return [dict(news_item) for news_item in news_list[:limit]]
         except Exception as e:
             print(f"Error scraping Seeking Alpha news for {symbol}: {e}")
             return []
     
+    def _parse_seeking_alpha(self, content, symbol):
+        """Articles on a Seeking Alpha symbol news page"""
+        soup = BeautifulSoup(content, HTML_PARSER, parse_only=SEEKING_ALPHA_ARTICLES)
+        
+        news_list = []
+        # Look for article containers
+        articles = soup.find_all('article')
+        
+        for article in articles:
+            try:
+                # Extract title
+                title_elem = article.find('a', {'data-test': 'article-title'})
+                if not title_elem:
+                    title_elem = article.find('h3') or article.find('h2')
+        
+                title = title_elem.get_text(strip=True) if title_elem else ''
+        
+                # Extract link
+                link = title_elem.get('href', '') if title_elem else ''
+                if link and not link.startswith('http'):
+                    link = f"https://seekingalpha.com{link}"
+        
+                # Extract summary
+                summary_elem = article.find('p') or article.find('div', class_='summary')
+                summary = summary_elem.get_text(strip=True) if summary_elem else ''
+        
+                # Extract date
+                date_elem = article.find('time') or article.find('span', class_='date')
+                date = date_elem.get_text(strip=True) if date_elem else ''
+        
+                if title:
+                    news_item = {
+                        'title': title,
+                        'summary': summary,
+                        'url': link,
+                        'published': date,
+                        'source': 'Seeking Alpha',
+                        'symbol': symbol,
+                        'extraction_method': 'Seeking Alpha Scraping'
+                    }
+                    news_list.append(news_item)
+            except Exception as e:
+                continue
+        
+        return news_list
+        
     def get_google_news(self, symbol, company_name, limit=10):
         """
         Get news from Google News RSS feed
@@ -266,9 +321,10 @@ class StockNewsExtractor:
         try:
             # Google News RSS feed
             query = f"{company_name} {symbol} stock"
-            url = f"https://news.google.com/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"
+            url = "https://news.google.com/rss/search"
+            params = {'q': query, 'hl': 'en-US', 'gl': 'US', 'ceid': 'US:en'}
             
-            feed = feedparser.parse(url)
+            feed = self.transport.fetch(url, lambda response: feedparser.parse(response.content), params=params)
             
             news_list = []
             for i, entry in enumerate(feed.entries[:limit]):
@@ -301,16 +357,7 @@ class StockNewsExtractor:
             list: List of news articles
         """
         try:
-            url = f"https://www.alphavantage.co/query"
-            params = {
-                'function': 'NEWS_SENTIMENT',
-                'tickers': symbol,
-                'limit': limit,
-                'apikey': api_key
-            }
-            
-            response = requests.get(url, params=params)
-            data = response.json()
+            data = get_alpha_vantage_client(api_key).query('NEWS_SENTIMENT', tickers=symbol, limit=limit)
             
             news_list = []
             if 'feed' in data:
@@ -371,10 +418,31 @@ class StockNewsExtractor:
         except Exception as e:
             return {'sentiment': 'Neutral', 'score': 0, 'positive_words': 0, 'negative_words': 0}
     
+    def _fetch_source(self, source, fetch, *args):
+        """Run one source's fetch once its host has a free request slot"""
+        host = SOURCE_HOSTS.get(source)
+        if host:
+            get_host_limiter().acquire(host)
+        try:
+            return fetch(*args)
+        except Exception as e:
+            print(f"Error getting {source} news: {e}")
+            return []
+    
     def get_comprehensive_news(self, symbol, company_name=None, news_api_key=None, alpha_vantage_key=None, sources='all'):
         """
         Get news from multiple sources and combine them
         
+        Sources are fetched concurrently and paced per host (see
+        rate_limit.HOST_RATES), so repeated calls share each host's budget
+        instead of sleeping between sources.
+        
+        Articles already in the article store are returned as stored; only new
+        ones are analyzed and added. Near-duplicates (the same story from
+        several sources, matched by MinHash over title and summary) are
+        returned once, as the first version seen. NewsAPI is asked only for articles newer
+        than the newest dated article it returned for the symbol before.
+        
         Args:
             symbol (str): Stock symbol
             company_name (str): Company name (optional)
@@ -402,65 +470,93 @@ class StockNewsExtractor:
         
         print(f"Extracting news for {symbol} from {len(sources_to_use)} sources...")
         
-        # Yahoo Finance
+        jobs = []
         if 'yahoo' in sources_to_use:
-            print("Getting Yahoo Finance news...")
-            yahoo_news = self.get_yahoo_finance_news(symbol)
-            all_news.extend(yahoo_news)
-            time.sleep(1)  # Rate limiting
-        
-        # Finviz
+            jobs.append(('yahoo', "Getting Yahoo Finance news...", self.get_yahoo_finance_news, (symbol,)))
         if 'finviz' in sources_to_use:
-            print("Getting Finviz news...")
-            finviz_news = self.get_finviz_news(symbol)
-            all_news.extend(finviz_news)
-            time.sleep(1)
-        
-        # MarketWatch
+            jobs.append(('finviz', "Getting Finviz news...", self.get_finviz_news, (symbol,)))
         if 'marketwatch' in sources_to_use:
-            print("Getting MarketWatch news...")
-            marketwatch_news = self.get_marketwatch_news(symbol)
-            all_news.extend(marketwatch_news)
-            time.sleep(1)
-        
-        # Google News
+            jobs.append(('marketwatch', "Getting MarketWatch news...", self.get_marketwatch_news, (symbol,)))
         if 'google' in sources_to_use and company_name:
-            print("Getting Google News...")
-            google_news = self.get_google_news(symbol, company_name)
-            all_news.extend(google_news)
-            time.sleep(1)
-        
-        # Seeking Alpha
+            jobs.append(('google', "Getting Google News...", self.get_google_news, (symbol, company_name)))
         if 'seeking_alpha' in sources_to_use:
-            print("Getting Seeking Alpha news...")
-            seeking_alpha_news = self.get_seeking_alpha_news(symbol)
-            all_news.extend(seeking_alpha_news)
-            time.sleep(1)
-        
-        # NewsAPI (requires API key)
+            jobs.append(('seeking_alpha', "Getting Seeking Alpha news...", self.get_seeking_alpha_news, (symbol,)))
+        # NewsAPI and Alpha Vantage require API keys
+        newsapi_limit = 10
+        newsapi_since = None
         if 'newsapi' in sources_to_use and news_api_key and company_name:
-            print("Getting NewsAPI news...")
-            newsapi_news = self.get_newsapi_stock_news(symbol, company_name, news_api_key)
-            all_news.extend(newsapi_news)
-            time.sleep(1)
-        
-        # Alpha Vantage (requires API key)
+            newsapi_since = self.store.high_water(symbol, 'newsapi')
+            jobs.append(('newsapi', "Getting NewsAPI news...", self.get_newsapi_stock_news,
+                         (symbol, company_name, news_api_key, newsapi_limit, newsapi_since)))
         if 'alpha_vantage' in sources_to_use and alpha_vantage_key:
-            print("Getting Alpha Vantage news...")
-            av_news = self.get_alpha_vantage_news(symbol, alpha_vantage_key)
-            all_news.extend(av_news)
-            time.sleep(1)
+            jobs.append(('alpha_vantage', "Getting Alpha Vantage news...", self.get_alpha_vantage_news,
+                         (symbol, alpha_vantage_key)))
         
-        # Remove duplicates based on title
+        # Sources run concurrently; each waits only for its own host's rate limit
+        if jobs:
+            with ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix='news-source') as executor:
+                futures = []
+                for source, message, fetch, args in jobs:
+                    print(message)
+                    futures.append(executor.submit(self._fetch_source, source, fetch, *args))
+                # Merge in source order so duplicate titles resolve the same way on every run
+                for (source, *_), future in zip(jobs, futures):
+                    articles = future.result()
+                    all_news.extend(articles)
+                    if articles:
+                        self.store.advance_high_water(symbol, source, articles)
+                    if source == 'newsapi' and newsapi_since is not None:
+                        # NewsAPI was only asked for articles after its mark; the newest
+                        # stored ones fill the rest of its page as a full fetch would
+                        stored = self.store.recent(symbol, hours=None, limit=max(newsapi_limit - len(articles), 0),
+                                                   extraction_method='NewsAPI')
+                        all_news.extend(stored.to_dict('records'))
+        
+        # Remove duplicates based on title, then near-duplicates (syndicated copies) of
+        # articles kept from this fetch or stored earlier
+        keys = [article_key(news) for news in all_news]
+        known = self.store.get_many(symbol, keys)
+        batch_index = MinHashLSH(self.store.hasher)
         seen_titles = set()
+        kept_keys = set()
         unique_news = []
-        for news in all_news:
-            if news['title'] not in seen_titles:
-                seen_titles.add(news['title'])
-                # Add sentiment analysis
-                sentiment = self.analyze_sentiment(news['title'] + ' ' + news['summary'])
-                news.update(sentiment)
-                unique_news.append(news)
+        new_news = []
+        signatures = []
+        for news, key in zip(all_news, keys):
+            if news['title'] in seen_titles or key in kept_keys:
+                continue
+            seen_titles.add(news['title'])
+            if key in known:
+                news = known[key]
+                original = news.get('duplicate_of')
+            else:
+                text = article_text(news)
+                signature = self.store.hasher.signature(text)
+                original = None
+                if signature is not None:
+                    original = batch_index.query(signature, text) or self.store.similar(symbol, signature, text=text)
+                if original is None:
+                    # Add sentiment analysis
+                    sentiment = self.analyze_sentiment(news['title'] + ' ' + news['summary'])
+                    news.update(sentiment)
+                    if signature is not None:
+                        batch_index.insert(key, signature, text)
+                else:
+                    news['duplicate_of'] = original
+                new_news.append(news)
+                signatures.append(signature)
+            
+            if original is not None:
+                # A copy stands in for its original, which is kept once; the stored
+                # version is used when this fetch has only copies of the story
+                if original in kept_keys:
+                    continue
+                news, key = self.store.get_many(symbol, [original]).get(original), original
+                if news is None:
+                    continue
+            kept_keys.add(key)
+            unique_news.append(news)
+        self.store.add(symbol, new_news, signatures=signatures)
         
         # Convert to DataFrame
         df = pd.DataFrame(unique_news)
@@ -535,6 +631,19 @@ def get_news(symbol, company_name=None, news_api_key=None, alpha_vantage_key=Non
     )
     return news_df
 
+def get_recent_news(symbol, hours=24):
+    """
+    Articles stored for a symbol over the last ``hours``, without any network call
+    
+    Args:
+        symbol (str): Stock symbol (e.g., 'AAPL')
+        hours (float): Look-back window
+    
+    Returns:
+        pd.DataFrame: Stored articles, newest first
+    """
+    return get_article_store().recent(symbol, hours=hours)
+
 # Example usage and main function
 def main():
     """Main function to demonstrate usage"""
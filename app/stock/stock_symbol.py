@@ -2,10 +2,18 @@ import yfinance as yf
 import requests
 import pandas as pd
 import json
-from fuzzywuzzy import fuzz, process
 import re
-import time
-from typing import List, Dict, Optional, Tuple
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import AsyncIterator, List, Dict, Optional, Tuple
+
+from .ticker_cache import get_ticker_info, get_snapshot_cache, has_identity
+from .alpha_vantage import get_alpha_vantage_client
+from .ticker_index import get_ticker_index
+from .symbol_memo import get_symbol_memo
+from .name_matching import normalize_name, score_names
+from .rate_limit import RateLimitedAdapter, get_host_limiter
 
 class StockSymbolFinder:
     def __init__(self):
@@ -14,13 +22,17 @@ class StockSymbolFinder:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        # find_symbol queries several hosts at once; keep their connections alive and
+        # hold each host to its rate in rate_limit.HOST_RATES, across every finder
+        self.session.mount('https://', RateLimitedAdapter(get_host_limiter(), pool_connections=4, pool_maxsize=8))
         
-    def search_yahoo_finance(self, company_name: str) -> List[Dict]:
+    def search_yahoo_finance(self, company_name: str, raise_errors: bool = False) -> List[Dict]:
         """
         Search for stock symbols using Yahoo Finance search API
         
         Args:
             company_name (str): Company name to search for
+            raise_errors (bool): Raise request errors instead of returning []
             
         Returns:
             List[Dict]: List of matching stocks with symbol and name
@@ -62,15 +74,30 @@ class StockSymbolFinder:
             return results
             
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error searching Yahoo Finance: {e}")
             return []
     
-    def search_yfinance_ticker(self, company_name: str) -> List[Dict]:
+    def search_yfinance_ticker(self, company_name: str, max_workers: int = 8,
+                               stop_score: int = 90, cancel: threading.Event = None,
+                               raise_errors: bool = False) -> List[Dict]:
         """
         Search using yfinance Ticker search functionality
         
+        Potential symbols from every name variation are deduplicated, symbols
+        a recent probe found missing are skipped, and the rest are validated
+        concurrently. Probes whose ``info`` names no company mark the symbol
+        missing in the shared cache for its short ``negative_ttl``.
+        Validation stops as soon as one company name scores ``stop_score``.
+        
         Args:
             company_name (str): Company name to search for
+            max_workers (int): Maximum concurrent ``info`` fetches
+            stop_score (int): Name match score (0-100) that ends the search early
+            cancel (threading.Event, optional): Set by a caller that no longer
+                needs the result; remaining probes are dropped
+            raise_errors (bool): Raise when every probe failed instead of returning []
             
         Returns:
             List[Dict]: List of matching stocks
@@ -84,42 +111,65 @@ class StockSymbolFinder:
                 company_name.split()[0] if ' ' in company_name else company_name
             ]
             
+            # This is a workaround - we'll try to validate potential symbols
+            # by checking if they exist as valid tickers
+            cache = get_snapshot_cache()
+            candidates = dict.fromkeys(symbol for variation in variations
+                                       for symbol in self._generate_potential_symbols(variation))
+            candidates = [symbol for symbol in candidates if not cache.is_missing(symbol)]
+            if not candidates:
+                return []
+            
+            def probe(symbol):
+                info = get_ticker_info(symbol)
+                # Only probes mark misses; a failed fetch raises and is not remembered
+                if not has_identity(info):
+                    cache.mark_missing(symbol)
+                return info
+            
             results = []
-            for variation in variations:
-                try:
-                    # This is a workaround - we'll try to validate potential symbols
-                    # by checking if they exist as valid tickers
-                    potential_symbols = self._generate_potential_symbols(variation)
-                    
-                    for symbol in potential_symbols:
-                        try:
-                            ticker = yf.Ticker(symbol)
-                            info = ticker.info
-                            
-                            if info and 'longName' in info:
-                                result = {
-                                    'symbol': symbol,
-                                    'name': info.get('longName', ''),
-                                    'sector': info.get('sector', ''),
-                                    'industry': info.get('industry', ''),
-                                    'exchange': info.get('exchange', ''),
-                                    'type': 'EQUITY',
-                                    'source': 'yfinance validation'
-                                }
-                                
-                                # Check if the company name matches reasonably well
-                                if self._is_name_match(company_name, info.get('longName', '')):
-                                    results.append(result)
-                                    
-                        except:
-                            continue
-                            
-                except:
-                    continue
+            answered, error = False, None
+            executor = ThreadPoolExecutor(max_workers=min(max_workers, len(candidates)),
+                                          thread_name_prefix='symbol-probe')
+            try:
+                futures = {executor.submit(probe, symbol): symbol for symbol in candidates}
+                for future in as_completed(futures):
+                    if cancel is not None and cancel.is_set():
+                        break
+                    try:
+                        info = future.result()
+                    except Exception as e:
+                        error = e
+                        continue
+                    answered = True
+                    if not info or 'longName' not in info:
+                        continue
                     
+                    # Check if the company name matches reasonably well
+                    score = self._name_score(company_name, info.get('longName', ''))
+                    if score >= 60:
+                        results.append({
+                            'symbol': futures[future],
+                            'name': info.get('longName', ''),
+                            'sector': info.get('sector', ''),
+                            'industry': info.get('industry', ''),
+                            'exchange': info.get('exchange', ''),
+                            'type': 'EQUITY',
+                            'source': 'yfinance validation'
+                        })
+                    if score >= stop_score:
+                        break
+            finally:
+                # Drop probes that have not started; running ones still fill the cache
+                executor.shutdown(wait=False, cancel_futures=True)
+            
+            if raise_errors and not answered and error is not None:
+                raise error
             return results
             
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error in yfinance search: {e}")
             return []
     
@@ -191,20 +241,17 @@ class StockSymbolFinder:
         """
         if not search_name or not company_name:
             return False
-            
-        # Clean names for comparison
-        clean_search = re.sub(r'[^\w\s]', '', search_name.lower())
-        clean_company = re.sub(r'[^\w\s]', '', company_name.lower())
-        
-        # Calculate similarity ratio
-        ratio = fuzz.ratio(clean_search, clean_company)
-        partial_ratio = fuzz.partial_ratio(clean_search, clean_company)
-        token_ratio = fuzz.token_sort_ratio(clean_search, clean_company)
         
         # Return True if any ratio exceeds threshold
-        return max(ratio, partial_ratio, token_ratio) >= threshold
+        return self._name_score(search_name, company_name) >= threshold
+    
+    def _name_score(self, search_name: str, company_name: str) -> int:
+        """Best of ratio, partial ratio and token sort ratio on cleaned names (0-100)"""
+        if not search_name or not company_name:
+            return 0
+        return int(score_names(search_name, [company_name])[0])
     
-    def search_alpha_vantage(self, company_name: str, api_key: str) -> List[Dict]:
+    def search_alpha_vantage(self, company_name: str, api_key: str, raise_errors: bool = False) -> List[Dict]:
         """
         Search using Alpha Vantage API (requires API key)
         Get free API key at: https://www.alphavantage.co/support/#api-key
@@ -212,22 +259,14 @@ class StockSymbolFinder:
         Args:
             company_name (str): Company name to search for
             api_key (str): Alpha Vantage API key
+            raise_errors (bool): Raise request errors instead of returning []
             
         Returns:
             List[Dict]: List of matching stocks
         """
         try:
-            url = f'https://www.alphavantage.co/query'
-            params = {
-                'function': 'SYMBOL_SEARCH',
-                'keywords': company_name,
-                'apikey': api_key
-            }
-            
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            # Rate limited per key and cached on disk by the shared client
+            data = get_alpha_vantage_client(api_key).query('SYMBOL_SEARCH', keywords=company_name)
             results = []
             
             if 'bestMatches' in data:
@@ -249,10 +288,12 @@ class StockSymbolFinder:
             return results
             
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error searching Alpha Vantage: {e}")
             return []
     
-    def search_finnhub(self, company_name: str, api_key: str) -> List[Dict]:
+    def search_finnhub(self, company_name: str, api_key: str, raise_errors: bool = False) -> List[Dict]:
         """
         Search using Finnhub API (requires API key)
         Get free API key at: https://finnhub.io/register
@@ -260,6 +301,7 @@ class StockSymbolFinder:
         Args:
             company_name (str): Company name to search for
             api_key (str): Finnhub API key
+            raise_errors (bool): Raise request errors instead of returning []
             
         Returns:
             List[Dict]: List of matching stocks
@@ -290,53 +332,92 @@ class StockSymbolFinder:
             return results
             
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error searching Finnhub: {e}")
             return []
     
     def find_symbol(self, company_name: str, alpha_vantage_key: str = None, 
-                   finnhub_key: str = None) -> List[Dict]:
+                   finnhub_key: str = None, confidence: Optional[int] = 95) -> List[Dict]:
         """
         Find stock symbol using multiple sources
         
+        All sources run concurrently and their results are merged as they
+        arrive. Once a result's symbol is the query itself, or the top match
+        score reaches ``confidence``, the sources still running are abandoned.
+        
         Args:
             company_name (str): Company name to search for
             alpha_vantage_key (str, optional): Alpha Vantage API key
             finnhub_key (str, optional): Finnhub API key
+            confidence (int, optional): Match score (0-100) that ends the search
+                early; None waits for every source
             
         Returns:
-            List[Dict]: Combined results from all sources
+            List[Dict]: Combined results from the sources that answered
         """
-        print(f"Searching for: {company_name}")
-        all_results = []
+        return self.search_symbol_sources(company_name, alpha_vantage_key, finnhub_key, confidence)[0]
+    
+    def search_symbol_sources(self, company_name: str, alpha_vantage_key: str = None,
+                              finnhub_key: str = None, confidence: Optional[int] = 95) -> Tuple[List[Dict], bool]:
+        """
+        find_symbol, also telling whether any source actually answered
         
-        # Search Yahoo Finance (no API key required)
-        print("Searching Yahoo Finance...")
-        yahoo_results = self.search_yahoo_finance(company_name)
-        all_results.extend(yahoo_results)
+        An empty result only means the name is unknown when at least one
+        source answered; when every source failed it says nothing.
         
-        # Search using yfinance validation
-        print("Validating with yfinance...")
-        yf_results = self.search_yfinance_ticker(company_name)
-        all_results.extend(yf_results)
+        Returns:
+            Tuple[List[Dict], bool]: Ranked results, and whether a source answered without error
+        """
+        print(f"Searching for: {company_name}")
+        cancel = threading.Event()
         
-        # Search Alpha Vantage if API key provided
+        # Yahoo Finance and yfinance validation need no API key
+        sources = [
+            ("Searching Yahoo Finance...", self.search_yahoo_finance, (company_name,), {}),
+            ("Validating with yfinance...", self.search_yfinance_ticker, (company_name,), {'cancel': cancel}),
+        ]
         if alpha_vantage_key:
-            print("Searching Alpha Vantage...")
-            av_results = self.search_alpha_vantage(company_name, alpha_vantage_key)
-            all_results.extend(av_results)
-            time.sleep(0.2)  # Rate limiting
-        
-        # Search Finnhub if API key provided
+            sources.append(("Searching Alpha Vantage...", self.search_alpha_vantage,
+                            (company_name, alpha_vantage_key), {}))
         if finnhub_key:
-            print("Searching Finnhub...")
-            fh_results = self.search_finnhub(company_name, finnhub_key)
-            all_results.extend(fh_results)
+            sources.append(("Searching Finnhub...", self.search_finnhub, (company_name, finnhub_key), {}))
         
-        # Remove duplicates and rank results
-        unique_results = self._deduplicate_results(all_results)
-        ranked_results = self._rank_results(company_name, unique_results)
+        all_results = []
+        ranked_results = []
+        answered = False
+        executor = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix='symbol-source')
+        try:
+            futures = []
+            for message, search, args, kwargs in sources:
+                print(message)
+                futures.append(executor.submit(search, *args, raise_errors=True, **kwargs))
+            
+            for future in as_completed(futures):
+                try:
+                    all_results.extend(future.result())
+                    answered = True
+                except Exception as e:
+                    print(f"Error searching symbol source: {e}")
+                
+                # Remove duplicates and rank results
+                unique_results = self._deduplicate_results(all_results)
+                ranked_results = self._rank_results(company_name, unique_results)
+                if confidence is not None and self._is_confident(company_name, ranked_results, confidence):
+                    break
+        finally:
+            cancel.set()
+            executor.shutdown(wait=False, cancel_futures=True)
         
-        return ranked_results
+        return ranked_results, answered
+    
+    def _is_confident(self, search_name: str, ranked_results: List[Dict], confidence: int) -> bool:
+        """True when a result is an exact symbol hit or the top one scores at least ``confidence``"""
+        if not ranked_results:
+            return False
+        query = search_name.strip().upper()
+        return (ranked_results[0].get('match_score', 0) >= confidence
+                or any(result.get('symbol', '').upper() == query for result in ranked_results))
     
     def _deduplicate_results(self, results: List[Dict]) -> List[Dict]:
         """Remove duplicate results based on symbol"""
@@ -353,16 +434,10 @@ class StockSymbolFinder:
     
     def _rank_results(self, search_name: str, results: List[Dict]) -> List[Dict]:
         """Rank results by relevance to search name"""
-        for result in results:
-            company_name = result.get('name', '')
-            # Calculate match score
-            if company_name:
-                ratio = fuzz.ratio(search_name.lower(), company_name.lower())
-                partial_ratio = fuzz.partial_ratio(search_name.lower(), company_name.lower())
-                token_ratio = fuzz.token_sort_ratio(search_name.lower(), company_name.lower())
-                result['match_score'] = max(ratio, partial_ratio, token_ratio)
-            else:
-                result['match_score'] = 0
+        # One batched call scores every result; results without a name score 0
+        scores = score_names(search_name, [result.get('name', '') or '' for result in results])
+        for result, score in zip(results, scores):
+            result['match_score'] = int(score)
         
         # Sort by match score descending
         return sorted(results, key=lambda x: x.get('match_score', 0), reverse=True)
@@ -387,25 +462,119 @@ class StockSymbolFinder:
             
             print(f"{i:<4} {symbol:<8} {name:<40} {exchange:<10} {match_score:<7.1f} {source:<15}")
 
-def batch_search_symbols(company_names: List[str], finder: StockSymbolFinder) -> Dict[str, List[Dict]]:
+def _cached_symbol_results(company_name: str) -> Optional[List[Dict]]:
+    """
+    Results for a company name from the symbol memo or the local ticker master
+
+    Returns:
+        Optional[List[Dict]]: [] for a remembered failure, None when the
+            network sources have to be searched
+    """
+    remembered = get_symbol_memo().get(company_name)
+    if remembered is not None:
+        if not remembered:
+            return []
+        return [{'symbol': remembered, 'name': company_name, 'exchange': '', 'type': 'EQUITY',
+                 'source': 'Symbol memo', 'match_score': 100}]
+    
+    local_results = get_ticker_index().search(company_name, threshold=61)
+    return local_results or None
+
+
+def _remember_symbol(company_name: str, results: List[Dict], answered: bool = True):
+    """
+    Record the best network result for a name, or the failure when none scores above 60
+
+    A failure is only recorded when a source answered; an outage of every
+    source must not be remembered as an unknown name.
+    """
+    symbol = ''
+    if results and results[0].get('match_score', 0) > 60:
+        symbol = results[0].get('symbol', '')
+    if symbol or answered:
+        get_symbol_memo().put(company_name, symbol)
+
+
+async def batch_search_symbols_async(company_names: List[str], finder: StockSymbolFinder = None,
+                                     max_concurrency: int = 8) -> AsyncIterator[Tuple[str, List[Dict]]]:
+    """
+    Resolve many company names concurrently, yielding each as it finishes
+    
+    Names answered by the symbol memo or the local ticker master are yielded
+    first without touching the network. The rest run
+    ``finder.search_symbol_sources`` in worker threads, at most ``max_concurrency`` at a time; requests are
+    paced per host by the finder session's rate limiter rather than by
+    sleeping between names. Names that normalize to the same key are looked
+    up once.
+    
+    Args:
+        company_names (List[str]): Company names to search
+        finder (StockSymbolFinder, optional): Finder instance, defaults to the shared one
+        max_concurrency (int): Names searched on the network at the same time
+        
+    Yields:
+        Tuple[str, List[Dict]]: Company name and its ranked results
+    """
+    finder = finder or get_symbol_finder()
+    pending: Dict[str, List[str]] = {}
+    for company_name in company_names:
+        pending.setdefault(normalize_name(company_name), []).append(company_name)
+    
+    to_search = []
+    for names in pending.values():
+        results = _cached_symbol_results(names[0])
+        if results is None:
+            to_search.append(names)
+            continue
+        for company_name in names:
+            yield company_name, results
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def search(names: List[str]) -> Tuple[List[str], List[Dict]]:
+        async with semaphore:
+            try:
+                results, answered = await asyncio.to_thread(finder.search_symbol_sources, names[0])
+            except Exception as e:
+                print(f"Error searching symbol for {names[0]}: {e}")
+                return names, []
+        _remember_symbol(names[0], results, answered)
+        return names, results
+    
+    for next_done in asyncio.as_completed([search(names) for names in to_search]):
+        names, results = await next_done
+        for company_name in names:
+            yield company_name, results
+
+
+def batch_search_symbols(company_names: List[str], finder: StockSymbolFinder = None,
+                         max_concurrency: int = 8) -> Dict[str, List[Dict]]:
     """
     Search for multiple company symbols at once
     
+    Blocking wrapper around batch_search_symbols_async; safe to call from
+    inside a running event loop.
+    
     Args:
         company_names (List[str]): List of company names to search
-        finder (StockSymbolFinder): Finder instance
+        finder (StockSymbolFinder, optional): Finder instance, defaults to the shared one
+        max_concurrency (int): Names searched on the network at the same time
         
     Returns:
-        Dict[str, List[Dict]]: Results for each company
+        Dict[str, List[Dict]]: Results for each company, in input order
     """
-    results = {}
-    
-    for company_name in company_names:
-        print(f"\n{'='*60}")
-        results[company_name] = finder.find_symbol(company_name)
-        time.sleep(0.5)  # Rate limiting
+    async def collect() -> Dict[str, List[Dict]]:
+        return {name: results async for name, results in
+                batch_search_symbols_async(company_names, finder, max_concurrency)}
     
-    return results
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        found = asyncio.run(collect())
+    else:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            found = executor.submit(asyncio.run, collect()).result()
+    return {company_name: found.get(company_name, []) for company_name in company_names}
 
 def main():
     """Main function to demonstrate usage"""
@@ -469,20 +638,50 @@ def quick_symbol_lookup(company_name: str) -> str:
     """
     Quick lookup function that returns the best matching symbol
     
+    Earlier resolutions, including failed ones, are answered from the
+    persistent symbol memo. Otherwise the local ticker master (see
+    ticker_index.py) is tried, and the network sources are only searched
+    when it has no match above the threshold.
+    
     Args:
         company_name (str): Company name to search
         
     Returns:
         str: Best matching stock symbol or empty string if not found
     """
-    finder = StockSymbolFinder()
-    results = finder.find_symbol(company_name)
+    results = _cached_symbol_results(company_name)
+    if results is None:
+        results, answered = get_symbol_finder().search_symbol_sources(company_name)
+        _remember_symbol(company_name, results, answered)
     
     if results and results[0].get('match_score', 0) > 60:
         return results[0].get('symbol', '')
-    
     return ''
 
+
+_symbol_finder = None
+
+
+def get_symbol_finder() -> StockSymbolFinder:
+    """Return the process-wide finder, whose session pools connections across lookups"""
+    global _symbol_finder
+    if _symbol_finder is None:
+        _symbol_finder = StockSymbolFinder()
+    return _symbol_finder
+
+def _validation_result(symbol: str, info: Dict) -> Dict:
+    """validate_symbol's answer for an ``info`` payload or bulk quote"""
+    if info and 'longName' in info:
+        return {
+            'symbol': symbol.upper(),
+            'name': info.get('longName', ''),
+            'sector': info.get('sector', ''),
+            'industry': info.get('industry', ''),
+            'exchange': info.get('exchange', ''),
+            'valid': True
+        }
+    return {'valid': False}
+
 def validate_symbol(symbol: str) -> Dict:
     """
     Validate if a symbol exists and get basic info
@@ -494,20 +693,75 @@ def validate_symbol(symbol: str) -> Dict:
         Dict: Company information if valid, empty dict if invalid
     """
     try:
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
-        
-        if info and 'longName' in info:
-            return {
-                'symbol': symbol.upper(),
-                'name': info.get('longName', ''),
-                'sector': info.get('sector', ''),
-                'industry': info.get('industry', ''),
-                'exchange': info.get('exchange', ''),
-                'valid': True
-            }
+        return _validation_result(symbol, get_ticker_info(symbol))
     except:
         pass
     
     return {'valid': False}
 
+
+QUOTE_URL = 'https://query1.finance.yahoo.com/v7/finance/quote'
+QUOTE_BATCH_SIZE = 200
+
+
+def _fetch_quotes(symbols: List[str]) -> Dict[str, Dict]:
+    """One multi-quote request for up to QUOTE_BATCH_SIZE symbols, keyed by upper-case symbol"""
+    # yfinance's shared session carries the cookie and crumb the quote endpoint requires
+    from yfinance.data import YfData
+    
+    get_host_limiter().acquire(QUOTE_URL)
+    data = YfData().get_raw_json(QUOTE_URL, params={'symbols': ','.join(symbols), 'formatted': 'false'})
+    quotes = (data or {}).get('quoteResponse', {}).get('result') or []
+    return {quote['symbol'].upper(): quote for quote in quotes if quote.get('symbol')}
+
+
+def validate_symbols(symbols: List[str], batch_size: int = QUOTE_BATCH_SIZE) -> Dict[str, Dict]:
+    """
+    Validate many symbols with one multi-quote request per batch
+    
+    Symbols with a fresh snapshot or quote in the shared ticker cache, or
+    that a symbol probe recently found missing, are answered without a
+    request. The rest are fetched ``batch_size`` at a time; returned quotes
+    are cached, and symbols Yahoo leaves out are stored as empty quotes that
+    expire after the cache's short ``quote_miss_ttl``. A batch whose request
+    fails falls back to validate_symbol for each of its symbols.
+    
+    Quotes carry no sector or industry, so those are '' unless a full
+    ``info`` snapshot was already cached.
+    
+    Args:
+        symbols (List[str]): Stock symbols to validate
+        batch_size (int): Symbols per quote request
+        
+    Returns:
+        Dict[str, Dict]: validate_symbol's result for each input symbol
+    """
+    cache = get_snapshot_cache()
+    results = {}
+    to_fetch = []
+    for key in dict.fromkeys(symbol.strip().upper() for symbol in symbols if symbol and symbol.strip()):
+        if cache.is_missing(key):
+            results[key] = {'valid': False}
+            continue
+        snapshot = cache.peek_quote(key)
+        if snapshot is None:
+            to_fetch.append(key)
+        else:
+            results[key] = _validation_result(key, snapshot.info)
+    
+    for start in range(0, len(to_fetch), batch_size):
+        batch = to_fetch[start:start + batch_size]
+        try:
+            quotes = _fetch_quotes(batch)
+        except Exception as e:
+            print(f"Error fetching bulk quotes, validating one by one: {e}")
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results.update(zip(batch, executor.map(validate_symbol, batch)))
+            continue
+        
+        for key in batch:
+            quote = quotes.get(key) or {}
+            cache.put_quote(key, quote)
+            results[key] = _validation_result(key, quote)
+    
+    return {symbol: results.get(str(symbol).strip().upper(), {'valid': False}) for symbol in symbols}
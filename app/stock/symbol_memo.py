@@ -0,0 +1,91 @@
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from .name_matching import normalize_name
+
+
+class SymbolMemo:
+    def __init__(self, path=None, ttl: float = 30 * 86400, negative_ttl: float = 6 * 3600):
+        """
+        Persistent map of normalized company names to resolved symbols
+
+        Lookups that found nothing are stored as negative entries (an empty
+        symbol) with a shorter TTL, so a name that failed is retried later but
+        not on every request.
+
+        Args:
+            path (str or Path): SQLite file, defaults to $STOCK_AGENT_DATA_DIR/symbols.sqlite;
+                ':memory:' keeps the memo in process
+            ttl (float): Seconds a resolved symbol is trusted
+            negative_ttl (float): Seconds a failed lookup is remembered
+        """
+        if path is None:
+            base = os.getenv('STOCK_AGENT_DATA_DIR', Path.home() / '.cache' / 'stock_agent')
+            path = Path(base) / 'symbols.sqlite'
+        if str(path) != ':memory:':
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=10)
+        with self._lock, self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS symbols ('
+                'name TEXT PRIMARY KEY, symbol TEXT NOT NULL, resolved_at REAL NOT NULL)'
+            )
+
+    def get(self, company_name: str, now: float = None) -> Optional[str]:
+        """
+        Remembered symbol for a company name
+
+        Args:
+            company_name (str): Name as the user typed it
+            now (float): Reference epoch time, defaults to now
+
+        Returns:
+            Optional[str]: The symbol, '' for a remembered failure, None when unknown or expired
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            row = self._conn.execute('SELECT symbol, resolved_at FROM symbols WHERE name = ?',
+                                     (normalize_name(company_name),)).fetchone()
+        if row is None:
+            return None
+        symbol, resolved_at = row
+        ttl = self.ttl if symbol else self.negative_ttl
+        return symbol if now - resolved_at < ttl else None
+
+    def put(self, company_name: str, symbol: str, now: float = None):
+        """Remember a resolution; an empty symbol records a failed lookup"""
+        now = time.time() if now is None else now
+        with self._lock, self._conn:
+            self._conn.execute('INSERT OR REPLACE INTO symbols (name, symbol, resolved_at) VALUES (?, ?, ?)',
+                               (normalize_name(company_name), symbol or '', now))
+
+    def invalidate(self, company_name: str = None):
+        """Forget one name, or every name when none is given"""
+        with self._lock, self._conn:
+            if company_name is None:
+                self._conn.execute('DELETE FROM symbols')
+            else:
+                self._conn.execute('DELETE FROM symbols WHERE name = ?', (normalize_name(company_name),))
+
+
+_symbol_memo = None
+
+
+def get_symbol_memo() -> SymbolMemo:
+    """Return the process-wide symbol memo, created on first use"""
+    global _symbol_memo
+    if _symbol_memo is None:
+        try:
+            _symbol_memo = SymbolMemo()
+        except (OSError, sqlite3.Error) as e:
+            print(f"Symbol memo unavailable, keeping it in memory: {e}")
+            _symbol_memo = SymbolMemo(':memory:')
+    return _symbol_memo
@@ -0,0 +1,199 @@
+import yfinance as yf
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+# An ``info`` payload without any of these does not describe a listed symbol
+IDENTITY_FIELDS = ('longName', 'shortName', 'quoteType')
+
+
+def has_identity(info: Dict) -> bool:
+    """True when an ``info`` payload names an existing symbol"""
+    return bool(info) and any(info.get(field) for field in IDENTITY_FIELDS)
+
+
+class TickerSnapshot:
+    def __init__(self, symbol: str, info: Dict, fetched_at: float = None):
+        """
+        Point-in-time copy of a ticker's ``info`` payload
+
+        Args:
+            symbol (str): Stock symbol the payload belongs to
+            info (Dict): Raw ``yf.Ticker(symbol).info`` dictionary
+            fetched_at (float): ``time.monotonic()`` timestamp of the fetch
+        """
+        self.symbol = symbol
+        self.info = info or {}
+        self.fetched_at = time.monotonic() if fetched_at is None else fetched_at
+
+    def age(self) -> float:
+        """Seconds elapsed since the snapshot was fetched"""
+        return time.monotonic() - self.fetched_at
+
+
+class TickerSnapshotCache:
+    def __init__(self, maxsize: int = 256, ttl: float = 900, negative_ttl: float = 900,
+                 quote_ttl: float = 86400, quote_miss_ttl: float = 900):
+        """
+        Process-wide cache of ticker ``info`` snapshots with TTL and LRU eviction
+
+        Payloads without a name or quote type are returned but not cached, so
+        a transient upstream failure is retried on the next call. Symbol
+        probes may record such symbols with ``mark_missing`` to skip them for
+        ``negative_ttl``; ``get`` never consults those marks.
+
+        Lightweight quotes from bulk requests (name, exchange, quote type) are
+        kept apart from the full ``info`` snapshots, so callers that need the
+        whole payload never receive a partial one. Symbols a bulk request left
+        out are kept there too, as empty quotes for ``quote_miss_ttl``.
+
+        Args:
+            maxsize (int): Maximum number of symbols kept in memory
+            ttl (float): Seconds a snapshot stays fresh before it is refetched
+            negative_ttl (float): Seconds a probed symbol stays known-missing
+            quote_ttl (float): Seconds a bulk quote stays fresh
+            quote_miss_ttl (float): Seconds a symbol left out of a bulk response stays invalid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.quote_ttl = quote_ttl
+        self.quote_miss_ttl = quote_miss_ttl
+        self._snapshots = OrderedDict()
+        self._missing = OrderedDict()
+        self._quotes = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(symbol: str) -> str:
+        return symbol.strip().upper()
+
+    def get(self, symbol: str, ticker=None) -> TickerSnapshot:
+        """
+        Get a fresh snapshot for a symbol, fetching ``info`` only on a miss
+
+        Args:
+            symbol (str): Stock symbol
+            ticker (yf.Ticker, optional): Existing ticker object to fetch through
+
+        Returns:
+            TickerSnapshot: Cached or newly fetched snapshot
+        """
+        key = self._key(symbol)
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None and snapshot.age() < self.ttl:
+                self._snapshots.move_to_end(key)
+                return snapshot
+
+        # Fetch outside the lock so slow lookups do not block other symbols
+        if ticker is None:
+            ticker = yf.Ticker(key)
+        info = ticker.info or {}
+        if not has_identity(info):
+            return TickerSnapshot(key, info)
+        return self.put(key, info)
+
+    def is_missing(self, symbol: str) -> bool:
+        """True when a symbol probe recently found the symbol not to exist"""
+        key = self._key(symbol)
+        with self._lock:
+            marked_at = self._missing.get(key)
+            if marked_at is not None and time.monotonic() - marked_at >= self.negative_ttl:
+                del self._missing[key]
+                marked_at = None
+        return marked_at is not None
+
+    def mark_missing(self, symbol: str):
+        """Remember that a symbol probe found no such symbol upstream"""
+        key = self._key(symbol)
+        with self._lock:
+            self._missing[key] = time.monotonic()
+            self._missing.move_to_end(key)
+            # Misses are cheap to keep, but still bounded
+            while len(self._missing) > self.maxsize * 16:
+                self._missing.popitem(last=False)
+
+    def peek(self, symbol: str) -> Optional[TickerSnapshot]:
+        """Return the cached snapshot for a symbol if still fresh, without fetching"""
+        with self._lock:
+            snapshot = self._snapshots.get(self._key(symbol))
+        if snapshot is not None and snapshot.age() < self.ttl:
+            return snapshot
+        return None
+
+    def put(self, symbol: str, info: Dict) -> TickerSnapshot:
+        """Store an ``info`` payload obtained elsewhere"""
+        key = self._key(symbol)
+        snapshot = TickerSnapshot(key, info)
+        with self._lock:
+            self._snapshots[key] = snapshot
+            self._snapshots.move_to_end(key)
+            while len(self._snapshots) > self.maxsize:
+                self._snapshots.popitem(last=False)
+        return snapshot
+
+    def peek_quote(self, symbol: str) -> Optional[TickerSnapshot]:
+        """Fresh full snapshot for a symbol, else its fresh bulk quote (empty for a miss), without fetching"""
+        snapshot = self.peek(symbol)
+        if snapshot is not None:
+            return snapshot
+        with self._lock:
+            quote = self._quotes.get(self._key(symbol))
+        if quote is not None and quote.age() < (self.quote_ttl if quote.info else self.quote_miss_ttl):
+            return quote
+        return None
+
+    def put_quote(self, symbol: str, quote: Dict) -> TickerSnapshot:
+        """Store a quote from a bulk request; an empty quote records a symbol the request left out"""
+        key = self._key(symbol)
+        snapshot = TickerSnapshot(key, quote)
+        with self._lock:
+            self._quotes[key] = snapshot
+            self._quotes.move_to_end(key)
+            # Quotes are small, so keep as many as known-missing symbols
+            while len(self._quotes) > self.maxsize * 16:
+                self._quotes.popitem(last=False)
+        return snapshot
+
+    def invalidate(self, symbol: str = None):
+        """Drop one symbol, or every symbol when none is given"""
+        with self._lock:
+            if symbol is None:
+                self._snapshots.clear()
+                self._missing.clear()
+                self._quotes.clear()
+            else:
+                self._snapshots.pop(self._key(symbol), None)
+                self._missing.pop(self._key(symbol), None)
+                self._quotes.pop(self._key(symbol), None)
+
+    def __contains__(self, symbol: str) -> bool:
+        return self.peek(symbol) is not None
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+
+# Shared by StockAnalyzer and the symbol helpers so one report makes one ``info`` call
+_snapshot_cache = TickerSnapshotCache()
+
+
+def get_snapshot_cache() -> TickerSnapshotCache:
+    """Return the process-wide ticker snapshot cache"""
+    return _snapshot_cache
+
+
+def get_ticker_info(symbol: str, ticker=None) -> Dict:
+    """
+    Get ``info`` for a symbol through the shared snapshot cache
+
+    Args:
+        symbol (str): Stock symbol
+        ticker (yf.Ticker, optional): Existing ticker object to fetch through
+
+    Returns:
+        Dict: Ticker info payload
+    """
+    return _snapshot_cache.get(symbol, ticker).info
@@ -0,0 +1,195 @@
+import pandas as pd
+import numpy as np
+import os
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .name_matching import normalize_name, score_names
+
+# Accepted master-file column names, matched case-insensitively
+_COLUMNS = {
+    'symbol': ('symbol', 'ticker'),
+    'name': ('name', 'company', 'company name', 'longname'),
+    'exchange': ('exchange',),
+    'type': ('type', 'quotetype'),
+    'aliases': ('aliases', 'alias'),
+}
+
+
+def trigrams(text: str) -> List[str]:
+    """Distinct character trigrams of a normalized name, padded at word edges"""
+    padded = f'  {text} '
+    return list(dict.fromkeys(padded[i:i + 3] for i in range(len(padded) - 2)))
+
+
+class TickerIndex:
+    def __init__(self, records: pd.DataFrame):
+        """
+        In-memory ticker master with a trigram inverted index over names
+
+        Each row's name and every alias is indexed as its own entry pointing
+        back at the row. A lookup counts shared trigrams with numpy, keeps the
+        best candidates by Dice overlap and only fuzzy-scores those. Trigrams
+        found in a large share of names (' in', 'inc', ...) are skipped when
+        counting, since they do not narrow the candidates.
+
+        Args:
+            records (pd.DataFrame): 'symbol' and 'name' columns, optionally
+                'exchange', 'type' and 'aliases' ('|'-separated alternative
+                names or listings, e.g. 'TATAMOTORS.NS|Tata Motors Ltd')
+        """
+        records = records.copy()
+        for column in ['symbol', 'name', 'exchange', 'type', 'aliases']:
+            if column not in records:
+                records[column] = ''
+        records = records.fillna('')
+        records['symbol'] = records['symbol'].astype(str).str.strip().str.upper()
+        records = records[records['symbol'] != ''].reset_index(drop=True)
+        self.records = records
+        self._rows = records[['symbol', 'name', 'exchange', 'type']].to_dict('records')
+
+        # Exact symbol lookups: listed symbol, alias listings and bare symbols without the '.NS' style suffix
+        self.by_symbol: Dict[str, List[int]] = defaultdict(list)
+        self.by_name: Dict[str, List[int]] = defaultdict(list)
+        entry_names, entry_rows = [], []
+        for row, (symbol, name, aliases) in enumerate(zip(records['symbol'], records['name'], records['aliases'])):
+            aliases = [a.strip() for a in str(aliases).split('|') if a.strip()]
+            for alias_symbol in {symbol, symbol.split('.')[0]} | {a.upper() for a in aliases if ' ' not in a}:
+                self.by_symbol[alias_symbol].append(row)
+            for text in [name] + aliases:
+                text = normalize_name(text)
+                if text:
+                    entry_names.append(text)
+                    entry_rows.append(row)
+                    self.by_name[text].append(row)
+
+        postings = defaultdict(list)
+        sizes = np.zeros(len(entry_names), dtype=np.int32)
+        for entry, text in enumerate(entry_names):
+            grams = trigrams(text)
+            sizes[entry] = len(grams)
+            for gram in grams:
+                postings[gram].append(entry)
+        self._postings = {gram: np.asarray(entries, dtype=np.int32) for gram, entries in postings.items()}
+        self._entry_names = entry_names
+        self._entry_rows = np.asarray(entry_rows, dtype=np.int32)
+        self._entry_sizes = sizes
+
+    @classmethod
+    def load(cls, path) -> 'TickerIndex':
+        """
+        Build an index from a CSV or Parquet master file
+
+        Args:
+            path (str or Path): Master file with symbol and name columns
+
+        Returns:
+            TickerIndex: Index over the file's rows
+        """
+        path = Path(path)
+        frame = pd.read_parquet(path) if path.suffix.lower() == '.parquet' else pd.read_csv(path, dtype=str)
+        lower = {str(c).strip().lower(): c for c in frame.columns}
+        columns = {}
+        for column, names in _COLUMNS.items():
+            source = next((lower[n] for n in names if n in lower), None)
+            if source is not None:
+                columns[source] = column
+        return cls(frame[list(columns)].rename(columns=columns))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _result(self, row: int, score: float) -> Dict:
+        record = self._rows[row]
+        return {
+            'symbol': record['symbol'],
+            'name': record['name'],
+            'exchange': record['exchange'],
+            'type': record['type'] or 'EQUITY',
+            'source': 'Local index',
+            'match_score': score,
+        }
+
+    def candidates(self, query: str, max_candidates: int = 20, min_overlap: float = 0.3,
+                   common_share: float = 0.02) -> np.ndarray:
+        """
+        Entries sharing enough trigrams with the query, best Dice overlap first
+
+        Args:
+            query (str): Normalized company name
+            max_candidates (int): Entries kept for fuzzy scoring
+            min_overlap (float): Fraction of the counted trigrams an entry must share
+            common_share (float): Trigrams in more than this share of entries are not counted
+
+        Returns:
+            np.ndarray: Entry ids
+        """
+        grams = sorted((self._postings[g] for g in trigrams(query) if g in self._postings), key=len)
+        if not grams:
+            return np.empty(0, dtype=np.int32)
+        limit = max(1000, common_share * len(self._entry_names))
+        selective = [postings for postings in grams if len(postings) <= limit] or grams[:1]
+        hits, shared = np.unique(np.concatenate(selective), return_counts=True)
+        keep = shared >= max(1, min_overlap * len(selective))
+        hits, shared = hits[keep], shared[keep]
+        dice = 2 * shared / (len(selective) + self._entry_sizes[hits])
+        if len(hits) > max_candidates:
+            keep = np.argpartition(-dice, max_candidates)[:max_candidates]
+            hits, dice = hits[keep], dice[keep]
+        return hits[np.argsort(-dice, kind='stable')]
+
+    def search(self, company_name: str, limit: int = 10, threshold: int = 60) -> List[Dict]:
+        """
+        Find listings for a company name or symbol
+
+        Args:
+            company_name (str): Name, alias or symbol to look up
+            limit (int): Maximum results
+            threshold (int): Minimum fuzzy score (0-100), as in _is_name_match
+
+        Returns:
+            List[Dict]: Results shaped like the network sources', best first
+        """
+        query = normalize_name(company_name)
+        best: Dict[int, float] = {}
+        for row in self.by_symbol.get(company_name.strip().upper(), []) + self.by_name.get(query, []):
+            best[row] = 100
+
+        # Exact symbol or name hits already fill the request, skip fuzzy scoring
+        if query and len(best) < limit:
+            entries = self.candidates(query)
+            scores = score_names(query, [self._entry_names[entry] for entry in entries])
+            for entry, score in zip(entries, scores.tolist()):
+                row = int(self._entry_rows[entry])
+                if score >= threshold and score > best.get(row, -1):
+                    best[row] = score
+
+        ranked = sorted(best.items(), key=lambda item: -item[1])[:limit]
+        return [self._result(row, score) for row, score in ranked]
+
+
+def master_file_path() -> Optional[Path]:
+    """$STOCK_AGENT_TICKER_MASTER, else tickers.parquet/.csv in $STOCK_AGENT_DATA_DIR"""
+    configured = os.getenv('STOCK_AGENT_TICKER_MASTER')
+    if configured:
+        return Path(configured)
+    base = Path(os.getenv('STOCK_AGENT_DATA_DIR', Path.home() / '.cache' / 'stock_agent'))
+    return next((base / name for name in ('tickers.parquet', 'tickers.csv') if (base / name).exists()), None)
+
+
+_ticker_index = None
+
+
+def get_ticker_index() -> TickerIndex:
+    """Return the process-wide ticker index, empty when no master file is configured"""
+    global _ticker_index
+    if _ticker_index is None:
+        path = master_file_path()
+        try:
+            _ticker_index = TickerIndex.load(path) if path else TickerIndex(pd.DataFrame())
+        except (OSError, ValueError, ImportError) as e:
+            # ImportError: a parquet master without pyarrow or fastparquet installed
+            print(f"Could not load ticker master {path}: {e}")
+            _ticker_index = TickerIndex(pd.DataFrame())
+    return _ticker_index
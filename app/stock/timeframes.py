@@ -0,0 +1,135 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Tuple
+
+from .indicators import latest_technical_indicators
+
+# Timeframe -> bar length in minutes; '1d' and '1w' follow exchange-local days and weeks
+TIMEFRAMES = {'5m': 5, '15m': 15, '30m': 30, '1h': 60, '1d': 1440, '1w': 10080}
+
+# Finest requested timeframe -> (yfinance interval, longest period Yahoo serves at it)
+SOURCE_INTERVALS = {
+    '5m': ('5m', '60d'),
+    '15m': ('15m', '60d'),
+    '30m': ('30m', '60d'),
+    '1h': ('60m', '730d'),
+    '1d': ('1d', '5y'),
+    '1w': ('1d', '5y'),
+}
+
+DEFAULT_TIMEFRAMES = ['1h', '1d', '1w']
+
+# Timeframes that can be built from daily bars, without an intraday download
+DAILY_TIMEFRAMES = ['1d', '1w']
+
+_DAY_NS = 86_400 * 10**9
+
+
+def source_interval(timeframes: List[str]) -> Tuple[str, str]:
+    """
+    Pick the single upstream interval every requested timeframe can be built from
+
+    Args:
+        timeframes (List[str]): Timeframes from TIMEFRAMES
+
+    Returns:
+        Tuple[str, str]: yfinance interval and the longest period available for it
+    """
+    unknown = [tf for tf in timeframes if tf not in TIMEFRAMES]
+    if unknown:
+        raise ValueError(f"Unsupported timeframe: {', '.join(unknown)}")
+    finest = min(timeframes, key=TIMEFRAMES.get)
+    return SOURCE_INTERVALS[finest]
+
+
+def _bucket_keys(wall: np.ndarray, timeframe: str) -> np.ndarray:
+    """Start of the bar each timestamp falls in, as local wall-clock nanoseconds"""
+    day = wall - wall % _DAY_NS
+    if timeframe == '1d':
+        return day
+    if timeframe == '1w':
+        # 1970-01-01 was a Thursday; step back to the Monday of each week
+        return day - ((day // _DAY_NS + 3) % 7) * _DAY_NS
+
+    # Intraday bars are anchored on each session's first bar (e.g. 9:30, 10:30, ...)
+    freq = TIMEFRAMES[timeframe] * 60 * 10**9
+    day_starts = np.flatnonzero(np.r_[True, day[1:] != day[:-1]])
+    day_open = np.repeat(wall[day_starts], np.diff(np.r_[day_starts, len(wall)]))
+    return day_open + (wall - day_open) // freq * freq
+
+
+def resample_bars(hist: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """
+    Aggregate OHLCV bars into a coarser timeframe
+
+    Buckets are found in one pass over the sorted index and each field is
+    reduced with ``ufunc.reduceat``, so no per-bucket Python work is done.
+
+    Args:
+        hist (pd.DataFrame): Bars sorted by time, at the source interval or finer
+        timeframe (str): Target timeframe from TIMEFRAMES
+
+    Returns:
+        pd.DataFrame: OHLCV bars indexed by bucket start in the source time zone
+    """
+    if timeframe not in TIMEFRAMES:
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+    hist = hist[hist['Close'].notna()]
+    if hist.empty:
+        return hist[['Open', 'High', 'Low', 'Close', 'Volume']]
+
+    dates = pd.DatetimeIndex(hist.index)
+    wall = (dates.tz_localize(None) if dates.tz is not None else dates).as_unit('ns').asi8
+    keys = _bucket_keys(wall, timeframe)
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)] - 1
+
+    high = hist['High'].to_numpy(dtype=np.float64)
+    low = hist['Low'].to_numpy(dtype=np.float64)
+    bars = pd.DataFrame({
+        'Open': hist['Open'].to_numpy(dtype=np.float64)[starts],
+        'High': np.fmax.reduceat(high, starts),
+        'Low': np.fmin.reduceat(low, starts),
+        'Close': hist['Close'].to_numpy(dtype=np.float64)[ends],
+        'Volume': np.add.reduceat(np.nan_to_num(hist['Volume'].to_numpy(dtype=np.float64)), starts).astype(np.int64),
+    }, index=pd.DatetimeIndex(keys[starts].view('datetime64[ns]'), name=dates.name).as_unit(dates.unit))
+    if dates.tz is not None:
+        bars.index = bars.index.tz_localize(dates.tz)
+    return bars
+
+
+def multi_timeframe_bars(hist: pd.DataFrame, timeframes: List[str] = None) -> Dict[str, pd.DataFrame]:
+    """Resample one fine-grained history into every requested timeframe"""
+    timeframes = DEFAULT_TIMEFRAMES if timeframes is None else timeframes
+    return {timeframe: resample_bars(hist, timeframe) for timeframe in timeframes}
+
+
+def is_intraday(timeframe: str) -> bool:
+    """Whether a timeframe's bars are shorter than a day; unknown ones count, so source_interval rejects them"""
+    return TIMEFRAMES.get(timeframe, 0) < TIMEFRAMES['1d']
+
+
+def multi_timeframe_indicators(hist: pd.DataFrame, timeframes: List[str] = None) -> Dict[str, Dict]:
+    """
+    Compute ``technical_data`` for several timeframes from a single history
+
+    '52 Week High' and '52 Week Low' are taken over the last 52 weeks of
+    ``hist`` whatever its length, so they match their label in every timeframe.
+
+    Args:
+        hist (pd.DataFrame): Bars at the finest requested interval
+        timeframes (List[str]): Timeframes from TIMEFRAMES, defaults to DEFAULT_TIMEFRAMES
+
+    Returns:
+        Dict[str, Dict]: technical_data per timeframe, empty when no bars remain
+    """
+    results = {}
+    hist = hist[hist['Close'].notna()]
+    if not hist.empty:
+        year = hist[hist.index > hist.index[-1] - pd.Timedelta(weeks=52)]
+        high_52w, low_52w = round(float(year['High'].max()), 2), round(float(year['Low'].min()), 2)
+    for timeframe, bars in multi_timeframe_bars(hist, timeframes).items():
+        results[timeframe] = latest_technical_indicators(bars) if not bars.empty else {}
+        if results[timeframe]:
+            results[timeframe].update({'52 Week High': high_52w, '52 Week Low': low_52w})
+    return results
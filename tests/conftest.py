@@ -0,0 +1,20 @@
+import pytest
+import pandas as pd
+from app.stock import (alpha_vantage, article_store, http_transport, price_store, rate_limit, statements,
+                       symbol_memo, ticker_cache, ticker_index)
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path, monkeypatch):
+    """Keep StockAnalyzer's shared stores out of the user's cache directory"""
+    monkeypatch.setattr(price_store, '_price_store', price_store.PriceStore(tmp_path / 'prices'))
+    monkeypatch.setattr(statements, '_statements_cache',
+                        statements.FinancialStatementsCache(tmp_path / 'statements'))
+    monkeypatch.setenv('STOCK_AGENT_DATA_DIR', str(tmp_path))
+    monkeypatch.setattr(alpha_vantage, '_clients', {})
+    monkeypatch.setattr(ticker_cache, '_snapshot_cache', ticker_cache.TickerSnapshotCache())
+    monkeypatch.setattr(ticker_index, '_ticker_index', ticker_index.TickerIndex(pd.DataFrame()))
+    monkeypatch.setattr(symbol_memo, '_symbol_memo', symbol_memo.SymbolMemo(tmp_path / 'symbols.sqlite'))
+    monkeypatch.setattr(rate_limit, '_host_limiter', rate_limit.HostRateLimiter())
+    monkeypatch.setattr(http_transport, '_http_transport', None)
+    monkeypatch.setattr(article_store, '_article_store', article_store.ArticleStore(tmp_path / 'articles.sqlite'))
@@ -0,0 +1,76 @@
+import threading
+import time
+import types
+import pytest
+from app.stock.alpha_vantage import AlphaVantageClient, TokenBucket, QuotaExceeded
+
+
+class DummyResponse:
+    def __init__(self, data):
+        self._data = data
+    def raise_for_status(self):
+        pass
+    def json(self):
+        return self._data
+
+
+class DummySession:
+    def __init__(self, data=None, delay=0.0):
+        self.data = data if data is not None else {'Symbol': 'AAPL'}
+        self.delay = delay
+        self.calls = []
+    def get(self, url, params=None, timeout=None):
+        self.calls.append(params)
+        time.sleep(self.delay)
+        return DummyResponse(self.data)
+
+
+def test_token_bucket_limits_bursts(monkeypatch):
+    clock = types.SimpleNamespace(now=0.0, slept=[])
+    def sleep(seconds):
+        clock.slept.append(seconds)
+        clock.now += seconds
+    monkeypatch.setattr('app.stock.rate_limit.time', types.SimpleNamespace(monotonic=lambda: clock.now, sleep=sleep))
+    bucket = TokenBucket(rate=1000, capacity=2)
+    assert bucket.try_acquire() and bucket.try_acquire()
+    assert not bucket.try_acquire()
+    assert bucket.wait_time() == pytest.approx(0.001)
+    # Waits for exactly one token to refill
+    bucket.acquire()
+    assert clock.slept == pytest.approx([0.001])
+
+
+def test_concurrent_requests_are_coalesced(tmp_path):
+    session = DummySession(delay=0.2)
+    client = AlphaVantageClient('key', cache_dir=tmp_path, session=session)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.query('OVERVIEW', symbol='AAPL')))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(session.calls) == 1
+    assert results == [{'Symbol': 'AAPL'}] * 5
+
+    # A new client with the same cache directory does not call upstream again
+    other = AlphaVantageClient('key', cache_dir=tmp_path, session=DummySession())
+    assert other.query('OVERVIEW', symbol='AAPL') == {'Symbol': 'AAPL'}
+    assert other.session.calls == []
+
+
+def test_rate_limit_notices_are_not_cached(tmp_path):
+    session = DummySession({'Note': 'Thank you for using Alpha Vantage! Our standard API rate limit is ...'})
+    client = AlphaVantageClient('key', cache_dir=tmp_path, session=session)
+    client.query('OVERVIEW', symbol='AAPL')
+    client.query('OVERVIEW', symbol='AAPL')
+    assert len(session.calls) == 2
+
+
+def test_daily_quota_exhaustion_raises(tmp_path):
+    session = DummySession()
+    client = AlphaVantageClient('key', requests_per_day=1, cache_dir=tmp_path, session=session)
+    client.query('NEWS_SENTIMENT', tickers='AAPL')
+    with pytest.raises(QuotaExceeded):
+        client.query('NEWS_SENTIMENT', tickers='MSFT')
+    assert len(session.calls) == 1
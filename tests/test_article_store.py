@@ -0,0 +1,122 @@
+from app.stock.article_store import ArticleStore, article_key
+from app.stock.near_duplicates import article_text
+from app.stock.stock_news import StockNewsExtractor, get_recent_news
+
+
+def test_store_keeps_first_seen(tmp_path):
+    store = ArticleStore(tmp_path / 'articles.sqlite')
+    old = {'title': 'Old story', 'url': 'https://example.com/a/', 'published': '2024-01-01 10:00:00'}
+    fresh = {'title': 'Fresh story', 'url': 'https://example.com/b', 'published': 'not a date'}
+    assert store.add('aapl', [old, fresh], now=1_800_000_000) == 2
+    assert store.add('AAPL', [dict(old, url='https://EXAMPLE.com/a#comments')], now=1_800_000_100) == 0
+
+    recent = ArticleStore(tmp_path / 'articles.sqlite').recent('AAPL', hours=1, now=1_800_000_100)
+    # Undated articles count from when they were first seen
+    assert recent['title'].tolist() == ['Fresh story']
+    assert store.get_many('AAPL', [article_key(old), 'missing']) == {article_key(old): old}
+
+
+def test_high_water_per_source_from_dated_articles(tmp_path):
+    store = ArticleStore(tmp_path / 'articles.sqlite')
+    dated = {'title': 'Dated', 'published': '2027-01-15T10:00:00Z'}
+    store.advance_high_water('aapl', 'newsapi', [dated, {'title': 'Undated', 'published': ''}], now=1_900_000_000)
+    store.advance_high_water('AAPL', 'finviz', [{'title': 'Undated', 'published': 'yesterday'}], now=1_900_000_000)
+    # An older batch never moves a mark back
+    store.advance_high_water('AAPL', 'newsapi', [{'title': 'Old', 'published': '2026-01-01T00:00:00Z'}],
+                             now=1_900_000_100)
+
+    assert store.high_water('AAPL', 'newsapi') == 1_800_007_200
+    assert store.high_water('AAPL', 'finviz') is None
+    assert store.high_water('MSFT', 'newsapi') is None
+
+
+def test_comprehensive_news_processes_only_new_articles(monkeypatch):
+    extractor = StockNewsExtractor()
+    batches = [[{'title': 'Apple beats estimates', 'summary': '', 'url': 'https://example.com/1', 'published': ''}],
+               [{'title': 'Apple beats estimates', 'summary': '', 'url': 'https://example.com/1', 'published': ''},
+                {'title': 'Apple shares fall', 'summary': '', 'url': 'https://example.com/2', 'published': ''}]]
+    monkeypatch.setattr(extractor, 'get_finviz_news', lambda symbol: batches.pop(0))
+    analyzed = []
+    analyze = extractor.analyze_sentiment
+    monkeypatch.setattr(extractor, 'analyze_sentiment', lambda text: analyzed.append(text) or analyze(text))
+
+    extractor.get_comprehensive_news('AAPL', sources=['finviz'])
+    df = extractor.get_comprehensive_news('AAPL', sources=['finviz'])
+    assert len(df) == 2 and set(df['sentiment']) == {'Positive', 'Negative'}
+    assert analyzed == ['Apple beats estimates ', 'Apple shares fall ']
+    assert sorted(get_recent_news('AAPL')['title']) == ['Apple beats estimates', 'Apple shares fall']
+
+
+def test_comprehensive_news_keeps_one_copy_per_story(monkeypatch):
+    extractor = StockNewsExtractor()
+    story = 'Apple shares rise 3% after record iPhone sales'
+    yahoo = [{'title': story, 'summary': '', 'url': 'https://yahoo.example.com/1', 'published': '', 'source': 'Yahoo'}]
+    google = [{'title': f'{story} - Reuters', 'summary': '', 'url': 'https://google.example.com/1', 'published': '',
+               'source': 'Reuters'},
+              {'title': 'Apple stock falls after earnings miss', 'summary': '', 'url': 'https://google.example.com/2',
+               'published': '', 'source': 'Reuters'}]
+    monkeypatch.setattr(extractor, 'get_yahoo_finance_news', lambda symbol: [dict(a) for a in yahoo])
+    monkeypatch.setattr(extractor, 'get_google_news', lambda symbol, company: [dict(a) for a in google])
+
+    df = extractor.get_comprehensive_news('AAPL', 'Apple', sources=['yahoo', 'google'])
+    assert sorted(df['source']) == ['Reuters', 'Yahoo']
+    assert story in df['title'].tolist()
+
+    # Later only the copy is published; the stored original stands in for it
+    yahoo.clear()
+    df = extractor.get_comprehensive_news('AAPL', 'Apple', sources=['yahoo', 'google'])
+    assert sorted(df['title']) == [story, 'Apple stock falls after earnings miss']
+    assert len(get_recent_news('AAPL')) == 2
+
+
+def test_newsapi_asks_only_for_newer_articles(monkeypatch):
+    extractor = StockNewsExtractor()
+    calls = []
+    def newsapi(symbol, company_name, api_key, limit=10, since=None):
+        calls.append(since)
+        if since:
+            return []
+        return [{'title': 'Apple launches a product', 'summary': '', 'url': 'https://example.com/n',
+                 'published': '2026-01-15T10:00:00Z', 'source': 'Reuters', 'extraction_method': 'NewsAPI'}]
+    monkeypatch.setattr(extractor, 'get_newsapi_stock_news', newsapi)
+    monkeypatch.setattr(extractor, 'get_finviz_news',
+                        lambda symbol: [{'title': 'Undated note', 'summary': '', 'url': 'https://example.com/f',
+                                         'published': '', 'source': 'Finviz'}])
+    for _ in range(2):
+        df = extractor.get_comprehensive_news('AAPL', 'Apple', news_api_key='key', sources=['finviz', 'newsapi'])
+    assert calls == [None, 1_768_471_200]
+    # Stories NewsAPI returned before are still in the results
+    assert sorted(df['title']) == ['Apple launches a product', 'Undated note']
+
+
+def test_similar_matches_only_recent_originals(tmp_path):
+    store = ArticleStore(tmp_path / 'articles.sqlite')
+    hasher = store.hasher
+    article = {'title': 'Apple beats estimates as iPhone sales hit a record', 'summary': '',
+               'url': 'https://example.com/q', 'published': ''}
+    signature = hasher.signature(article_text(article))
+    store.add('AAPL', [article], now=1_800_000_000, signatures=[signature])
+
+    assert store.similar('AAPL', signature, now=1_800_000_000 + 71 * 3600) == article_key(article)
+    # Last quarter's story is not an original for this quarter's copy
+    assert store.similar('AAPL', signature, now=1_800_000_000 + 73 * 3600) is None
+    assert store.similar('AAPL', signature, window_hours=96, now=1_800_000_000 + 73 * 3600) == article_key(article)
+
+
+def test_store_reads_source_date_formats(tmp_path):
+    from datetime import datetime
+    from app.stock.article_store import _published_epoch
+    now = datetime(2026, 10, 17, 12, 0).timestamp()
+    # Seeking Alpha leaves out the year; a date later in the year is from last year
+    assert _published_epoch('Oct 16', now) == datetime(2026, 10, 16).timestamp()
+    assert _published_epoch('Dec 30', now) == datetime(2025, 12, 30).timestamp()
+    # A Finviz time of day alone has no date
+    assert _published_epoch('08:15AM', now) is None
+    assert _published_epoch('Oct-15-26 08:15AM', now) == datetime(2026, 10, 15, 8, 15).timestamp()
+    assert _published_epoch('2026-10-15T14:00:00Z', now) == 1_792_072_800
+
+    store = ArticleStore(tmp_path / 'articles.sqlite')
+    store.add('AAPL', [{'title': 'Seeking Alpha note', 'url': 'https://example.com/s', 'published': 'Oct 16'},
+                       {'title': 'Old Finviz row', 'url': 'https://example.com/f', 'published': 'Sep-02-26 08:15AM'}],
+              now=now)
+    assert store.recent('AAPL', hours=48, now=now)['title'].tolist() == ['Seeking Alpha note']
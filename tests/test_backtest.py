@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+from app.stock.backtest import (
+    positions_from_signals,
+    backtest_positions,
+    backtest_history,
+    SIGNAL_RULES,
+)
+
+
+def test_positions_hold_until_opposite_signal():
+    buy = np.array([False, True, False, False, True, False, False])
+    sell = np.array([True, False, False, True, False, False, True])
+    assert positions_from_signals(buy, sell).tolist() == [0, 1, 1, 0, 1, 1, 0]
+
+
+def test_backtest_positions_with_costs():
+    close = np.array([100.0, 110.0, 121.0, 110.0, 99.0])[:, None]
+    position = np.array([1.0, 1.0, 0.0, 1.0, 0.0])[:, None]
+    metrics = backtest_positions(close, position, cost_bps=100)
+    # Trade 1: buy at 100, sell at 121; trade 2: buy at 110, sell at 99.
+    # Costs come off the bar's return when the position changes.
+    first = 0.99 * 1.1 * (1.1 - 0.01)
+    second = 0.99 * (0.9 - 0.01)
+    assert np.isclose(metrics['total_return'][0], first * second - 1)
+    assert metrics['trades'][0] == 2
+    assert metrics['hit_rate'][0] == 0.5
+    assert np.isclose(metrics['max_drawdown'][0], second - 1)
+
+
+def test_backtest_history_reports_every_rule():
+    rng = np.random.default_rng(3)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 500)))
+    hist = pd.DataFrame({'Close': close, 'High': close * 1.01, 'Low': close * 0.99})
+    result = backtest_history(hist)
+    assert list(result.index) == SIGNAL_RULES
+    assert {'total_return', 'max_drawdown', 'hit_rate', 'trades'} <= set(result.columns)
+    assert (result['max_drawdown'] <= 0).all()
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+from app.stock.compact_history import CompactHistory
+from app.stock.indicators import compute_indicators, panel_technical_data
+
+
+def make_frame(rows=260, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, rows)))
+    index = pd.bdate_range('2024-01-02', periods=rows, tz='America/New_York', name='Date')
+    return pd.DataFrame({'Open': close, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close,
+                         'Volume': rng.integers(100_000, 1_000_000, rows).astype(float),
+                         'Dividends': 0.0, 'Stock Splits': 0.0}, index=index)
+
+
+def test_round_trip_shares_memory():
+    hist = make_frame()
+    compact = CompactHistory.from_frame(hist, 'AAPL')
+    assert compact.close.dtype == np.float32 and compact.index.dtype == np.int64
+    assert compact.volume.dtype == np.float64
+    assert compact.nbytes == len(hist) * (8 + 4 * 4 + 8)
+
+    frame = compact.to_frame()
+    assert list(frame.columns) == ['Open', 'High', 'Low', 'Close', 'Volume']
+    assert frame.index.equals(hist.index)
+    assert np.shares_memory(frame['Close'].to_numpy(), compact.close)
+    again = CompactHistory.from_frame(frame, 'AAPL')
+    assert np.shares_memory(again.close, compact.close)
+
+
+def test_indicators_run_in_float32():
+    hist = make_frame()
+    compact = CompactHistory.from_frame(hist, include_volume=False)
+    result = compact.indicators(['SMA_50', 'RSI', 'MACD_Signal', 'BB_Upper'])
+    expected = compute_indicators({field: hist[field] for field in ['Close', 'High', 'Low']},
+                                  ['SMA_50', 'RSI', 'MACD_Signal', 'BB_Upper'])
+    for name, values in result.items():
+        assert values.dtype == np.float32
+        np.testing.assert_allclose(values[:, 0], expected[name], rtol=1e-4, atol=1e-4)
+
+
+def test_download_builds_float32_panel(monkeypatch):
+    frames = {'AAPL': make_frame(seed=1), 'MSFT': make_frame(seed=2)}
+    fields = ['Open', 'High', 'Low', 'Close', 'Volume']
+    data = pd.concat({(field, symbol): frame[field] for symbol, frame in frames.items() for field in fields},
+                     axis=1)
+    monkeypatch.setattr('yfinance.download', lambda *args, **kwargs: data)
+    panel = CompactHistory.download(['aapl', 'msft'])
+    assert panel.symbols == ['AAPL', 'MSFT'] and panel.close.flags.f_contiguous
+    assert panel.to_frame('MSFT').index.tz is not None
+
+    results = panel.technical_data()
+    close = np.column_stack([frames[s]['Close'] for s in ['AAPL', 'MSFT']])
+    volume = np.column_stack([frames[s]['Volume'] for s in ['AAPL', 'MSFT']])
+    expected = panel_technical_data(['AAPL', 'MSFT'], close, close * 1.01, close * 0.99, volume)
+    assert results['MSFT']['Volume'] == expected['MSFT']['Volume']
+    assert abs(results['MSFT']['SMA 200'] - expected['MSFT']['SMA 200']) <= 0.01
+
+
+def test_volume_keeps_exact_share_counts(monkeypatch):
+    hist = make_frame(rows=3)
+    hist['Volume'] = [50_123_457.0, 123_456_789.0, 1.0]
+    compact = CompactHistory.from_frame(hist)
+    assert compact.to_frame()['Volume'].tolist() == [50_123_457, 123_456_789, 1]
+
+    data = pd.concat({(field, 'AAPL'): hist[field] for field in ['Open', 'High', 'Low', 'Close', 'Volume']}, axis=1)
+    monkeypatch.setattr('yfinance.download', lambda *args, **kwargs: data)
+    panel = CompactHistory.download(['AAPL'])
+    assert panel.volume[:, 0].tolist() == [50_123_457, 123_456_789, 1]
@@ -0,0 +1,38 @@
+from app.stock.http_transport import HttpTransport
+from app.stock.rate_limit import HostRateLimiter
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+
+def test_fetch_skips_parsing_on_304(monkeypatch):
+    transport = HttpTransport(limiter=HostRateLimiter(default_rate=1000))
+    sent = []
+    def get(url, params=None, headers=None, **kwargs):
+        sent.append(dict(headers))
+        if headers.get('If-None-Match') == '"v1"':
+            return FakeResponse(304)
+        return FakeResponse(200, b'<rss/>', {'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'})
+    monkeypatch.setattr(transport.session, 'get', get)
+    parsed = []
+    def parse(response):
+        parsed.append(response.content)
+        return ['article']
+
+    url = 'https://feeds.example.com/news'
+    assert transport.fetch(url, parse, params={'q': 'AAPL stock'}) == ['article']
+    assert transport.fetch(url, parse, params={'q': 'AAPL stock'}) == ['article']
+    assert parsed == [b'<rss/>']
+    assert sent[1] == {'If-None-Match': '"v1"', 'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'}
+
+    # Another query string is another resource
+    transport.fetch(url, parse, params={'q': 'MSFT stock'})
+    assert sent[2] == {} and len(parsed) == 2
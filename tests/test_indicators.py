@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+from app.stock.indicators import (
+    ewm_mean,
+    rolling_std,
+    panel_technical_data,
+    batch_technical_indicators,
+    IncrementalIndicators,
+    INDICATOR_REGISTRY,
+    compute_indicators,
+    register_indicator,
+)
+
+
+def make_panel(rows=260, cols=3, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (rows, cols)), axis=0))
+    high = close * (1 + rng.uniform(0, 0.02, (rows, cols)))
+    low = close * (1 - rng.uniform(0, 0.02, (rows, cols)))
+    volume = rng.integers(100_000, 1_000_000, (rows, cols)).astype(float)
+    return close, high, low, volume
+
+
+def test_panel_primitives_match_pandas():
+    close, _, _, _ = make_panel()
+    close[:30, 1] = np.nan
+    expected_ewm = pd.DataFrame(close).ewm(span=12).mean().to_numpy()
+    expected_std = pd.DataFrame(close).rolling(window=20).std().to_numpy()
+    np.testing.assert_allclose(ewm_mean(close, 12), expected_ewm)
+    np.testing.assert_allclose(rolling_std(close, 20), expected_std)
+
+
+def test_panel_matches_single_symbol_history():
+    close, high, low, volume = make_panel()
+    # Interior gap, e.g. a holiday on another exchange
+    for values in (close, high, low, volume):
+        values[100, 2] = np.nan
+    results = panel_technical_data(['A', 'B', 'C'], close, high, low, volume)
+
+    keep = ~np.isnan(close[:, 2])
+    hist = pd.Series(close[keep, 2])
+    assert results['C']['SMA 200'] == round(hist.rolling(window=200).mean().iloc[-1], 2)
+    delta = hist.diff()
+    gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    assert results['C']['RSI'] == round((100 - 100 / (1 + gain / loss)).iloc[-1], 2)
+    assert results['A']['52 Week High'] == round(high[:, 0].max(), 2)
+
+
+def test_batch_technical_indicators(monkeypatch):
+    close, high, low, volume = make_panel(cols=2)
+    fields = {'Open': close, 'High': high, 'Low': low, 'Close': close, 'Volume': volume}
+    columns = pd.MultiIndex.from_product([list(fields), ['AAPL', 'MSFT']])
+    data = pd.DataFrame(np.hstack(list(fields.values())), columns=columns)
+    monkeypatch.setattr('yfinance.download', lambda *args, **kwargs: data)
+    results = batch_technical_indicators(['aapl', 'msft', 'tsla'])
+    assert results['AAPL']['Current Price'] == round(close[-1, 0], 2)
+    assert results['MSFT']['SMA 20'] == round(close[-20:, 1].mean(), 2)
+    assert results['TSLA'] == {}
+
+
+def test_incremental_indicators_match_panel():
+    close, high, low, volume = make_panel(cols=1)
+    hist = pd.DataFrame({'Close': close[:, 0], 'High': high[:, 0],
+                         'Low': low[:, 0], 'Volume': volume[:, 0]})
+    state = IncrementalIndicators.from_history(hist.iloc[:250])
+    for _, bar in hist.iloc[250:].iterrows():
+        technical = state.update(bar)
+    expected = panel_technical_data(['A'], close, high, low, volume)['A']
+    assert technical == expected
+
+
+def test_incremental_indicators_replace_last():
+    close, high, low, volume = make_panel(cols=1)
+    hist = pd.DataFrame({'Close': close[:, 0], 'High': high[:, 0],
+                         'Low': low[:, 0], 'Volume': volume[:, 0]})
+    state = IncrementalIndicators.from_history(hist.iloc[:-1])
+    partial = dict(hist.iloc[-1])
+    partial['Close'] *= 1.05
+    state.update(partial)
+    revised = state.update(hist.iloc[-1], replace_last=True)
+    assert revised == IncrementalIndicators.from_history(hist).technical_data()
+
+
+def test_registry_computes_shared_intermediates_once(monkeypatch):
+    close, high, low, volume = make_panel(cols=1)
+    calls = []
+    def counting_std(values, window):
+        calls.append(window)
+        return rolling_std(values, window)
+    monkeypatch.setitem(INDICATOR_REGISTRY, 'STD_20', INDICATOR_REGISTRY['STD_20'])
+    register_indicator('STD_20', counting_std, ['Close'], window=20)
+    result = compute_indicators({'Close': close, 'High': high, 'Low': low},
+                                ['BB_Upper', 'BB_Lower', 'RSI'])
+    assert list(result) == ['BB_Upper', 'BB_Lower', 'RSI']
+    assert calls == [20]
+
+
+def test_atr_and_obv_match_pandas():
+    close, high, low, volume = make_panel(cols=1)
+    hist = pd.DataFrame({'Close': close[:, 0], 'High': high[:, 0],
+                         'Low': low[:, 0], 'Volume': volume[:, 0]})
+    result = compute_indicators({field: hist[field] for field in hist}, ['ATR_14', 'OBV'])
+    prev_close = hist['Close'].shift()
+    true_range = pd.concat([hist['High'] - hist['Low'], (hist['High'] - prev_close).abs(),
+                            (hist['Low'] - prev_close).abs()], axis=1).max(axis=1)
+    np.testing.assert_allclose(result['ATR_14'], true_range.rolling(window=14).mean())
+    obv = (np.sign(hist['Close'].diff()).fillna(0) * hist['Volume']).cumsum()
+    np.testing.assert_allclose(result['OBV'], obv)
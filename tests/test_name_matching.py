@@ -0,0 +1,29 @@
+import numpy as np
+from app.stock.name_matching import name_score_matrix, score_names, top_matches
+
+NAMES = ['Apple Inc.', 'Apple Hospitality REIT, Inc.', 'Microsoft Corporation', '', 'Pineapple Energy']
+
+
+def test_scores_match_per_pair_scoring():
+    from rapidfuzz import fuzz
+    scores = score_names('APPLE, Inc', NAMES)
+    assert scores.dtype == np.uint8
+    assert scores[0] == 100 and scores[3] == 0
+    expected = max(fuzz.ratio('apple inc', 'microsoft corporation'),
+                   fuzz.partial_ratio('apple inc', 'microsoft corporation'),
+                   fuzz.token_sort_ratio('apple inc', 'microsoft corporation'))
+    assert scores[2] == round(expected)
+
+
+def test_matrix_scores_many_queries_at_once():
+    matrix = name_score_matrix(['Apple', 'Microsoft', 'Tata Motors'], NAMES, workers=-1)
+    assert matrix.shape == (3, len(NAMES))
+    assert matrix[1].argmax() == 2
+    np.testing.assert_array_equal(matrix[0], score_names('Apple', NAMES))
+
+
+def test_top_matches_with_cutoff():
+    matches = top_matches('Apple', NAMES, limit=2, score_cutoff=60)
+    assert [index for index, _ in matches] == [0, 1]
+    assert all(score >= 60 for _, score in matches)
+    assert top_matches('Zzyzx', NAMES, score_cutoff=60) == []
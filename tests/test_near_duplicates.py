@@ -0,0 +1,36 @@
+from app.stock.near_duplicates import MinHasher, MinHashLSH, article_text, cluster_articles
+
+
+def test_clusters_syndicated_copies():
+    articles = [
+        {'title': 'Apple shares rise 3% after record iPhone sales', 'summary': ''},
+        {'title': 'Apple stock falls after earnings miss', 'summary': ''},
+        {'title': 'Apple shares rise 3% after record iPhone sales - MarketWatch', 'summary': ''},
+        {'title': 'Apple stock rises after earnings beat', 'summary': ''},
+        {'title': 'Apple shares rise 3% after record iPhone sales',
+         'summary': '<a href="https://news.example.com/1">Apple shares rise 3% after record iPhone sales</a>'},
+        {'title': '', 'summary': ''},
+    ]
+    assert cluster_articles(articles) == [[0, 2, 4], [1], [3], [5]]
+
+
+def test_lsh_query_finds_best_match():
+    hasher = MinHasher()
+    index = MinHashLSH(hasher)
+    for key, title in enumerate(['Tesla recalls 2 million vehicles over Autopilot',
+                                 'Nvidia to acquire Arm for $40 billion']):
+        index.insert(key, hasher.signature(article_text({'title': title})))
+    assert index.query(hasher.signature(article_text({'title': 'Nvidia to acquire Arm for $40 billion (Reuters)'}))) == 1
+    assert index.query(hasher.signature(article_text({'title': 'Microsoft cloud growth slows'}))) is None
+    assert len(index) == 2
+
+
+def test_short_titles_differing_in_a_word_stay_apart():
+    articles = [
+        {'title': 'Apple stock rises in premarket trading', 'summary': ''},
+        {'title': 'Apple stock falls in premarket trading', 'summary': ''},
+        {'title': 'Apple Q3 earnings beat estimates', 'summary': ''},
+        {'title': 'Apple Q4 earnings beat estimates', 'summary': ''},
+        {'title': 'Apple stock rises in premarket trading - Yahoo Finance', 'summary': ''},
+    ]
+    assert cluster_articles(articles) == [[0, 4], [1], [2], [3]]
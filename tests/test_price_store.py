@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+from app.stock.price_store import PriceStore
+
+
+def make_bars(start, days):
+    dates = pd.bdate_range(start, periods=days, tz='America/New_York', name='Date')
+    close = np.arange(days, dtype=float) + 100
+    return pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1,
+                         'Close': close, 'Volume': 1000, 'Dividends': 0.0,
+                         'Stock Splits': 0.0}, index=dates)
+
+
+class FakeHistory:
+    def __init__(self, bars):
+        self.bars = bars
+        self.calls = []
+
+    def __call__(self, period=None, start=None):
+        self.calls.append({'period': period, 'start': start})
+        if start is not None:
+            return self.bars[self.bars.index >= pd.Timestamp(start, tz=self.bars.index.tz)]
+        return self.bars
+
+
+def test_repeat_read_served_from_store(tmp_path):
+    bars = make_bars(pd.Timestamp.now().normalize() - pd.DateOffset(months=3), 40)
+    fetch = FakeHistory(bars)
+    store = PriceStore(tmp_path)
+    first = store.get_history('AAPL', fetch, period='6mo')
+    second = store.get_history('AAPL', fetch, period='6mo')
+    assert len(fetch.calls) == 1
+    assert second['Close'].tolist() == bars['Close'].tolist()
+    assert list(second.columns) == ['Open', 'High', 'Low', 'Close', 'Volume']
+    # Reads are memory-mapped, not copied
+    assert not second['Close'].to_numpy().flags.writeable
+    assert len(first) == len(second)
+
+
+def test_stale_store_fetches_only_delta(tmp_path):
+    bars = make_bars(pd.Timestamp.now().normalize() - pd.DateOffset(months=3), 40)
+    fetch = FakeHistory(bars.iloc[:30])
+    store = PriceStore(tmp_path, refresh_interval=0)
+    store.get_history('AAPL', fetch, period='6mo')
+
+    fetch.bars = bars
+    hist = store.get_history('AAPL', fetch, period='6mo')
+    assert fetch.calls[-1] == {'period': None, 'start': bars.index[29].strftime('%Y-%m-%d')}
+    assert hist['Close'].tolist() == bars['Close'].tolist()
+    assert hist.index.equals(bars.index)
+
+
+def test_longer_period_refetches(tmp_path):
+    bars = make_bars(pd.Timestamp.now().normalize() - pd.DateOffset(months=1), 15)
+    fetch = FakeHistory(bars)
+    store = PriceStore(tmp_path)
+    store.get_history('AAPL', fetch, period='1mo')
+    store.get_history('AAPL', fetch, period='5d')
+    store.get_history('AAPL', fetch, period='1y')
+    assert [call['period'] for call in fetch.calls] == ['1mo', '1y']
+
+
+def test_split_in_delta_refetches_adjusted_history(tmp_path):
+    bars = make_bars(pd.Timestamp.now().normalize() - pd.DateOffset(months=3), 40)
+    fetch = FakeHistory(bars.iloc[:30])
+    store = PriceStore(tmp_path, refresh_interval=0)
+    store.get_history('AAPL', fetch, period='6mo')
+
+    # A 4:1 split on bar 35: upstream now reports every earlier bar divided by 4
+    adjusted = bars.copy()
+    adjusted.iloc[:35, :4] /= 4
+    adjusted.iloc[35, adjusted.columns.get_loc('Stock Splits')] = 4.0
+    fetch.bars = adjusted
+    hist = store.get_history('AAPL', fetch, period='6mo')
+    assert fetch.calls[-1]['start'] == (pd.Timestamp.now().normalize() - pd.DateOffset(months=6)).strftime('%Y-%m-%d')
+    assert hist['Close'].tolist() == adjusted['Close'].tolist()
@@ -0,0 +1,48 @@
+import asyncio
+import types
+import pytest
+
+from app.stock import rate_limit
+from app.stock.rate_limit import HostRateLimiter
+
+
+class FakeClock:
+    """Stands in for the time module; sleeping advances the clock instantly"""
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+    def monotonic(self):
+        return self.now
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+    async def async_sleep(self, seconds):
+        self.sleep(seconds)
+
+
+def use_fake_clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit, 'time', clock)
+    monkeypatch.setattr(rate_limit, 'asyncio', types.SimpleNamespace(sleep=clock.async_sleep))
+    return clock
+
+
+def test_host_limiter_paces_each_host_separately(monkeypatch):
+    clock = use_fake_clock(monkeypatch)
+    limiter = HostRateLimiter({'slow.example.com': 20}, default_rate=1000)
+    for _ in range(3):
+        limiter.acquire('https://slow.example.com/search?q=a')
+        limiter.acquire('https://fast.example.com/search')
+    # Two waits of 1/20 s on the slow host; the fast host adds none
+    assert clock.now == pytest.approx(0.1)
+    assert limiter.bucket('slow.example.com') is limiter.bucket('https://slow.example.com/other')
+
+
+def test_host_limiter_async_shares_buckets(monkeypatch):
+    clock = use_fake_clock(monkeypatch)
+    limiter = HostRateLimiter({'api.example.com': 20})
+    async def burst():
+        await asyncio.gather(*(limiter.acquire_async('https://api.example.com/') for _ in range(3)))
+    asyncio.run(burst())
+    # The three requests share one bucket, so two of them wait 1/20 s each
+    assert clock.slept == pytest.approx([0.05, 0.05])
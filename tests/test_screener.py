@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+from app.stock.screener import load_universe, screen_universe
+
+
+class HistoryTicker:
+    def __init__(self, symbol):
+        self.symbol = symbol
+        self.info = {}
+    def history(self, *args, **kwargs):
+        if self.symbol == 'BAD':
+            return pd.DataFrame()
+        close = np.linspace(100, 150, 60)
+        index = pd.bdate_range(end=pd.Timestamp.now().normalize(), periods=60, name='Date')
+        return pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1,
+                             'Close': close, 'Volume': 1000}, index=index)
+
+
+def test_load_universe(tmp_path):
+    text = tmp_path / 'universe.txt'
+    text.write_text('aapl\nMSFT  # software\n\nAAPL\n')
+    assert load_universe(text) == ['AAPL', 'MSFT']
+    csv = tmp_path / 'universe.csv'
+    pd.DataFrame({'Name': ['Apple', 'Tesla'], 'Symbol': ['AAPL', 'TSLA']}).to_csv(csv, index=False)
+    assert load_universe(csv) == ['AAPL', 'TSLA']
+
+
+def test_screen_universe_in_process(monkeypatch, tmp_path):
+    monkeypatch.setattr('yfinance.Ticker', HistoryTicker)
+    progress = []
+    output = tmp_path / 'screen.csv'
+    results = screen_universe(['MSFT', 'BAD', 'AAPL'], output=output, processes=1,
+                              shard_size=2, progress=lambda done, total: progress.append(done))
+    assert results['symbol'].tolist() == ['AAPL', 'BAD', 'MSFT']
+    assert progress == [2, 3]
+    aapl = results.set_index('symbol').loc['AAPL']
+    assert aapl['Current Price'] == 150.0
+    assert 'MACD above Signal Line' in aapl['signals']
+    assert results.set_index('symbol').loc['BAD', 'error'] == 'no data'
+    assert output.exists()
+
+
+def test_screen_universe_falls_back_to_csv_without_parquet_engine(monkeypatch, tmp_path):
+    monkeypatch.setattr('yfinance.Ticker', HistoryTicker)
+    monkeypatch.setattr('app.stock.screener.parquet_available', lambda: False)
+    screen_universe(['AAPL'], output=tmp_path / 'screen.parquet', processes=1)
+    assert not (tmp_path / 'screen.parquet').exists()
+    assert pd.read_csv(tmp_path / 'screen.csv')['symbol'].tolist() == ['AAPL']
@@ -0,0 +1,40 @@
+import pandas as pd
+from app.stock.statements import FinancialStatementsCache, fetch_financial_statements
+
+
+def make_statement(*period_ends):
+    return pd.DataFrame({pd.Timestamp(d): [1.0, 2.0] for d in period_ends},
+                        index=['Total Revenue', 'Net Income'])
+
+
+class StatementTicker:
+    def __init__(self):
+        self.financials = make_statement('2025-12-31', '2024-12-31', '2023-12-31')
+        self.balance_sheet = make_statement('2025-12-31', '2024-12-31')
+        self.cashflow = pd.DataFrame()
+
+
+def test_fetch_financial_statements():
+    statements = fetch_financial_statements(StatementTicker())
+    assert list(statements) == ['Income Statement', 'Balance Sheet', 'Cash Flow']
+    assert statements['Cash Flow'].empty
+
+
+def test_cache_valid_until_next_filing_due(tmp_path):
+    statements = fetch_financial_statements(StatementTicker())
+    cache = FinancialStatementsCache(tmp_path)
+    cache.put('aapl', statements, now=pd.Timestamp('2026-03-01'))
+    # Next annual period ends 2026-12-31, filed within 90 days
+    assert cache.get('AAPL', now=pd.Timestamp('2027-03-30')) is not None
+    assert cache.get('AAPL', now=pd.Timestamp('2027-04-01')) is None
+    # A fresh cache instance reads the persisted entry
+    reloaded = FinancialStatementsCache(tmp_path).get('AAPL', now=pd.Timestamp('2026-06-01'))
+    assert reloaded['Income Statement'].equals(statements['Income Statement'])
+
+
+def test_overdue_filing_is_rechecked_daily(tmp_path):
+    statements = fetch_financial_statements(StatementTicker())
+    cache = FinancialStatementsCache(tmp_path)
+    cache.put('AAPL', statements, now=pd.Timestamp('2027-05-01'))
+    assert cache.get('AAPL', now=pd.Timestamp('2027-05-01 12:00')) is not None
+    assert cache.get('AAPL', now=pd.Timestamp('2027-05-02 00:01')) is None
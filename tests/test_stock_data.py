@@ -1,4 +1,5 @@
 import pandas as pd
+import numpy as np
 import pytest
 from app.stock.stock_data import StockAnalyzer, get_alpha_vantage_data
 
@@ -42,6 +43,119 @@ def test_get_alpha_vantage_data(monkeypatch):
             self._json = json_data
         def json(self):
             return self._json
-    monkeypatch.setattr('requests.get', lambda url: DummyResponse({'MarketCapitalization': '1000'}))
+        def raise_for_status(self):
+            pass
+    calls = []
+    def fake_get(self, url, params=None, timeout=None):
+        calls.append(params)
+        return DummyResponse({'MarketCapitalization': '1000'})
+    monkeypatch.setattr('requests.Session.get', fake_get)
     data = get_alpha_vantage_data('TEST', 'key')
     assert data['Market Cap'] == '1000'
+    # The second lookup is served from the on-disk cache
+    assert get_alpha_vantage_data('TEST', 'key') == data
+    assert calls == [{'function': 'OVERVIEW', 'symbol': 'TEST', 'apikey': 'key'}]
+
+
+class HistoryTicker(DummyTicker):
+    def __init__(self, rows):
+        rng = np.random.default_rng(rows)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, rows)))
+        self.hist = pd.DataFrame({
+            'Open': close,
+            'High': close * 1.01,
+            'Low': close * 0.99,
+            'Close': close,
+            'Volume': rng.integers(1000, 5000, rows),
+        }, index=pd.bdate_range(end=pd.Timestamp.now().normalize(), periods=rows, name='Date'))
+    def history(self, *args, **kwargs):
+        return self.hist.copy()
+
+
+@pytest.mark.parametrize('rows', [260, 30, 15])
+def test_latest_only_matches_full_indicators(monkeypatch, rows):
+    ticker = HistoryTicker(rows)
+    monkeypatch.setattr('yfinance.Ticker', lambda symbol: ticker)
+    analyzer = StockAnalyzer('TEST')
+    full, full_hist = analyzer.calculate_technical_indicators()
+    latest, hist = analyzer.calculate_technical_indicators(latest_only=True)
+    assert latest == full
+    assert 'SMA_20' in full_hist.columns
+    assert 'SMA_20' not in hist.columns
+
+
+def test_calculate_requested_indicators_only(monkeypatch):
+    ticker = HistoryTicker(60)
+    monkeypatch.setattr('yfinance.Ticker', lambda symbol: ticker)
+    analyzer = StockAnalyzer('TEST')
+    technical, hist = analyzer.calculate_technical_indicators(indicators=['RSI', 'MACD', 'OBV'])
+    assert {'RSI', 'MACD', 'OBV'} <= set(hist.columns)
+    assert 'SMA_20' not in hist.columns
+    assert 'RSI' in technical and 'OBV' in technical
+    assert 'SMA 20' not in technical
+
+
+def test_financial_statements_cached(monkeypatch):
+    class StatementTicker(DummyTicker):
+        fetches = 0
+        @property
+        def financials(self):
+            StatementTicker.fetches += 1
+            return pd.DataFrame({pd.Timestamp.now().normalize(): [1.0]}, index=['Net Income'])
+    monkeypatch.setattr('yfinance.Ticker', lambda symbol: StatementTicker())
+    first = StockAnalyzer('TEST').get_financial_statements()
+    second = StockAnalyzer('TEST').get_financial_statements()
+    assert list(first) == ['Income Statement']
+    assert second['Income Statement'].equals(first['Income Statement'])
+    assert StatementTicker.fetches == 1
+
+
+def test_empty_financial_statements_not_cached(monkeypatch):
+    class EmptyTicker(DummyTicker):
+        fetches = 0
+        @property
+        def financials(self):
+            EmptyTicker.fetches += 1
+            return pd.DataFrame()
+    monkeypatch.setattr('yfinance.Ticker', lambda symbol: EmptyTicker())
+    assert StockAnalyzer('TEST').get_financial_statements() == {}
+    assert StockAnalyzer('TEST').get_financial_statements() == {}
+    assert EmptyTicker.fetches == 2
+
+
+def test_generate_report_async_fetches_concurrently(monkeypatch):
+    import asyncio
+    import threading
+
+    # Each fetch waits for one that only overlaps it when they run concurrently
+    started = {name: threading.Event() for name in ['info', 'statements', 'news']}
+    overlapped = []
+
+    class SlowTicker(HistoryTicker):
+        @property
+        def info(self):
+            started['info'].set()
+            overlapped.append(started['statements'].wait(5))
+            return {'longName': 'Test Corp', 'trailingPE': 12.5}
+        @property
+        def financials(self):
+            started['statements'].set()
+            return pd.DataFrame()
+        def history(self, *args, **kwargs):
+            overlapped.append(started['news'].wait(5))
+            return super().history()
+
+    def slow_news(symbol, company_name=None):
+        started['news'].set()
+        return pd.DataFrame({'title': [f'{company_name} news'], 'summary': ['']})
+
+    ticker = SlowTicker(60)
+    monkeypatch.setattr('yfinance.Ticker', lambda symbol: ticker)
+    monkeypatch.setattr('app.stock.stock_data.get_news', slow_news)
+    report = asyncio.run(StockAnalyzer('SLOW').generate_report_async(latest_only=True))
+    assert report['basic_info']['Company Name'] == 'Test Corp'
+    assert report['fundamental_data']['P/E Ratio'] == 12.5
+    assert report['technical_data']['Current Price'] > 0
+    # News needs the name from info; statements run alongside info, history alongside both
+    assert report['news']['title'].tolist() == ['Test Corp news']
+    assert overlapped == [True, True]
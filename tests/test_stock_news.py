@@ -1,4 +1,5 @@
 import pandas as pd
+import pytest
 from app.stock.stock_news import StockNewsExtractor
 
 
@@ -19,3 +20,58 @@ def test_get_news_summary():
     summary = extractor.get_news_summary(df)
     assert summary['total_articles'] == 3
     assert summary['sources']['Yahoo'] == 2
+
+
+def test_comprehensive_news_fetches_sources_concurrently(monkeypatch):
+    import threading
+    extractor = StockNewsExtractor()
+    # Every source waits for all the others, so the fetches only pass if they overlap
+    barrier = threading.Barrier(5, timeout=5)
+    def source(name):
+        def fetch(symbol, *args):
+            barrier.wait()
+            return [{'title': f'{name} headline', 'summary': '', 'published': '2024-01-01', 'source': name},
+                    {'title': 'Shared headline', 'summary': '', 'published': '2024-01-02', 'source': name}]
+        return fetch
+    for name in ['yahoo_finance', 'finviz', 'marketwatch', 'google', 'seeking_alpha']:
+        monkeypatch.setattr(extractor, f'get_{name}_news', source(name))
+
+    df = extractor.get_comprehensive_news('AAPL', company_name='Apple Inc', sources='free')
+    assert not barrier.broken
+    assert len(df) == 6
+    # Duplicates keep the copy from the earliest source in the list
+    assert df[df['title'] == 'Shared headline']['source'].tolist() == ['yahoo_finance']
+
+
+FINVIZ_PAGE = b'''<html><body><table class="snapshot-table2"><tr><td><a href="/x">Not news</a></td></tr></table>
+<table width="100%" class="fullview-news-outer news-table" id="news-table">
+<tr><td width="130" align="right">Jan-02-24 09:30AM</td><td align="left"><div class="news-link-left">
+<a class="tab-link-news" href="https://example.com/1">Apple beats &amp; raises</a></div>
+<div class="news-link-right"><span style="color:#666666">(Reuters)</span></div></td></tr>
+<tr><td width="130" align="right">08:15AM</td><td align="left"><a href="https://example.com/2">Apple shares fall</a></td></tr>
+</table><div><a href="/footer">Footer</a></div></body></html>'''
+
+SEEKING_ALPHA_PAGE = b'''<html><body><nav><a href="/menu">Menu</a></nav>
+<article><a data-test="article-title" href="/news/1">Apple upgrade</a><p>Analyst turns bullish</p><time>Jan 2</time></article>
+<article><h3>Untitled link</h3></article></body></html>'''
+
+
+@pytest.mark.parametrize('parser', ['lxml', 'html.parser'])
+def test_scrapers_parse_only_news_containers(monkeypatch, parser):
+    from app.stock import stock_news
+    if parser == 'lxml':
+        pytest.importorskip('lxml')
+    monkeypatch.setattr(stock_news, 'HTML_PARSER', parser)
+    extractor = StockNewsExtractor()
+
+    finviz = extractor._parse_finviz(FINVIZ_PAGE, 'AAPL')
+    assert [(n['title'], n['published'], n['source']) for n in finviz] == [
+        ('Apple beats & raises', 'Jan-02-24 09:30AM', '(Reuters)'),
+        ('Apple shares fall', 'Jan-02-24 08:15AM', 'Finviz'),
+    ]
+
+    articles = extractor._parse_seeking_alpha(SEEKING_ALPHA_PAGE, 'AAPL')
+    assert articles[0] == {'title': 'Apple upgrade', 'summary': 'Analyst turns bullish',
+                           'url': 'https://seekingalpha.com/news/1', 'published': 'Jan 2',
+                           'source': 'Seeking Alpha', 'symbol': 'AAPL', 'extraction_method': 'Seeking Alpha Scraping'}
+    assert [a['title'] for a in articles] == ['Apple upgrade', 'Untitled link']
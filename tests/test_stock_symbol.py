@@ -33,3 +33,173 @@ def test_validate_symbol(monkeypatch):
     monkeypatch.setattr('yfinance.Ticker', lambda sym: DummyTicker(False))
     data = validate_symbol('XXXX')
     assert not data['valid']
+
+
+def test_search_yfinance_ticker_probes_each_symbol_once(monkeypatch):
+    import threading
+    probes = []
+    lock = threading.Lock()
+
+    class ProbeTicker:
+        def __init__(self, symbol):
+            with lock:
+                probes.append(symbol)
+            self.info = {'longName': 'Acme Widgets Inc'} if symbol == 'ACME' else {}
+
+    monkeypatch.setattr('yfinance.Ticker', ProbeTicker)
+    finder = StockSymbolFinder()
+    results = finder.search_yfinance_ticker('Acme Widgets', stop_score=101)
+    assert [r['symbol'] for r in results] == ['ACME']
+    assert len(probes) == len(set(probes))
+
+    # Known-missing symbols are not probed again
+    probes.clear()
+    finder.search_yfinance_ticker('Acme Widgets', stop_score=101)
+    assert probes == []
+
+
+def test_search_yfinance_ticker_stops_on_confident_match(monkeypatch):
+    import threading
+    # Other probes are held until the search returns; waiting for them would time them out
+    release = threading.Event()
+    outcomes = []
+
+    class SlowTicker:
+        def __init__(self, symbol):
+            self.symbol = symbol
+        @property
+        def info(self):
+            if self.symbol != 'ACME':
+                outcomes.append(release.wait(5))
+            return {'longName': 'Acme' if self.symbol == 'ACME' else 'Other Co'}
+
+    monkeypatch.setattr('yfinance.Ticker', SlowTicker)
+    results = StockSymbolFinder().search_yfinance_ticker('Acme')
+    release.set()
+    assert results[0]['symbol'] == 'ACME'
+    assert False not in outcomes
+
+
+def test_find_symbol_exits_once_confident(monkeypatch):
+    import threading
+    finder = StockSymbolFinder()
+    monkeypatch.setattr(finder, 'search_yahoo_finance',
+                        lambda name, **kwargs: [{'symbol': 'AAPL', 'name': 'Apple Inc', 'source': 'Yahoo Finance'}])
+    # Slow sources are held until find_symbol returns; waiting for them would time them out
+    release = threading.Event()
+    outcomes = []
+    def slow_source(*args, **kwargs):
+        outcomes.append(release.wait(5))
+        return [{'symbol': 'APLE', 'name': 'Apple Hospitality', 'source': 'slow'}]
+    monkeypatch.setattr(finder, 'search_yfinance_ticker', slow_source)
+    monkeypatch.setattr(finder, 'search_finnhub', slow_source)
+
+    results = finder.find_symbol('Apple Inc', finnhub_key='key')
+    release.set()
+    assert [r['symbol'] for r in results] == ['AAPL']
+    assert False not in outcomes
+
+    # Without early exit every source is merged
+    results = finder.find_symbol('Apple Inc', finnhub_key='key', confidence=None)
+    assert [r['symbol'] for r in results] == ['AAPL', 'APLE']
+
+
+def test_batch_search_runs_concurrently_and_reuses_caches(monkeypatch):
+    import asyncio
+    import threading
+    from app.stock import stock_symbol
+    from app.stock.symbol_memo import get_symbol_memo
+    get_symbol_memo().put('Remembered Co', 'REM')
+    get_symbol_memo().put('Missing Co', '')
+    calls = []
+    # The three network searches only pass the barrier when they run at the same time
+    barrier = threading.Barrier(3, timeout=5)
+    def search_symbol_sources(company_name, **kwargs):
+        calls.append(company_name)
+        barrier.wait()
+        return [{'symbol': company_name[:4].upper(), 'name': company_name, 'match_score': 100}], True
+    finder = StockSymbolFinder()
+    monkeypatch.setattr(finder, 'search_symbol_sources', search_symbol_sources)
+
+    names = ['Alpha One', 'Beta Two', 'Remembered Co', 'Gamma Three', 'alpha one', 'Missing Co']
+    results = stock_symbol.batch_search_symbols(names, finder, max_concurrency=4)
+    assert not barrier.broken
+    assert list(results) == names
+    assert results['alpha one'][0]['symbol'] == 'ALPH'
+    assert results['Remembered Co'][0]['symbol'] == 'REM'
+    assert results['Missing Co'] == []
+    assert sorted(calls) == ['Alpha One', 'Beta Two', 'Gamma Three']
+    assert get_symbol_memo().get('Beta Two') == 'BETA'
+
+    # Cached names stream out before any network search finishes
+    async def first():
+        async for name, _ in stock_symbol.batch_search_symbols_async(['Zeta Four', 'Remembered Co'], finder):
+            return name
+    assert asyncio.run(first()) == 'Remembered Co'
+
+
+
+def test_outage_is_not_remembered_as_unknown_name(monkeypatch):
+    from app.stock import stock_symbol
+    from app.stock.symbol_memo import get_symbol_memo
+    finder = StockSymbolFinder()
+    def outage(*args, **kwargs):
+        raise ConnectionError('offline')
+    monkeypatch.setattr('yfinance.Ticker', outage)
+    assert finder.search_yfinance_ticker('Nowhere Co') == []
+    with pytest.raises(ConnectionError):
+        finder.search_yfinance_ticker('Nowhere Co', raise_errors=True)
+
+    for source in ['search_yahoo_finance', 'search_yfinance_ticker']:
+        monkeypatch.setattr(finder, source, outage)
+    monkeypatch.setattr(stock_symbol, '_symbol_finder', finder)
+
+    assert finder.search_symbol_sources('Nowhere Co') == ([], False)
+    assert stock_symbol.quick_symbol_lookup('Nowhere Co') == ''
+    assert get_symbol_memo().get('Nowhere Co') is None
+
+    # One source answering with nothing is a real miss
+    monkeypatch.setattr(finder, 'search_yahoo_finance', lambda name, **kwargs: [])
+    assert stock_symbol.quick_symbol_lookup('Nowhere Co') == ''
+    assert get_symbol_memo().get('Nowhere Co') == ''
+
+
+def test_validate_symbols_batches_and_caches(monkeypatch):
+    from app.stock import stock_symbol
+    from app.stock.ticker_cache import get_snapshot_cache
+    requests_sent = []
+    def fetch_quotes(symbols):
+        requests_sent.append(list(symbols))
+        return {s: {'symbol': s, 'longName': f'{s} Inc', 'exchange': 'NMS'} for s in symbols if s != 'XXXX'}
+    monkeypatch.setattr(stock_symbol, '_fetch_quotes', fetch_quotes)
+    get_snapshot_cache().put('MSFT', {'longName': 'Microsoft', 'sector': 'Technology'})
+
+    results = stock_symbol.validate_symbols(['aapl', 'MSFT', 'XXXX', 'GOOG', 'NVDA', 'AAPL'], batch_size=2)
+    assert requests_sent == [['AAPL', 'XXXX'], ['GOOG', 'NVDA']]
+    assert results['aapl'] == {'symbol': 'AAPL', 'name': 'AAPL Inc', 'sector': '', 'industry': '',
+                               'exchange': 'NMS', 'valid': True}
+    assert results['MSFT']['sector'] == 'Technology'
+    assert results['XXXX'] == {'valid': False}
+
+    # Everything is answered from the cache the second time
+    assert stock_symbol.validate_symbols(['AAPL', 'XXXX', 'NVDA']) == {
+        key: results[key] for key in ['AAPL', 'XXXX', 'NVDA']}
+    assert len(requests_sent) == 2
+
+    # Bulk misses stay out of the shared negative set and expire quickly
+    cache = get_snapshot_cache()
+    assert not cache.is_missing('XXXX')
+    cache._quotes['XXXX'].fetched_at -= cache.quote_miss_ttl
+    stock_symbol.validate_symbols(['XXXX', 'AAPL'])
+    assert requests_sent[2:] == [['XXXX']]
+
+
+def test_validate_symbols_falls_back_per_symbol(monkeypatch):
+    from app.stock import stock_symbol
+    def fail(symbols):
+        raise RuntimeError('quote endpoint unavailable')
+    monkeypatch.setattr(stock_symbol, '_fetch_quotes', fail)
+    monkeypatch.setattr('yfinance.Ticker', lambda sym: DummyTicker(sym == 'AAPL'))
+    results = stock_symbol.validate_symbols(['AAPL', 'ZZZZ'])
+    assert results['AAPL']['sector'] == 'Tech'
+    assert not results['ZZZZ']['valid']
@@ -0,0 +1,31 @@
+from app.stock import stock_symbol
+from app.stock.symbol_memo import SymbolMemo
+
+
+def test_memo_persists_with_ttl(tmp_path):
+    memo = SymbolMemo(tmp_path / 'symbols.sqlite', ttl=100, negative_ttl=10)
+    memo.put('Apple Inc.', 'AAPL', now=1000)
+    memo.put('Nonexistent Co', '', now=1000)
+
+    reopened = SymbolMemo(tmp_path / 'symbols.sqlite', ttl=100, negative_ttl=10)
+    assert reopened.get('apple inc', now=1050) == 'AAPL'
+    assert reopened.get('Nonexistent Co', now=1005) == ''
+    assert reopened.get('Nonexistent Co', now=1011) is None
+    assert reopened.get('Apple Inc.', now=1101) is None
+    assert reopened.get('Microsoft', now=1000) is None
+
+
+def test_quick_lookup_resolves_each_name_once(monkeypatch):
+    calls = []
+    def search_symbol_sources(self, company_name, **kwargs):
+        calls.append(company_name)
+        if company_name == 'Apple':
+            return [{'symbol': 'AAPL', 'name': 'Apple Inc.', 'match_score': 90}], True
+        return [], True
+    monkeypatch.setattr(stock_symbol.StockSymbolFinder, 'search_symbol_sources', search_symbol_sources)
+    assert stock_symbol.quick_symbol_lookup('Apple') == 'AAPL'
+    assert stock_symbol.quick_symbol_lookup('apple') == 'AAPL'
+    assert stock_symbol.quick_symbol_lookup('Zzyzx Holdings') == ''
+    assert stock_symbol.quick_symbol_lookup('Zzyzx Holdings') == ''
+    assert calls == ['Apple', 'Zzyzx Holdings']
+    assert stock_symbol.get_symbol_finder() is stock_symbol.get_symbol_finder()
@@ -0,0 +1,71 @@
+from app.stock.ticker_cache import TickerSnapshotCache
+
+
+class CountingTicker:
+    calls = 0
+
+    def __init__(self, symbol):
+        self.symbol = symbol
+
+    @property
+    def info(self):
+        CountingTicker.calls += 1
+        return {'longName': f'{self.symbol} Inc'}
+
+
+def test_snapshot_fetched_once(monkeypatch):
+    CountingTicker.calls = 0
+    monkeypatch.setattr('yfinance.Ticker', CountingTicker)
+    cache = TickerSnapshotCache()
+    assert cache.get('aapl').info['longName'] == 'AAPL Inc'
+    assert cache.get('AAPL').info['longName'] == 'AAPL Inc'
+    assert CountingTicker.calls == 1
+
+
+def test_snapshot_expires_after_ttl(monkeypatch):
+    CountingTicker.calls = 0
+    monkeypatch.setattr('yfinance.Ticker', CountingTicker)
+    cache = TickerSnapshotCache(ttl=60)
+    cache.get('AAPL').fetched_at -= 61
+    cache.get('AAPL')
+    assert CountingTicker.calls == 2
+
+
+def test_lru_eviction(monkeypatch):
+    monkeypatch.setattr('yfinance.Ticker', CountingTicker)
+    cache = TickerSnapshotCache(maxsize=2)
+    cache.get('AAPL')
+    cache.get('MSFT')
+    cache.get('AAPL')
+    cache.get('TSLA')
+    assert 'AAPL' in cache
+    assert 'MSFT' not in cache
+    assert len(cache) == 2
+
+
+def test_nameless_info_is_not_cached(monkeypatch):
+    class MissingTicker(CountingTicker):
+        @property
+        def info(self):
+            CountingTicker.calls += 1
+            return {'trailingPegRatio': None}
+    CountingTicker.calls = 0
+    monkeypatch.setattr('yfinance.Ticker', MissingTicker)
+    cache = TickerSnapshotCache(negative_ttl=60)
+    assert cache.get('NOPE').info == {'trailingPegRatio': None}
+    assert cache.get('NOPE').info == {'trailingPegRatio': None}
+    assert CountingTicker.calls == 2
+    assert 'NOPE' not in cache and not cache.is_missing('NOPE')
+
+
+def test_probe_marks_expire(monkeypatch):
+    CountingTicker.calls = 0
+    monkeypatch.setattr('yfinance.Ticker', CountingTicker)
+    cache = TickerSnapshotCache(negative_ttl=60)
+    cache.mark_missing('nope')
+    assert cache.is_missing('NOPE')
+    # Marks only steer symbol probes; get still fetches
+    cache.get('NOPE')
+    assert CountingTicker.calls == 1
+    cache._missing['NOPE'] -= 61
+    assert not cache.is_missing('NOPE')
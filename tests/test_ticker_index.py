@@ -0,0 +1,57 @@
+import pandas as pd
+from app.stock import stock_symbol
+from app.stock.ticker_index import TickerIndex, get_ticker_index
+
+
+MASTER = pd.DataFrame({
+    'Symbol': ['AAPL', 'MSFT', 'TATAMOTORS.NS', 'APLE', 'GOOGL'],
+    'Name': ['Apple Inc.', 'Microsoft Corporation', 'Tata Motors Limited',
+             'Apple Hospitality REIT, Inc.', 'Alphabet Inc.'],
+    'Exchange': ['NMS', 'NMS', 'NSI', 'NYQ', 'NMS'],
+    'Aliases': ['', 'MSFT.MX', 'TATAMOTORS.BO|Tata Motors', '', 'Google|GOOG'],
+})
+
+
+def test_search_ranks_names_and_aliases():
+    index = TickerIndex(MASTER.rename(columns=str.lower))
+    assert index.search('Microsoft Corp')[0]['symbol'] == 'MSFT'
+    assert index.search('Tata Motors')[0]['symbol'] == 'TATAMOTORS.NS'
+    assert index.search('Google')[0]['symbol'] == 'GOOGL'
+    assert index.search('tatamotors')[0]['symbol'] == 'TATAMOTORS.NS'
+    assert index.search('GOOG')[0]['match_score'] == 100
+    assert index.search('Zzyzx Holdings') == []
+
+
+def test_candidates_are_pruned_before_scoring():
+    index = TickerIndex(MASTER.rename(columns=str.lower))
+    entries = index.candidates('apple inc', max_candidates=2)
+    assert len(entries) == 2
+    assert {index._entry_names[e] for e in entries} == {'apple inc', 'apple hospitality reit inc'}
+
+
+def test_quick_lookup_uses_master_file_before_network(tmp_path, monkeypatch):
+    path = tmp_path / 'tickers.csv'
+    MASTER.to_csv(path, index=False)
+    monkeypatch.setenv('STOCK_AGENT_TICKER_MASTER', str(path))
+    monkeypatch.setattr('app.stock.ticker_index._ticker_index', None)
+    assert len(get_ticker_index()) == 5
+
+    def no_network(*args, **kwargs):
+        raise AssertionError('network source used')
+    monkeypatch.setattr(stock_symbol.StockSymbolFinder, 'search_symbol_sources', no_network)
+    assert stock_symbol.quick_symbol_lookup('Apple Inc') == 'AAPL'
+
+
+def test_unreadable_master_gives_empty_index(tmp_path, monkeypatch):
+    (tmp_path / 'tickers.parquet').write_bytes(b'PAR1')
+    monkeypatch.setattr('app.stock.ticker_index._ticker_index', None)
+    def no_engine(*args, **kwargs):
+        raise ImportError('Unable to find a usable engine')
+    monkeypatch.setattr(pd, 'read_parquet', no_engine)
+    assert len(get_ticker_index()) == 0
+    # The empty index is kept, so the master is not read again
+    monkeypatch.setattr(pd, 'read_parquet', None)
+    assert len(get_ticker_index()) == 0
+    monkeypatch.setattr(stock_symbol.StockSymbolFinder, 'search_symbol_sources',
+                        lambda self, name: ([{'symbol': 'AAPL', 'match_score': 90}], True))
+    assert stock_symbol.quick_symbol_lookup('Apple Inc') == 'AAPL'
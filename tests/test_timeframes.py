@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+import pytest
+from app.stock.timeframes import resample_bars, multi_timeframe_indicators, source_interval
+
+
+def make_intraday(days=30, seed=0):
+    """Half-hour bars from 9:30 to 15:30 New York time on business days"""
+    sessions = pd.bdate_range('2024-03-01', periods=days)
+    index = pd.DatetimeIndex([day + pd.Timedelta(hours=9, minutes=30) + pd.Timedelta(minutes=30 * i)
+                              for day in sessions for i in range(13)]).tz_localize('America/New_York')
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.003, len(index))))
+    return pd.DataFrame({'Open': close * 0.999, 'High': close * 1.002, 'Low': close * 0.997,
+                         'Close': close, 'Volume': rng.integers(1000, 5000, len(index))}, index=index)
+
+
+@pytest.mark.parametrize('timeframe,rule', [('1d', 'D'), ('1w', 'W-MON')])
+def test_resample_matches_pandas(timeframe, rule):
+    hist = make_intraday()
+    bars = resample_bars(hist, timeframe)
+    label = {'closed': 'left', 'label': 'left'} if timeframe == '1w' else {}
+    expected = hist.resample(rule, **label).agg({'Open': 'first', 'High': 'max', 'Low': 'min',
+                                                 'Close': 'last', 'Volume': 'sum'}).dropna()
+    pd.testing.assert_frame_equal(bars, expected, check_freq=False, check_dtype=False, check_names=False)
+
+
+def test_hourly_buckets_anchor_on_session_open():
+    hist = make_intraday(days=2)
+    bars = resample_bars(hist, '1h')
+    assert [t.strftime('%H:%M') for t in bars.index[:7]] == ['09:30', '10:30', '11:30', '12:30',
+                                                            '13:30', '14:30', '15:30']
+    assert bars['Volume'].iloc[0] == hist['Volume'].iloc[:2].sum()
+    assert bars['Close'].iloc[-1] == hist['Close'].iloc[-1]
+
+
+def test_multi_timeframe_from_single_series():
+    hist = make_intraday(days=60)
+    results = multi_timeframe_indicators(hist, ['1h', '1d', '1w'])
+    assert set(results) == {'1h', '1d', '1w'}
+    close = hist['Close'].iloc[-1]
+    assert all(data['Current Price'] == round(close, 2) for data in results.values())
+    daily_close = hist['Close'].groupby(hist.index.date).last()
+    assert results['1d']['SMA 20'] == round(daily_close.iloc[-20:].mean(), 2)
+    assert source_interval(['1w', '1h']) == ('60m', '730d')
+    with pytest.raises(ValueError):
+        source_interval(['2h'])
+
+
+def test_analyzer_fetches_finest_interval_once(monkeypatch):
+    from app.stock.stock_data import StockAnalyzer
+
+    calls = []
+    class IntradayTicker:
+        def history(self, **kwargs):
+            calls.append(kwargs)
+            return make_intraday(days=60)
+    monkeypatch.setattr('yfinance.Ticker', lambda symbol: IntradayTicker())
+    results = StockAnalyzer('TEST').calculate_multi_timeframe_indicators(['1h', '1d', '1w'])
+    assert calls == [{'period': '730d', 'interval': '60m'}]
+    assert results['1w']['Current Price'] == results['1h']['Current Price']
+
+
+def test_52_week_range_ignores_older_bars():
+    hist = make_intraday(days=400)
+    hist.loc[hist.index[0], 'High'] = 1e6
+    results = multi_timeframe_indicators(hist, ['1d', '1w'])
+    year = hist[hist.index > hist.index[-1] - pd.Timedelta(weeks=52)]
+    for data in results.values():
+        assert data['52 Week High'] == round(year['High'].max(), 2) < 1e6
+        assert data['52 Week Low'] == round(year['Low'].min(), 2)
+
+
+def test_report_builds_daily_timeframes_without_intraday_fetch(monkeypatch):
+    import asyncio
+    from app.stock.stock_data import StockAnalyzer
+
+    calls = []
+    daily = resample_bars(make_intraday(days=260), '1d')
+    # Recent dates, so the price store's one-year window keeps every bar
+    daily.index = pd.bdate_range(end=pd.Timestamp.now().normalize(), periods=len(daily), tz='America/New_York')
+    class DailyTicker:
+        info = {'longName': 'Test Corp'}
+        financials = balance_sheet = cashflow = pd.DataFrame()
+        def history(self, **kwargs):
+            calls.append(kwargs)
+            return daily if kwargs.get('interval', '1d') == '1d' else make_intraday(days=60)
+    monkeypatch.setattr('yfinance.Ticker', lambda symbol: DailyTicker())
+    analyzer = StockAnalyzer('TEST')
+    report = asyncio.run(analyzer.generate_report_async(latest_only=True, include_news=False,
+                                                        timeframes=['1d', '1w']))
+    assert set(report['timeframes']) == {'1d', '1w'}
+    assert report['timeframes']['1d']['SMA 20'] == report['technical_data']['SMA 20']
+    assert not any(call.get('interval') == '60m' for call in calls)
+
+    report = asyncio.run(analyzer.generate_report_async(latest_only=True, include_news=False,
+                                                        timeframes=['1h', '1d']))
+    assert list(report['timeframes']) == ['1h', '1d']
+    assert [call for call in calls if call.get('interval') == '60m'] == [{'period': '730d', 'interval': '60m'}]